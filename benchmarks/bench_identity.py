@@ -0,0 +1,71 @@
+"""Scaling of author identity resolution with the number of distinct names.
+
+Generates authors written several ways ("Ravi Kumar", "Dr. R. Kumar",
+"Kumar R.", ...) and times ``resolve_authors``; with the sorted-neighbourhood
+index the time per name stays roughly flat as the name count grows. Also
+counts the people split over several ids (an abbreviation shared by two
+people is left unmerged on purpose) and the ids shared by several people
+(someone only ever written "Naksh D." is taken for the one "Naksh Deemar").
+
+Usage: python benchmarks/bench_identity.py [--people 1000 10000 50000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+
+from tracker.identity import resolve_authors  # noqa: E402
+
+SYLLABLES = ["ra", "vi", "ku", "mar", "an", "ita", "sha", "pra", "sad", "dee", "pa", "su", "re", "sh",
+             "ja", "ya", "la", "ksh", "mi", "na", "ga", "ni", "ta", "ve", "nk", "at", "hi", "de", "vo"]
+
+
+def _word(rng):
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+
+
+def synthetic_authors(people, seed=0):
+    """``(paper_authors, person)``: a few spellings per person, 1-3 papers each."""
+    rng = random.Random(seed)
+    rows, person = [], []
+    for p in range(people):
+        first, last = _word(rng), _word(rng)
+        spellings = [f"{first} {last}", f"Dr. {first} {last}", f"{last} {first}".upper(),
+                     f"{first} {last[0]}."]
+        email = f"{first}.{last}{p}@example.org".lower() if rng.random() < 0.5 else ""
+        for _ in range(rng.randint(1, 3)):
+            rows.append({"Paper": len(rows), "Name": rng.choice(spellings), "Email": email,
+                         "Amount": 1000.0})
+            person.append(p)
+    return pd.DataFrame(rows), person
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--people", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    args = parser.parse_args()
+
+    print(f"{'people':>8} {'rows':>8} {'names':>8} {'ids':>8} {'split':>6} {'merged':>6} "
+          f"{'seconds':>8} {'us/name':>8}")
+    for n in args.people:
+        authors, person = synthetic_authors(n)
+        start = time.perf_counter()
+        resolved = resolve_authors(authors)
+        elapsed = time.perf_counter() - start
+        names = authors["Name"].nunique()
+        # People whose spellings ended up under more than one id
+        ids = pd.DataFrame({"person": person, "id": resolved["Author_Id"].astype(str)})
+        split = int((ids.groupby("person")["id"].nunique() > 1).sum())
+        merged = int((ids.groupby("id")["person"].nunique() > 1).sum())
+        print(f"{n:>8} {len(authors):>8} {names:>8} {resolved['Author_Id'].nunique():>8} {split:>6} "
+              f"{merged:>6} {elapsed:>8.2f} {elapsed / names * 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
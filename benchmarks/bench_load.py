@@ -0,0 +1,53 @@
+"""Compare the legacy per-sheet ``read_excel`` loader with the streaming reader.
+
+Usage: python benchmarks/bench_load.py [workbook.xlsx] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tracker.workbook import WORKBOOK_NAME, read_workbook  # noqa: E402
+
+
+def legacy_read(filepath):
+    # The I/O pattern load_data() used before the streaming reader: one
+    # ExcelFile to list sheets, then a fresh read_excel per relevant sheet.
+    xl = pd.ExcelFile(filepath)
+    papers = [pd.read_excel(filepath, sheet_name=s, header=None)
+              for s in xl.sheet_names if "work" in s.lower().strip()]
+    clients = pd.read_excel(filepath, sheet_name="clients details") if "clients details" in xl.sheet_names else None
+    info = next((pd.read_excel(filepath, sheet_name=s, header=None)
+                 for s in xl.sheet_names if "info" in s.lower()), None)
+    return papers, clients, info
+
+
+def best_of(fn, filepath, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(filepath)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("workbook", nargs="?", default=os.path.join(ROOT, WORKBOOK_NAME))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    legacy = best_of(legacy_read, args.workbook, args.repeat)
+    streaming = best_of(read_workbook, args.workbook, args.repeat)
+    print(f"workbook:  {args.workbook} ({os.path.getsize(args.workbook) / 1024:.0f} KB)")
+    print(f"legacy:    {legacy * 1000:8.1f} ms")
+    print(f"streaming: {streaming * 1000:8.1f} ms  ({legacy / streaming:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Memory footprint of the papers and author frames, as parsed and compacted.
+
+Prints ``memory_usage(deep=True)`` per column before and after
+``compact_papers``/``compact_authors``, to size server instances.
+
+Usage: python benchmarks/bench_memory.py [--rows 1000 10000 50000]
+"""
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_parser import synthetic_sheet  # noqa: E402
+from tracker.analytics import build_cube  # noqa: E402
+from tracker.authors import build_paper_authors, compact_authors  # noqa: E402
+from tracker.papers import compact_papers, parse_paper_frame  # noqa: E402
+from tracker.profiling import memory_report  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    args = parser.parse_args()
+
+    for n in args.rows:
+        df_papers = parse_paper_frame(synthetic_sheet(n), "Bench work")
+        paper_authors = build_paper_authors(df_papers)
+        compact = compact_papers(df_papers)
+        compact_auth = compact_authors(paper_authors)
+        # Compacting must not change a figure the dashboard shows
+        assert build_cube(compact).equals(build_cube(df_papers))
+
+        papers = memory_report(compact, baseline=df_papers)
+        authors = memory_report(compact_auth, baseline=paper_authors)
+        print(f"\n{n} papers")
+        print(papers.to_string(index=False))
+        print(authors.to_string(index=False))
+        before = papers["Bytes before"].iloc[-1] + authors["Bytes before"].iloc[-1]
+        after = papers["Bytes after"].iloc[-1] + authors["Bytes after"].iloc[-1]
+        print(f"total {before / 2**20:.1f} MB -> {after / 2**20:.1f} MB "
+              f"({(1 - after / before) * 100:.0f}% smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Parity check and benchmark: row-wise vs vectorized paper parser.
+
+Usage: python benchmarks/bench_parser.py [--rows 10000 100000] [--seed 0]
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from generate_workbook import paper_rows  # noqa: E402
+from tracker.papers import parse_paper_frame, parse_paper_sheet  # noqa: E402
+from tracker.workbook import PAPER_SHEET_WIDTH, rows_to_frame  # noqa: E402
+
+
+def synthetic_sheet(n_rows, seed=0):
+    """The raw frame the reader would produce for a generated work sheet."""
+    rows = (["" if v is None else v for v in row] for row in paper_rows(n_rows, seed))
+    return rows_to_frame(rows, width=PAPER_SHEET_WIDTH)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for n in args.rows:
+        raw = synthetic_sheet(n, args.seed)
+
+        t0 = time.perf_counter()
+        legacy = pd.DataFrame(parse_paper_sheet(raw, "Bench work "))
+        t_legacy = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        vectorized = parse_paper_frame(raw, "Bench work ")
+        t_vec = time.perf_counter() - t0
+
+        pd.testing.assert_frame_equal(vectorized, legacy)
+        print(f"{n:>8} rows  row-wise {t_legacy:7.2f} s  vectorized {t_vec:7.3f} s  "
+              f"({t_legacy / t_vec:.0f}x)  parity ok")
+
+
+if __name__ == "__main__":
+    main()
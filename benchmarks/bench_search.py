@@ -0,0 +1,53 @@
+"""Compare full-scan ``str.contains`` with the trigram search index.
+
+Usage: python benchmarks/bench_search.py [--rows 1000 10000 50000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_parser import synthetic_sheet  # noqa: E402
+from tracker.papers import parse_paper_frame  # noqa: E402
+from tracker.search import SearchIndex  # noqa: E402
+
+# One user typing a search term, one keystroke per rerun
+QUERY = "graph attention"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    args = parser.parse_args()
+
+    for n in args.rows:
+        df = parse_paper_frame(synthetic_sheet(n), "Bench work")
+        col = df["Title"]
+        keystrokes = [QUERY[:i] for i in range(1, len(QUERY) + 1)]
+
+        t0 = time.perf_counter()
+        for q in keystrokes:
+            expected = col.str.contains(q, case=False, na=False).to_numpy()
+        t_scan = (time.perf_counter() - t0) / len(keystrokes)
+
+        index = SearchIndex(df)
+        t0 = time.perf_counter()
+        index.mask("Title", "warm")
+        t_build = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for q in keystrokes:
+            got = index.mask("Title", q)
+        t_index = (time.perf_counter() - t0) / len(keystrokes)
+
+        assert np.array_equal(got, expected)
+        print(f"{n:>7} papers  scan {t_scan * 1000:7.2f} ms/keystroke  "
+              f"index {t_index * 1000:7.2f} ms/keystroke  (build {t_build * 1000:.0f} ms, once)")
+
+
+if __name__ == "__main__":
+    main()
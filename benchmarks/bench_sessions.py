@@ -0,0 +1,74 @@
+"""Process memory as concurrent dashboard sessions are added.
+
+Opens N headless sessions (Streamlit's AppTest) in one process against the
+same workbook, gives each its own filters, and keeps them all alive. The
+parsed dataset is shared by every session, so the memory each extra
+session adds should stay small and roughly constant.
+
+Usage: python benchmarks/bench_sessions.py [--rows 20000] [--sessions 1 2 4 8 16]
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from generate_workbook import write_workbook  # noqa: E402
+
+# Each session searches for something different, so none shares a selection
+SEARCHES = ["ku", "sh", "ra", "an", "de", "pr", "vi", "su"]
+
+
+def rss_bytes():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def open_session(i):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, "dashboard.py"), default_timeout=600)
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    at.text_input[0].set_value(SEARCHES[i % len(SEARCHES)]).run()
+    statuses = at.multiselect[1]
+    statuses.set_value(statuses.value[i % len(statuses.value):] or statuses.value).run()
+    return at
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--workbook", help="existing workbook instead of a synthetic one")
+    args = parser.parse_args()
+
+    path = args.workbook
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(prefix="tracker-bench-"), "bench.xlsx")
+        write_workbook(path, args.rows)
+    os.environ["TRACKER_WORKBOOK"] = path
+
+    tracemalloc.start()
+    sessions = [open_session(0)]
+    gc.collect()
+    base_rss, base_traced = rss_bytes(), tracemalloc.get_traced_memory()[0]
+    print(f"first session: RSS {base_rss / 2**20:.0f} MB (dataset loaded)")
+    for n in sorted(args.sessions):
+        while len(sessions) < n:
+            sessions.append(open_session(len(sessions)))
+        gc.collect()
+        rss, traced = rss_bytes(), tracemalloc.get_traced_memory()[0]
+        extra = max(n - 1, 1)
+        print(f"{n:>3} sessions: RSS {rss / 2**20:6.0f} MB  "
+              f"per extra session: RSS {(rss - base_rss) / extra / 2**20:5.1f} MB, "
+              f"Python heap {(traced - base_traced) / extra / 2**20:5.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Write synthetic tracker workbooks in the layout the dashboard parses.
+
+Paper sheets follow the real tracker: three header rows, S.No in column B,
+the title in C, five (name, amount, email) author triplets in D..R, the
+total in S, five payments in T..X, total paid in Y, balance in Z and the
+paper status in AA. Cell values include the messy entries seen in the real
+file ("45,000", "Nill", "-", "Not Available", blank S.No rows, ...).
+
+Usage: python benchmarks/generate_workbook.py OUT.xlsx --rows 10000 [--sheets 2]
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import openpyxl
+
+NAMES = ["Parthasarathy", "R. Kumar", "Divya VK", "Prasad", "Shiva", "Deepa",
+         "Not Available", "can add", "-", None, None]
+AMOUNTS = [0, 15000, 40000, "45,000", "Nill", "-", " 10000 ", "abc", None, None]
+EMAILS = ["a@x.edu", "b@y.org", None]
+TITLE_WORDS = ("graph attention network fuzzy convolutional ensemble learning brain tumour "
+               "classification explainable optimization turmeric multi-objective failure "
+               "detection xgboost features estimation coefficient bi-univalent mri spectral "
+               "deep federated privacy secure blockchain iot edge transformer hybrid novel "
+               "framework analysis prediction maintenance industrial medical diagnosis").split()
+STATUSES = ["Published", "Accepted , in\nIJIT", "Communicated to Riya", "Under Review",
+            "Rejected", "Draft", None]
+
+HEADER_ROWS = [
+    [None] * 27,
+    [None, None, None, "Author1 ", None, None, "Author2", None, None, "Author 3", None, None,
+     "Author 4", None, None, "Author 5", None, None, "Total", "to Riya", None, None, None, None,
+     None, "Balance", "Paper Status "],
+    [None, "S.No", "Title ", "Name", "Amount", "email id", "Name", "Amount", "email id",
+     "Name", "Amount", "Email id", "Name", "Amount", "Email id", "Name", "Amount", "Email id",
+     None, "1st Payment", "2nd Payment", "3rd Payment ", "4th Payment", "5th Payment", "Total",
+     None, None],
+]
+
+INFO_TEXT = [
+    "Sci writing with implementation and publication\nTotal 60k\nInitially you have to pay 15k",
+    "Scopus writing with implementation and publication\nTotal 50k\nInitially you have to pay 10k",
+]
+
+
+def paper_rows(n_rows, seed=0, chunk=50_000):
+    """Yield the header rows, then ``n_rows`` paper rows as lists."""
+    yield from (list(r) for r in HEADER_ROWS)
+    rng = np.random.default_rng(seed)
+    words = np.array(TITLE_WORDS, dtype=object)
+    for offset in range(0, n_rows, chunk):
+        n = min(chunk, n_rows - offset)
+
+        def pick(values):
+            return np.array(values, dtype=object)[rng.integers(0, len(values), n)]
+
+        sno = np.arange(offset + 1, offset + n + 1).astype(object)
+        sno[rng.random(n) < 0.02] = None
+        sno[rng.random(n) < 0.01] = "S.No"
+        titles = [f"  {' '.join(w).title()}  " for w in words[rng.integers(0, len(words), (n, 8))]]
+        columns = [np.full(n, None, dtype=object), sno, np.array(titles, dtype=object)]
+        for _ in range(5):
+            columns += [pick(NAMES), pick(AMOUNTS), pick(EMAILS)]
+        columns += [pick(AMOUNTS) for _ in range(18, 26)]
+        columns.append(pick(STATUSES))
+        yield from (list(r) for r in zip(*columns))
+
+
+def client_rows(n_clients, seed=0):
+    rng = np.random.default_rng(seed + 1)
+    yield ["S.No", "Name", "Paper", "Patent"]
+    for i in range(1, n_clients + 1):
+        has_paper = rng.random() < 0.3
+        yield [i, f"client {i}", 3 if has_paper else None, 3 if has_paper else None]
+
+
+def info_rows():
+    return [[None, None], [None, None], [None, INFO_TEXT[0]], [None, None], [None, INFO_TEXT[1]]]
+
+
+def write_workbook(path, n_rows, sheets=2, clients=50, seed=0):
+    """Stream a workbook with ``n_rows`` papers split over ``sheets`` work sheets."""
+    wb = openpyxl.Workbook(write_only=True)
+    per_sheet = [n_rows // sheets + (1 if i < n_rows % sheets else 0) for i in range(sheets)]
+    for i, n in enumerate(per_sheet):
+        ws = wb.create_sheet(f"Team {i + 1} work ")
+        for row in paper_rows(n, seed=seed + i):
+            ws.append(row)
+    ws = wb.create_sheet("info.about publication")
+    for row in info_rows():
+        ws.append(row)
+    ws = wb.create_sheet("clients details")
+    for row in client_rows(clients, seed):
+        ws.append(row)
+    wb.save(path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--sheets", type=int, default=2)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    write_workbook(args.out, args.rows, args.sheets, args.clients, args.seed)
+    print(f"wrote {args.out}: {args.rows} papers in {args.sheets} sheets, "
+          f"{os.path.getsize(args.out) / 1024:.0f} KB in {time.perf_counter() - t0:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""Load test: concurrent viewers of one dashboard server.
+
+Starts ``streamlit run dashboard.py`` on a local port and connects N
+simulated viewers to it over the same websocket the browser uses, each on
+its own thread. A viewer toggles entries of the Work Category and Paper
+Status multiselects and types into the two search boxes a keystroke at a
+time, pausing between interactions; every change is a rerun, timed from
+the message that asks for it until the server reports the script finished.
+
+For each number of concurrent viewers the test reports rerun latency
+percentiles and throughput, and samples the server's RSS over time, so the
+point where one process stops keeping up is visible. Everything runs on
+this machine; only Streamlit's own ``websockets`` dependency is used.
+
+Usage: python benchmarks/loadtest.py [--rows 20000] [--sessions 1 4 8 16] [--duration 60]
+"""
+import argparse
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from contextlib import ExitStack
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from generate_workbook import write_workbook  # noqa: E402
+
+# What viewers type into the search boxes, one rerun per keystroke
+AUTHOR_SEARCHES = ["kumar", "sharma", "deepa", "prasad", "ravi", "anita"]
+TITLE_SEARCHES = ["graph", "network", "learning", "medical", "blockchain", "spectral"]
+ACTIONS = {"sources": 3, "statuses": 3, "author": 2, "title": 2}
+FILTERS = {"sources": "Work Category", "statuses": "Paper Status",
+           "author": "Search Author", "title": "Search Paper Title"}
+VIEW_LABEL = "Section"
+
+
+def rss_bytes(pid):
+    with open(f"/proc/{pid}/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, timeout=120):
+    """A headless ``streamlit run`` of the dashboard, once it answers health checks."""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", os.path.join(ROOT, "dashboard.py"),
+         "--server.headless", "true", "--server.port", str(port),
+         "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"streamlit exited with status {server.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return server
+        except OSError:
+            time.sleep(0.5)
+    server.terminate()
+    raise RuntimeError(f"streamlit did not come up on port {port} within {timeout} s")
+
+
+def connect(url):
+    """A websocket to the server, as a context manager."""
+    from websockets.sync.client import connect
+
+    return connect(url, subprotocols=["streamlit"], max_size=None)
+
+
+class Viewer:
+    """One browser session on websocket ``ws``: its widgets, their values and timed reruns."""
+
+    def __init__(self, ws, seed, view=None):
+        self.ws = ws
+        self.rng = random.Random(seed)
+        self.view = view
+        self.widgets = {}  # label -> (kind, element)
+        self.values = {}  # label -> current value
+        self.latencies = []  # (finished at, seconds)
+        self.errors = 0
+        self.rerun(timed=False)
+        missing = [label for label in FILTERS.values() if label not in self.widgets]
+        if missing:
+            raise RuntimeError(f"dashboard has no {', '.join(missing)} widget (no data loaded?)")
+
+    def _state(self, label):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        kind, element = self.widgets[label]
+        value = self.values[label]
+        state = WidgetState(id=element.id)
+        if kind == "text_input":
+            state.string_value = value
+        elif kind == "multiselect":
+            # Newer Streamlit sends the chosen options, older their indices
+            if "raw_values" in element.DESCRIPTOR.fields_by_name:
+                state.string_array_value.data.extend(value)
+            else:
+                state.int_array_value.data.extend(list(element.options).index(v) for v in value)
+        elif "raw_value" in element.DESCRIPTOR.fields_by_name:
+            state.string_value = value
+        else:
+            state.int_value = list(element.options).index(value)
+        return state
+
+    def rerun(self, timed=True):
+        """Ask for a rerun with the current widget values and wait for it to finish."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.widget_states.widgets.extend(self._state(label) for label in self.values)
+        start = time.perf_counter()
+        self.ws.send(msg.SerializeToString())
+        failed = False
+        while True:
+            reply = ForwardMsg()
+            reply.ParseFromString(self.ws.recv())
+            kind = reply.WhichOneof("type")
+            if kind == "delta" and reply.delta.WhichOneof("type") == "new_element":
+                self._seen(reply.delta.new_element)
+                failed |= reply.delta.new_element.WhichOneof("type") == "exception"
+            elif kind == "script_finished":
+                failed |= reply.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR
+                break
+        end = time.perf_counter()
+        if timed:
+            self.latencies.append((end, end - start))
+            self.errors += failed
+
+    def _seen(self, element):
+        kind = element.WhichOneof("type")
+        if kind not in ("multiselect", "text_input", "radio"):
+            return
+        widget = getattr(element, kind)
+        if widget.label in self.widgets:
+            return
+        self.widgets[widget.label] = (kind, widget)
+        if kind == "multiselect":
+            self.values[widget.label] = [widget.options[i] for i in widget.default]
+        elif kind == "text_input":
+            self.values[widget.label] = widget.default
+        elif widget.label == VIEW_LABEL and self.view:
+            if self.view not in widget.options:
+                raise ValueError(f"no section {self.view!r}, expected one of {list(widget.options)}")
+            self.values[widget.label] = self.view
+
+    def _toggle(self, label):
+        # Drop an entry from the selection, or put one back; never empty it
+        options, chosen = self.widgets[label][1].options, self.values[label]
+        missing = [o for o in options if o not in chosen]
+        if missing and (len(chosen) <= 1 or self.rng.random() < 0.5):
+            added = self.rng.choice(missing)
+            self.values[label] = [o for o in options if o in chosen or o == added]
+        elif len(chosen) > 1:
+            dropped = self.rng.choice(chosen)
+            self.values[label] = [o for o in chosen if o != dropped]
+        else:
+            return
+        self.rerun()
+
+    def _type(self, label, words):
+        word = self.rng.choice(words)
+        for n in range(1, self.rng.randint(2, len(word)) + 1):
+            self.values[label] = word[:n]
+            self.rerun()
+        self.values[label] = ""
+        self.rerun()
+
+    def step(self):
+        action = self.rng.choices(list(ACTIONS), weights=list(ACTIONS.values()))[0]
+        if action in ("sources", "statuses"):
+            self._toggle(FILTERS[action])
+        else:
+            self._type(FILTERS[action], AUTHOR_SEARCHES if action == "author" else TITLE_SEARCHES)
+
+    def replay(self, stop, think):
+        try:
+            while not stop.is_set():
+                self.step()
+                if think:
+                    stop.wait(self.rng.expovariate(1 / think))
+        except Exception as exc:  # a dropped connection ends this viewer, not the test
+            self.errors += 1
+            print(f"viewer stopped: {type(exc).__name__}: {exc}", file=sys.stderr)
+
+
+def sample_rss(pid, stop, interval, samples, started):
+    while not stop.wait(interval):
+        samples.append((time.perf_counter() - started, rss_bytes(pid)))
+
+
+def run_level(url, pid, n, duration, think, interval, seed, view=None):
+    """Latency, throughput and RSS samples of ``n`` viewers replaying for ``duration``."""
+    with ExitStack() as sockets:
+        viewers = [Viewer(sockets.enter_context(connect(url)), seed * 1000 + i, view)
+                   for i in range(n)]
+        stop, samples = threading.Event(), []
+        started = time.perf_counter()
+        samples.append((0.0, rss_bytes(pid)))
+        threads = [threading.Thread(target=sample_rss, args=(pid, stop, interval, samples, started),
+                                    daemon=True)]
+        threads += [threading.Thread(target=v.replay, args=(stop, think), daemon=True)
+                    for v in viewers]
+        for t in threads:
+            t.start()
+        time.sleep(duration)
+        stop.set()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - started
+        samples.append((elapsed, rss_bytes(pid)))
+
+    finished = sorted((end - started, secs) for v in viewers for end, secs in v.latencies)
+    latencies = np.array([secs for _, secs in finished])
+    if len(latencies):
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+    else:
+        p50 = p95 = p99 = np.nan
+    return {
+        "sessions": n, "seconds": round(elapsed, 2), "reruns": len(latencies),
+        "errors": sum(v.errors for v in viewers),
+        "reruns_per_s": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(float(p50), 1), "p95_ms": round(float(p95), 1),
+        "p99_ms": round(float(p99), 1),
+        "rss_mb": [[round(t, 1), round(rss / 2**20, 1)] for t, rss in samples],
+        "timeline": _timeline(finished, samples),
+    }
+
+
+def _timeline(finished, samples):
+    # Reruns finished, and their p95, between consecutive RSS samples
+    rows, times = [], np.array([t for t, _ in finished])
+    for (t0, _), (t1, rss) in zip(samples, samples[1:]):
+        lo, hi = np.searchsorted(times, t0), np.searchsorted(times, t1)
+        window = [secs for _, secs in finished[lo:hi]]
+        p95 = float(np.percentile(window, 95)) * 1000 if window else float("nan")
+        rows.append((t1, rss / 2**20, len(window), p95))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--workbook", help="existing workbook instead of a synthetic one")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds of replay per level")
+    parser.add_argument("--think", type=float, default=1.0,
+                        help="mean pause between interactions in seconds (0: back to back)")
+    parser.add_argument("--view", help="dashboard section the viewers look at (default: Overview)")
+    parser.add_argument("--interval", type=float, default=5.0, help="seconds between RSS samples")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="append each level's results to this JSON-lines file")
+    args = parser.parse_args()
+
+    path = args.workbook
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(prefix="tracker-load-"), "bench.xlsx")
+        write_workbook(path, args.rows)
+    os.environ["TRACKER_WORKBOOK"] = path
+
+    port = free_port()
+    server = start_server(port)
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    results = []
+    try:
+        # The first session loads the workbook; keep that out of the figures
+        with connect(url) as ws:
+            Viewer(ws, args.seed)
+        print(f"server up, RSS {rss_bytes(server.pid) / 2**20:.0f} MB with the data loaded")
+        for n in sorted(args.sessions):
+            result = run_level(url, server.pid, n, args.duration, args.think, args.interval,
+                               args.seed, args.view)
+            results.append(result)
+            print(f"\n{n} sessions, {result['seconds']:.0f} s: {result['reruns']} reruns "
+                  f"({result['reruns_per_s']:.1f}/s), {result['errors']} errors")
+            print(f"  {'t (s)':>7} {'RSS (MB)':>9} {'reruns':>7} {'p95 (ms)':>9}")
+            for t, rss, reruns, p95 in result.pop("timeline"):
+                print(f"  {t:>7.1f} {rss:>9.0f} {reruns:>7} {p95:>9.0f}")
+            if args.output:
+                with open(args.output, "a") as f:
+                    f.write(json.dumps({"timestamp": time.time(), "rows": args.rows,
+                                        "think": args.think, "view": args.view, **result}) + "\n")
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    print(f"\n{'sessions':>8} {'reruns/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'peak RSS MB':>12} {'errors':>7}")
+    for r in results:
+        peak = max(rss for _, rss in r["rss_mb"])
+        print(f"{r['sessions']:>8} {r['reruns_per_s']:>9.1f} {r['p50_ms']:>8.0f} "
+              f"{r['p95_ms']:>8.0f} {r['p99_ms']:>8.0f} {peak:>12.0f} {r['errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
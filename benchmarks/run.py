@@ -0,0 +1,172 @@
+"""End-to-end benchmark: load, filter, aggregation and rendering at scale.
+
+Generates (or reuses) a synthetic workbook per size, times each stage
+separately and appends the results to a JSON-lines history file. Each
+result is compared with the previous run of the same size and stage, and
+slowdowns beyond the threshold are flagged as regressions.
+
+Usage: python benchmarks/run.py [--rows 100 1000 10000] [--no-render]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from generate_workbook import write_workbook  # noqa: E402
+from tracker import analytics  # noqa: E402
+from tracker.authors import authors_for, count_unique_authors  # noqa: E402
+from tracker.cache import WorkbookCache, content_hash  # noqa: E402
+from tracker.search import SearchIndex  # noqa: E402
+from tracker.snapshot import read_snapshot, write_snapshot  # noqa: E402
+
+DEFAULT_RESULTS = os.path.join(ROOT, "benchmarks", "results.jsonl")
+# What a user types into the two search boxes, one rerun per keystroke
+AUTHOR_KEYS = ["k", "ku", "kum", "kuma", "kumar"]
+TITLE_KEYS = ["g", "gr", "gra", "grap", "graph"]
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def bench_data(path, repeat):
+    results = {}
+    results["parse_xlsx"] = best_of(lambda: WorkbookCache().load(path), repeat)
+    data = WorkbookCache().load(path)
+    df_papers, _, _, paper_authors = data
+
+    fingerprint = content_hash(path)
+    write_snapshot(path, fingerprint, data)
+    results["snapshot_read"] = best_of(lambda: read_snapshot(path, fingerprint), repeat)
+
+    t0 = time.perf_counter()
+    index = SearchIndex(df_papers)
+    index.mask("Author_Names", "kum")
+    index.mask("Title", "gra")
+    results["search_index_build"] = time.perf_counter() - t0
+
+    statuses = [s for s in df_papers["Status"].unique() if s != "Rejected"]
+    sources = df_papers["Source"].unique().tolist()
+
+    def filter_reruns():
+        index = SearchIndex(df_papers)
+        for author_q, title_q in zip(AUTHOR_KEYS, TITLE_KEYS):
+            mask = df_papers["Source"].isin(sources) & df_papers["Status"].isin(statuses)
+            mask &= index.mask("Author_Names", author_q)
+            mask &= index.mask("Title", title_q)
+            df_papers[mask]
+    results["filter_per_rerun"] = best_of(filter_reruns, repeat) / len(AUTHOR_KEYS)
+
+    filtered = df_papers[df_papers["Status"].isin(statuses)]
+
+    cube = analytics.build_cube(df_papers)
+
+    def aggregate():
+        analytics.kpis(cube, count_unique_authors(paper_authors))
+        view = analytics.slice_cube(cube, sources, statuses)
+        fa = authors_for(paper_authors, filtered)
+        analytics.selection_summary(view, count_unique_authors(fa))
+        analytics.author_table(filtered, paper_authors)
+        analytics.financial_summary(view)
+        analytics.status_by_source(view)
+        analytics.pipeline_counts(view)
+        analytics.payment_stages(view)
+    results["aggregate"] = best_of(aggregate, repeat)
+    return results
+
+
+def bench_render(path):
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    os.environ["TRACKER_WORKBOOK"] = path
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    results = {}
+    at = AppTest.from_file(os.path.join(ROOT, "dashboard.py"), default_timeout=600)
+    t0 = time.perf_counter()
+    at.run()
+    results["render_cold"] = time.perf_counter() - t0
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    t0 = time.perf_counter()
+    at.run()
+    results["render_rerun"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for view in at.radio(key="view").options:
+        at.radio(key="view").set_value(view).run()
+    results["render_all_views"] = time.perf_counter() - t0
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path):
+    previous = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            for line in f:
+                rec = json.loads(line)
+                previous[(rec["rows"], rec["stage"])] = rec["seconds"]
+    return previous
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--sheets", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-render", action="store_true", help="skip the AppTest rendering stages")
+    parser.add_argument("--workdir", default=os.path.join(tempfile.gettempdir(), "tracker-bench"))
+    parser.add_argument("--results", default=DEFAULT_RESULTS)
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative slowdown reported as a regression (default 0.25)")
+    args = parser.parse_args()
+
+    os.makedirs(args.workdir, exist_ok=True)
+    previous = load_history(args.results)
+    commit = git_commit()
+    regressions = 0
+    with open(args.results, "a") as out:
+        for rows in args.rows:
+            path = os.path.join(args.workdir, f"bench-{rows}-{args.sheets}-{args.seed}.xlsx")
+            if not os.path.exists(path):
+                write_workbook(path, rows, sheets=args.sheets, seed=args.seed)
+            results = bench_data(path, args.repeat)
+            if not args.no_render:
+                results.update(bench_render(path))
+            for stage, seconds in results.items():
+                before = previous.get((rows, stage))
+                note = ""
+                if before:
+                    change = seconds / before - 1
+                    note = f"{change:+6.0%}"
+                    if change > args.threshold:
+                        note += "  REGRESSION"
+                        regressions += 1
+                print(f"{rows:>8} rows  {stage:<20} {seconds * 1000:10.1f} ms  {note}")
+                out.write(json.dumps({"ts": time.time(), "commit": commit, "rows": rows,
+                                      "stage": stage, "seconds": seconds}) + "\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,27 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import collections.abc
+import functools
+import inspect
+import logging
 import os
+import tempfile
+import typing
+import uuid
 from datetime import datetime
 
+from tracker import (
+    EXPORT_FORMATS, EXPORT_MIME_TYPES, PIPELINE, WORKBOOK_NAME, FrameBackend, HistoryStore,
+    LiveDataset, LRUCache, SectionProfiler, Selection, SQLiteStore, WorkbookSource, amount_bins,
+    daily_movements, daily_trend, expand_authors, expand_papers, export_selection,
+    financial_summary, kpis, memory_report, payment_stages, pipeline_counts, selection_summary,
+    stable_key, status_by_source, status_counts, top_papers,
+)
+
+log = logging.getLogger(__name__)
+
 # ============================================================
 # PAGE CONFIG
 # ============================================================
@@ -227,131 +245,418 @@ def clean_layout(**kwargs):
 
 
 # ============================================================
-# DATA LOADING
+# FIGURES
 # ============================================================
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Builders return a ready figure, or None when there is nothing to draw.
+# Sections fetch them through memoized(), so a rerun that doesn't change the
+# data revision or the filters reuses the figures of the previous run.
+FIGURE_CACHE_SIZE = 256
+# Paper-wise payments: bars for the top papers (one more for the rest), WebGL
+# points per paper up to PAYMENT_POINTS papers and amount ranges beyond
+PAYMENT_TOP_N = [10, 20, 30, 50]
+PAYMENT_POINTS = 5000
+PAYMENT_BINS = 24
+# Days of status movements listed under the trend charts
+TREND_MOVE_DAYS = 14
+
+
+def fig_status_pie(cube):
+    sc = status_counts(cube)
+    colors = [STATUS_COLORS.get(s, TEXT_LIGHT) for s in sc["Status"]]
+    total = sc["Count"].sum()
+
+    fig = go.Figure(data=[go.Pie(
+        labels=sc["Status"], values=sc["Count"],
+        marker=dict(colors=colors, line=dict(color="white", width=3)),
+        hole=0.5,
+        textinfo="value",
+        textfont=dict(size=15, color="white", family="Inter"),
+        hovertemplate="<b>%{label}</b><br>%{value} papers (%{percent})<extra></extra>",
+    )])
+    fig.add_annotation(text=f"<b>{total}</b><br><span style='font-size:11px'>Total</span>",
+                       x=0.5, y=0.5, font=dict(size=26, color=SECONDARY), showarrow=False)
+    fig.update_layout(**clean_layout(
+        title="Paper Status Distribution", height=400,
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="top", y=-0.02, x=0.5, xanchor="center"),
+    ))
+    return fig
+
+
+def fig_pipeline_funnel(cube):
+    status_order = PIPELINE
+    status_vals = pipeline_counts(cube)
+    labels = ["Communicated", "Under Review", "Accepted", "Published"]
+
+    fig = go.Figure(data=[go.Funnel(
+        y=labels, x=status_vals,
+        textinfo="value+percent initial",
+        textfont=dict(size=14, color="white"),
+        marker=dict(
+            color=[STATUS_COLORS.get(s, TEXT_LIGHT) for s in status_order],
+            line=dict(width=1, color="white"),
+        ),
+        connector=dict(line=dict(color="#E2E8F0", width=2)),
+    )])
+    fig.update_layout(**clean_layout(title="Publication Pipeline", height=400))
+    return fig
+
+
+def fig_top_authors(df_auth):
+    top = df_auth.sort_values("papers", ascending=True).tail(12)
+    n = len(top)
+    # Soft blue gradient
+    colors = [f"rgba(37,99,235,{0.35 + 0.65 * i / max(n-1,1)})" for i in range(n)]
+    fig = go.Figure(data=[go.Bar(
+        x=top["papers"], y=top["name"], orientation="h",
+        marker=dict(color=colors, line=dict(width=0), cornerradius=6),
+        text=top["papers"], textposition="outside",
+        textfont=dict(size=12, color=TEXT),
+    )])
+    fig.update_layout(**clean_layout(
+        title="Top Authors by Paper Count", height=420,
+        xaxis=dict(dtick=1, gridcolor="#F1F5F9"),
+        yaxis=dict(tickfont=dict(size=11, color=TEXT)),
+    ))
+    return fig
+
+
+def fig_author_contribution(df_auth):
+    top_amt = df_auth[df_auth["amount"] > 0].sort_values("amount", ascending=True).tail(12)
+    if top_amt.empty:
+        return None
+    n2 = len(top_amt)
+    colors2 = [f"rgba(5,150,105,{0.35 + 0.65 * i / max(n2-1,1)})" for i in range(n2)]
+    fig = go.Figure(data=[go.Bar(
+        x=top_amt["amount"], y=top_amt["name"], orientation="h",
+        marker=dict(color=colors2, line=dict(width=0), cornerradius=6),
+        text=[f"INR {v:,.0f}" for v in top_amt["amount"]], textposition="outside",
+        textfont=dict(size=11, color=TEXT),
+    )])
+    fig.update_layout(**clean_layout(
+        title="Authors by Financial Contribution", height=420,
+        yaxis=dict(tickfont=dict(size=11, color=TEXT)),
+    ))
+    return fig
+
+
+def fig_team_size(ad):
+    tc = [PRIMARY, EMERALD, AMBER, VIOLET, TEAL, SKY]
+    fig = go.Figure(data=[go.Bar(
+        x=[f"{n} Author{'s' if n > 1 else ''}" for n in ad["Num"]],
+        y=ad["Papers"],
+        marker=dict(color=[tc[i % len(tc)] for i in range(len(ad))],
+                    line=dict(width=0), cornerradius=8),
+        text=ad["Papers"], textposition="outside",
+        textfont=dict(size=13, color=TEXT), width=0.5,
+    )])
+    fig.update_layout(**clean_layout(
+        title="Papers by Team Size", height=370,
+        yaxis=dict(dtick=1, range=[0, ad["Papers"].max() * 1.3]),
+    ))
+    return fig
+
+
+def fig_status_by_category(cube):
+    ss = status_by_source(cube)
+    fig = go.Figure()
+    for status in cube["Status"].unique():
+        d = ss[ss["Status"] == status]
+        fig.add_trace(go.Bar(
+            name=status, x=d["Source"], y=d["Count"],
+            marker_color=STATUS_COLORS.get(status, TEXT_LIGHT),
+            text=d["Count"], textposition="inside",
+            textfont=dict(size=12, color="white"),
+            marker=dict(line=dict(width=0), cornerradius=4),
+        ))
+    fig.update_layout(**clean_layout(
+        title="Status by Work Category", barmode="stack", height=370,
+    ))
+    return fig
+
+
+def fig_gauge(val, label, color, prefix, total_rev):
+    max_val = total_rev if prefix else 100
+    suffix = "" if prefix else "%"
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=val,
+        number=dict(prefix=prefix, suffix=suffix, font=dict(size=22, color=SECONDARY)),
+        title=dict(text=label, font=dict(size=13, color=TEXT_MID)),
+        gauge=dict(
+            axis=dict(range=[0, max_val], tickfont=dict(size=9, color=TEXT_LIGHT), showticklabels=False),
+            bar=dict(color=color, thickness=0.75),
+            bgcolor="#F1F5F9",
+            borderwidth=0,
+            steps=[dict(range=[0, max_val], color="#F8FAFC")],
+        ),
+    ))
+    fig.update_layout(height=220, margin=dict(l=20, r=20, t=50, b=10),
+                      paper_bgcolor="rgba(0,0,0,0)", font=CHART_FONT)
+    return fig
+
+
+def _short_titles(titles):
+    return titles.str.slice(0, 35) + np.where(titles.str.len() > 35, "...", "")
+
+
+def _thousands(values, hide_zero=False):
+    labels = (values / 1000).round().astype("int64").astype(str) + "K"
+    return labels.where(values > 0, "") if hide_zero else labels
+
+
+def fig_paper_payments(fin, top_n, by):
+    """Paid/Balance bars of the ``top_n`` papers by ``by``, the rest as one bar."""
+    if fin.empty:
+        return None
+    fin = top_papers(fin, top_n, by).iloc[::-1]
+    short = _short_titles(fin["Title"])
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name="Paid", x=fin["Total_Paid"], y=short, orientation="h",
+        marker=dict(color=EMERALD, line=dict(width=0), cornerradius=4),
+        text=_thousands(fin["Total_Paid"]), textposition="inside",
+        textfont=dict(size=10, color="white")))
+    fig.add_trace(go.Bar(name="Balance", x=fin["Balance"], y=short, orientation="h",
+        marker=dict(color=ROSE, line=dict(width=0), cornerradius=4),
+        text=_thousands(fin["Balance"], hide_zero=True), textposition="inside",
+        textfont=dict(size=10, color="white")))
+    fig.update_layout(**clean_layout(
+        title="Paper-wise Payment Status", barmode="stack", height=max(420, 22 * len(fin) + 120),
+        yaxis=dict(tickfont=dict(size=9, color=TEXT_MID)),
+    ))
+    return fig
+
+
+def fig_payment_distribution(fin):
+    """Paid against amount per paper, or per amount range for large sets."""
+    if fin.empty:
+        return None
+    fig = go.Figure()
+    if len(fin) <= PAYMENT_POINTS:
+        # One WebGL point per paper; papers on the diagonal are fully paid
+        fig.add_trace(go.Scattergl(
+            x=fin["Total_Amount"], y=fin["Total_Paid"], mode="markers",
+            marker=dict(size=7, opacity=0.6, color=np.where(fin["Balance"] > 0, ROSE, EMERALD)),
+            text=_short_titles(fin["Title"]),
+            hovertemplate="%{text}<br>Amount INR %{x:,.0f}<br>Paid INR %{y:,.0f}<extra></extra>"))
+        fig.update_layout(**clean_layout(
+            title="Payments per Paper", height=420, showlegend=False,
+            xaxis=dict(title=dict(text="Total Amount (INR)", font=dict(color=TEXT_MID, size=11))),
+            yaxis=dict(title=dict(text="Paid (INR)", font=dict(color=TEXT_MID, size=11))),
+        ))
+        return fig
+    bins = amount_bins(fin, PAYMENT_BINS)
+    labels = _thousands(bins["Low"]) + "\u2013" + _thousands(bins["High"])
+    for name, column, color in (("Paid", "Total_Paid", EMERALD), ("Balance", "Balance", ROSE)):
+        fig.add_trace(go.Bar(name=name, x=labels, y=bins[column], customdata=bins["Papers"],
+            marker=dict(color=color, line=dict(width=0), cornerradius=4),
+            hovertemplate="%{x}<br>%{customdata} papers<br>" + name + " INR %{y:,.0f}<extra></extra>"))
+    fig.update_layout(**clean_layout(
+        title=f"Payments by Paper Amount \u2022 {len(fin):,} papers", barmode="stack", height=420,
+        xaxis=dict(title=dict(text="Total Amount (INR)", font=dict(color=TEXT_MID, size=11))),
+    ))
+    return fig
+
+
+def fig_payment_stages(cube):
+    ps = payment_stages(cube)
+    stages, vals = ps["Stage"].tolist(), ps["Amount"].tolist()
+    sc = [PRIMARY, EMERALD, VIOLET, AMBER, TEAL]
+    fig = go.Figure(data=[go.Bar(
+        x=stages, y=vals,
+        marker=dict(color=sc, line=dict(width=0), cornerradius=8),
+        text=[f"INR {v:,.0f}" if v > 0 else "" for v in vals], textposition="outside",
+        textfont=dict(size=11, color=TEXT), width=0.5,
+    )])
+    fig.update_layout(**clean_layout(
+        title="Collections by Payment Stage", height=420,
+        yaxis=dict(range=[0, max(vals)*1.3] if max(vals) > 0 else [0, 100]),
+        xaxis=dict(title=dict(text="Payment Stage", font=dict(color=TEXT_MID, size=11))),
+    ))
+    return fig
+
+
+def fig_money_trend(daily):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name="Collected that day", x=daily["Date"], y=daily["Collected"],
+        marker=dict(color=EMERALD_LIGHT, line=dict(width=0), cornerradius=4), yaxis="y2"))
+    for name, column, color in (("Total paid", "Total_Paid", EMERALD), ("Balance", "Balance", ROSE)):
+        fig.add_trace(go.Scatter(name=name, x=daily["Date"], y=daily[column], mode="lines+markers",
+            line=dict(color=color, width=2.5), marker=dict(size=6)))
+    fig.update_layout(**clean_layout(
+        title="Collections Over Time", height=420,
+        yaxis=dict(title=dict(text="INR", font=dict(color=TEXT_MID, size=11))),
+        yaxis2=dict(overlaying="y", side="right", showgrid=False,
+                    title=dict(text="Collected (INR)", font=dict(color=TEXT_MID, size=11))),
+    ))
+    return fig
+
+
+def fig_status_trend(daily):
+    # Pipeline states first, in pipeline order, then whatever else exists
+    known = set(daily.columns) - {"Date", "Papers", "Total_Amount", "Total_Paid", "Balance", "Collected"}
+    statuses = [s for s in PIPELINE if s in known] + sorted(known - set(PIPELINE))
+    fig = go.Figure()
+    for status in statuses:
+        fig.add_trace(go.Scatter(name=status, x=daily["Date"], y=daily[status], mode="lines",
+            stackgroup="status", line=dict(width=0.5, color=STATUS_COLORS.get(status, TEXT_LIGHT))))
+    fig.update_layout(**clean_layout(title="Papers per Status Over Time", height=420))
+    return fig
+
+
+@st.cache_resource
+def get_figure_cache():
+    return LRUCache(maxsize=FIGURE_CACHE_SIZE)
+
+
+def memoized(name, build, *args):
+    # filter_key identifies the data revision and sidebar filters of this run
+    def timed_build(*a):
+        with profiler.section(f"build:{name}"):
+            return build(*a)
+    return get_figure_cache().get_or_build((name, filter_key), timed_build, *args)
+
+
+def plot_chart(fig):
+    with profiler.section("plotly_chart"):
+        st.plotly_chart(fig, use_container_width=True)
 
 
-def safe_float(val):
-    if pd.isna(val):
-        return 0.0
-    if isinstance(val, (int, float)):
-        return float(val)
-    s = str(val).strip().replace(",", "").replace("Nill", "0").replace("nill", "0").replace("NIL", "0").replace("-", "0")
-    try:
-        return float(s)
-    except ValueError:
-        return 0.0
-
-
-def parse_paper_sheet(filepath, sheet_name):
-    df = pd.read_excel(filepath, sheet_name=sheet_name, header=None)
-    papers = []
-    for i in range(3, len(df)):
-        row = df.iloc[i]
-        sno = row.iloc[1]
-        if pd.isna(sno):
-            continue
+# ============================================================
+# PAPER CARDS
+# ============================================================
+PAGE_SIZES = [10, 25, 50, 100]
+
+
+def paper_cards_html(page_df, badge_map):
+    badges = page_df["Status"].astype(str).map(badge_map).fillna("badge-default")
+    paid = [f"INR {v:,.0f}" if v > 0 else "---" for v in page_df["Total_Paid"]]
+    due = [f"INR {v:,.0f}" if v > 0 else "---" for v in page_df["Balance"]]
+    titles = page_df["Title"].str.slice(0, 130) + page_df["Title"].str.len().gt(130).map({True: "...", False: ""})
+    # Cards are joined without blank lines or indentation so that markdown
+    # keeps the whole page in a single HTML block
+    cards = [
+        '<div class="paper-card">'
+        '<div style="display:flex; justify-content:space-between; align-items:flex-start; flex-wrap:wrap; gap:8px;">'
+        '<div style="flex:1; min-width:280px;">'
+        f'<div class="paper-num">PAPER #{sno} &bull; {source}</div>'
+        f'<div class="paper-title">{title}</div>'
+        f'<div class="paper-authors">&#x1F465; {names}</div>'
+        '</div>'
+        '<div style="text-align:right;">'
+        f'<span class="badge {bcls}">{status}</span>'
+        '<div class="paper-finance">'
+        f'Paid: <b style="color:{EMERALD};">{p}</b> &nbsp;&bull;&nbsp; '
+        f'Due: <b style="color:{ROSE};">{d}</b>'
+        '</div></div></div></div>'
+        for sno, source, title, names, bcls, status, p, d in zip(
+            page_df["SNo"], page_df["Source"], titles, page_df["Author_Names"],
+            badges, page_df["Status"], paid, due,
+        )
+    ]
+    return "<div>" + "".join(cards) + "</div>"
+
+
+# ============================================================
+# PROFILING
+# ============================================================
+# Opt-in with TRACKER_PROFILE=1 or ?profile=1. TRACKER_PROFILE_LOG names a
+# JSON-lines file that receives every profiled rerun. Memory tracing slows
+# down the whole process, so only the server's operator can turn it on;
+# ?profile=1 measures wall time alone.
+PROFILE_LOG = os.environ.get("TRACKER_PROFILE_LOG")
+PROFILE_SERVER = os.environ.get("TRACKER_PROFILE") == "1"
+profiler = SectionProfiler(
+    enabled=PROFILE_SERVER or st.query_params.get("profile") == "1",
+    trace_memory=PROFILE_SERVER,
+)
+
+# ============================================================
+# DATA LOADING
+# ============================================================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+WORKBOOK_PATH = os.environ.get("TRACKER_WORKBOOK", os.path.join(BASE_DIR, WORKBOOK_NAME))
+# A directory or glob of workbooks (one per team or year) replaces the single file
+WORKBOOK_DIR = os.environ.get("TRACKER_WORKBOOKS")
+# Seconds between checks for a newer dataset in open sessions; 0 turns it off
+RELOAD_INTERVAL = float(os.environ.get("TRACKER_RELOAD_INTERVAL", "3"))
+# Folder for the optional embedded SQLite store; sessions then query it for
+# the aggregates and pages they show instead of filtering frames
+STORE_DIR = os.environ.get("TRACKER_STORE")
+# Folder of the append-only revision history behind the Trends view; by
+# default next to the workbooks, and set to an empty value to turn it off
+HISTORY_DIR = os.environ.get("TRACKER_HISTORY")
+
+
+# Parsing, snapshots and directory loading live in tracker.dataset; this
+# page only decides which source to show.
+@st.cache_resource
+def get_workbook_source():
+    if WORKBOOK_DIR:
+        return WorkbookSource(directory=WORKBOOK_DIR)
+    return WorkbookSource(path=WORKBOOK_PATH)
+
+
+@st.cache_resource
+def get_sqlite_store():
+    return SQLiteStore(STORE_DIR)
+
+
+@st.cache_resource
+def open_history_store(folder):
+    return HistoryStore(folder)
+
+
+def get_history_store():
+    """The history store, or None when it is turned off or no workbook was found yet."""
+    folder = HISTORY_DIR
+    if folder is None:
+        folders = get_workbook_source().folders()
+        folder = os.path.join(folders[0], ".tracker-history") if folders else None
+    return open_history_store(folder) if folder else None
+
+
+def load_revision(fingerprint):
+    data = get_workbook_source().load(fingerprint)
+    history = get_history_store()
+    if history is not None:
         try:
-            sno_int = int(float(sno))
-        except (ValueError, TypeError):
-            continue
-
-        authors = []
-        for name_col, amt_col, email_col in [(3,4,5),(6,7,8),(9,10,11),(12,13,14),(15,16,17)]:
-            name = str(row.iloc[name_col]).strip() if pd.notna(row.iloc[name_col]) else ""
-            amt = safe_float(row.iloc[amt_col])
-            email = str(row.iloc[email_col]).strip() if pd.notna(row.iloc[email_col]) else ""
-            if name and name.lower() not in ("", "nan", "not available", "-", "can add", "can add authors"):
-                authors.append({"name": name, "amount": amt, "email": email})
-
-        status_raw = str(row.iloc[26]).strip() if len(row) > 26 and pd.notna(row.iloc[26]) else ""
-        if "published" in status_raw.lower():
-            status = "Published"
-        elif "accepted" in status_raw.lower():
-            status = "Accepted"
-        elif "communicated" in status_raw.lower():
-            status = "Communicated to Riya"
-        elif "review" in status_raw.lower():
-            status = "Under Review"
-        elif "rejected" in status_raw.lower():
-            status = "Rejected"
-        elif status_raw:
-            status = status_raw
-        else:
-            status = "In Progress"
-
-        # Parse individual payments
-        p1 = safe_float(row.iloc[19])
-        p2 = safe_float(row.iloc[20])
-        p3 = safe_float(row.iloc[21])
-        p4 = safe_float(row.iloc[22])
-        p5 = safe_float(row.iloc[23])
-        sum_payments = p1 + p2 + p3 + p4 + p5
-
-        # Auto-calculate: if Total_Paid is 0 but individual payments exist, sum them
-        total_paid_raw = safe_float(row.iloc[24])
-        total_paid = total_paid_raw if total_paid_raw > 0 else sum_payments
-
-        # Auto-calculate: if Total_Amount is 0 but payments/balance exist, compute it
-        total_amount_raw = safe_float(row.iloc[18])
-        balance_raw = safe_float(row.iloc[25])
-        if total_amount_raw > 0:
-            total_amount = total_amount_raw
-        elif total_paid > 0 and balance_raw > 0:
-            total_amount = total_paid + balance_raw
-        elif total_paid > 0:
-            total_amount = total_paid
-        else:
-            total_amount = 0.0
-
-        # Balance: if raw is 0 but we can compute it, do so
-        balance = balance_raw if balance_raw > 0 else max(total_amount - total_paid, 0)
-
-        papers.append({
-            "SNo": sno_int,
-            "Title": str(row.iloc[2]).strip() if pd.notna(row.iloc[2]) else "",
-            "Authors": authors,
-            "Author_Names": ", ".join([a["name"] for a in authors]),
-            "Num_Authors": len(authors),
-            "Total_Amount": total_amount,
-            "Payment_1": p1,
-            "Payment_2": p2,
-            "Payment_3": p3,
-            "Payment_4": p4,
-            "Payment_5": p5,
-            "Total_Paid": total_paid,
-            "Balance": balance,
-            "Status": status,
-            "Status_Raw": status_raw,
-            "Source": sheet_name.strip(),
-        })
-    return papers
-
-
-@st.cache_data
-def load_data():
-    filepath = os.path.join(BASE_DIR, "Paper-Publishing-Work-In-Progress.xlsx")
-    if not os.path.exists(filepath):
-        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
-    xl = pd.ExcelFile(filepath)
-    all_papers = []
-    for sheet in xl.sheet_names:
-        if "work" in sheet.lower().strip():
-            all_papers.extend(parse_paper_sheet(filepath, sheet))
-    df_papers = pd.DataFrame(all_papers) if all_papers else pd.DataFrame()
-    df_clients = pd.DataFrame()
-    if "clients details" in xl.sheet_names:
-        df_clients = pd.read_excel(filepath, sheet_name="clients details")
-    df_info = pd.DataFrame()
-    for sheet in xl.sheet_names:
-        if "info" in sheet.lower():
-            df_info = pd.read_excel(filepath, sheet_name=sheet, header=None)
-            break
-    return df_papers, df_clients, df_info
-
-
-df_papers, df_clients, df_info = load_data()
+            history.record(fingerprint, data[0])
+        except Exception as e:
+            # The dashboard works without history; only the Trends view misses it
+            log.warning("Could not record revision history: %s: %s", type(e).__name__, e)
+    return data
+
+
+# Every session reads the current revision through one shared backend:
+# the parsed frames in memory, or the SQLite store when TRACKER_STORE is set
+def open_backend(fingerprint):
+    if fingerprint is None:
+        return FrameBackend.empty()
+    if STORE_DIR:
+        return get_sqlite_store().open(fingerprint, lambda: load_revision(fingerprint))
+    return FrameBackend(load_revision(fingerprint))
+
+
+# One watcher and one reload thread per server process. Edits to the
+# workbook are parsed once in the background and swapped in whole; open
+# sessions notice the new version through live_reload_check() below.
+@st.cache_resource
+def get_live_dataset():
+    source = get_workbook_source()
+    return LiveDataset(source.fingerprint, open_backend, source.folders(),
+                       poll_interval=RELOAD_INTERVAL or 2.0).start()
+
+
+with profiler.section("load_data"):
+    live_state = get_live_dataset().state
+    data_fingerprint = live_state.fingerprint
+    backend = live_state.data
+    status_cube = backend.full_cube()
+st.session_state["data_version"] = live_state.version
+
+for path, error in get_workbook_source().errors:
+    st.warning(f"Skipped {os.path.basename(path)}: {error}")
 
 # ============================================================
 # SIDEBAR
@@ -363,28 +668,46 @@ st.sidebar.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-if not df_papers.empty:
-    all_sources = sorted(df_papers["Source"].unique().tolist())
+if backend.total:
+    all_sources = backend.sources()
     selected_sources = st.sidebar.multiselect("Work Category", all_sources, default=all_sources)
-    all_statuses = sorted(df_papers["Status"].unique().tolist())
+    all_statuses = backend.statuses()
     selected_statuses = st.sidebar.multiselect("Paper Status", all_statuses, default=all_statuses)
     author_search = st.sidebar.text_input("Search Author", "")
     title_search = st.sidebar.text_input("Search Paper Title", "")
 
-    filtered = df_papers[
-        (df_papers["Source"].isin(selected_sources))
-        & (df_papers["Status"].isin(selected_statuses))
-    ].copy()
-    if author_search:
-        filtered = filtered[filtered["Author_Names"].str.contains(author_search, case=False, na=False)]
-    if title_search:
-        filtered = filtered[filtered["Title"].str.contains(title_search, case=False, na=False)]
+    with profiler.section("filters"):
+        selection = Selection.of(selected_sources, selected_statuses, author_search, title_search)
+        view_cube = backend.cube(selection)
+        n_filtered = int(view_cube["Count"].sum())
+    filter_key = stable_key(data_fingerprint, *selection)
 else:
-    filtered = pd.DataFrame()
+    selected_sources = selected_statuses = []
+    author_search = title_search = ""
+    selection = None
+    view_cube = status_cube
+    n_filtered = 0
+    filter_key = None
 
 st.sidebar.markdown("<hr class='divider'>", unsafe_allow_html=True)
 st.sidebar.markdown(f"<div style='font-size:0.72rem; color:#94A3B8; text-align:center;'>Updated: {datetime.now().strftime('%d %b %Y, %I:%M %p')}</div>", unsafe_allow_html=True)
 
+
+# Polls the shared LiveDataset (no file access) and reruns this session once
+# the background reload has swapped in a newer version of the data.
+@st.fragment(run_every=RELOAD_INTERVAL)
+def live_reload_check():
+    live = get_live_dataset()
+    if live.version != st.session_state.get("data_version"):
+        st.rerun()
+    if live.error:
+        st.caption(f"&#x26A0;&#xFE0F; Last reload failed, showing the previous data: {live.error}")
+
+
+if RELOAD_INTERVAL:
+    with st.sidebar:
+        live_reload_check()
+
 # ============================================================
 # HEADER
 # ============================================================
@@ -394,22 +717,8 @@ st.markdown('<div class="dash-sub">Comprehensive Paper Publication Tracking &bul
 # ============================================================
 # KPI CARDS
 # ============================================================
-if not df_papers.empty:
-    total_papers = len(df_papers)
-    published = len(df_papers[df_papers["Status"] == "Published"])
-    accepted = len(df_papers[df_papers["Status"] == "Accepted"])
-    communicated = len(df_papers[df_papers["Status"] == "Communicated to Riya"])
-    total_paid = df_papers["Total_Paid"].sum()
-    total_balance = df_papers["Balance"].sum()
-    total_revenue = df_papers["Total_Amount"].sum()
-    all_auth_set = set()
-    for al in df_papers["Authors"]:
-        for a in al:
-            all_auth_set.add(a["name"].lower().strip())
-    unique_authors = len(all_auth_set)
-else:
-    total_papers = published = accepted = communicated = unique_authors = 0
-    total_paid = total_balance = total_revenue = 0
+with profiler.section("kpis"):
+    k = kpis(status_cube, backend.unique_authors())
 
 st.markdown(f"""
 <div class="kpi-row">
@@ -417,65 +726,65 @@ st.markdown(f"""
         <div class="kpi-top">
             <div class="kpi-icon icon-blue">&#x1F4C4;</div>
         </div>
-        <div class="kpi-val">{total_papers}</div>
+        <div class="kpi-val">{k['total_papers']}</div>
         <div class="kpi-label">Total Papers</div>
     </div>
     <div class="kpi-card">
         <div class="kpi-top">
             <div class="kpi-icon icon-green">&#x2705;</div>
         </div>
-        <div class="kpi-val">{published}</div>
+        <div class="kpi-val">{k['published']}</div>
         <div class="kpi-label">Published</div>
     </div>
     <div class="kpi-card">
         <div class="kpi-top">
             <div class="kpi-icon icon-violet">&#x1F3AF;</div>
         </div>
-        <div class="kpi-val">{accepted}</div>
+        <div class="kpi-val">{k['accepted']}</div>
         <div class="kpi-label">Accepted</div>
     </div>
     <div class="kpi-card">
         <div class="kpi-top">
             <div class="kpi-icon icon-amber">&#x1F4E8;</div>
         </div>
-        <div class="kpi-val">{communicated}</div>
+        <div class="kpi-val">{k['communicated']}</div>
         <div class="kpi-label">Communicated</div>
     </div>
     <div class="kpi-card">
         <div class="kpi-top">
             <div class="kpi-icon icon-sky">&#x1F465;</div>
         </div>
-        <div class="kpi-val">{unique_authors}</div>
+        <div class="kpi-val">{k['unique_authors']}</div>
         <div class="kpi-label">Authors</div>
     </div>
     <div class="kpi-card">
         <div class="kpi-top">
             <div class="kpi-icon icon-rose">&#x20B9;</div>
         </div>
-        <div class="kpi-val" style="font-size:1.5rem;">{total_paid/1000:.0f}K / {(total_paid+total_balance)/1000:.0f}K</div>
+        <div class="kpi-val" style="font-size:1.5rem;">{k['total_paid']/1000:.0f}K / {(k['total_paid']+k['total_balance'])/1000:.0f}K</div>
         <div class="kpi-label">Collected / Total (INR)</div>
     </div>
 </div>
 """, unsafe_allow_html=True)
 
 # Metric row
-if not filtered.empty:
-    filt_auth = set()
-    for al in filtered["Authors"]:
-        for a in al:
-            filt_auth.add(a["name"].lower().strip())
+if n_filtered:
+    with profiler.section("metric_row"):
+        summary = selection_summary(view_cube, backend.unique_authors(selection))
     mc1, mc2, mc3, mc4, mc5 = st.columns(5)
-    mc1.metric("Filtered Papers", len(filtered))
-    mc2.metric("Unique Authors", len(filt_auth))
-    mc3.metric("Avg Team Size", f"{filtered['Num_Authors'].mean():.1f}")
-    mc4.metric("Revenue", f"INR {filtered['Total_Amount'].sum():,.0f}")
-    rate = (filtered['Total_Paid'].sum() / max(filtered['Total_Amount'].sum(), 1)) * 100
-    mc5.metric("Collection Rate", f"{rate:.0f}%")
+    mc1.metric("Filtered Papers", summary["papers"])
+    mc2.metric("Unique Authors", summary["unique_authors"])
+    mc3.metric("Avg Team Size", f"{summary['avg_team_size']:.1f}")
+    mc4.metric("Revenue", f"INR {summary['revenue']:,.0f}")
+    mc5.metric("Collection Rate", f"{summary['collection_rate']:.0f}%")
 
 # ============================================================
-# SECTION: Status Overview
+# SECTIONS
 # ============================================================
-if not filtered.empty:
+# Each section is a fragment: widgets inside it rerun only that section.
+# Only the section picked in the view bar is executed on a rerun.
+@st.fragment
+def section_status_overview(cube):
     st.markdown("""<div class="section-bar">
         <div class="dot"></div><div class="title">Status Overview</div><div class="tag">Analytics</div>
     </div>""", unsafe_allow_html=True)
@@ -483,100 +792,29 @@ if not filtered.empty:
     r1a, r1b = st.columns(2)
 
     with r1a:
-        sc = filtered["Status"].value_counts().reset_index()
-        sc.columns = ["Status", "Count"]
-        colors = [STATUS_COLORS.get(s, TEXT_LIGHT) for s in sc["Status"]]
-        total = sc["Count"].sum()
-
-        fig = go.Figure(data=[go.Pie(
-            labels=sc["Status"], values=sc["Count"],
-            marker=dict(colors=colors, line=dict(color="white", width=3)),
-            hole=0.5,
-            textinfo="value",
-            textfont=dict(size=15, color="white", family="Inter"),
-            hovertemplate="<b>%{label}</b><br>%{value} papers (%{percent})<extra></extra>",
-        )])
-        fig.add_annotation(text=f"<b>{total}</b><br><span style='font-size:11px'>Total</span>",
-                           x=0.5, y=0.5, font=dict(size=26, color=SECONDARY), showarrow=False)
-        fig.update_layout(**clean_layout(
-            title="Paper Status Distribution", height=400,
-            showlegend=True,
-            legend=dict(orientation="h", yanchor="top", y=-0.02, x=0.5, xanchor="center"),
-        ))
-        st.plotly_chart(fig, use_container_width=True)
+        plot_chart(memoized("status_pie", fig_status_pie, cube))
 
     with r1b:
-        status_order = ["Communicated to Riya", "Under Review", "Accepted", "Published"]
-        status_vals = [len(filtered[filtered["Status"] == s]) for s in status_order]
-        labels = ["Communicated", "Under Review", "Accepted", "Published"]
-
-        fig = go.Figure(data=[go.Funnel(
-            y=labels, x=status_vals,
-            textinfo="value+percent initial",
-            textfont=dict(size=14, color="white"),
-            marker=dict(
-                color=[STATUS_COLORS.get(s, TEXT_LIGHT) for s in status_order],
-                line=dict(width=1, color="white"),
-            ),
-            connector=dict(line=dict(color="#E2E8F0", width=2)),
-        )])
-        fig.update_layout(**clean_layout(title="Publication Pipeline", height=400))
-        st.plotly_chart(fig, use_container_width=True)
+        plot_chart(memoized("pipeline_funnel", fig_pipeline_funnel, cube))
 
-# ============================================================
-# SECTION: Author Analysis
-# ============================================================
-if not filtered.empty:
+
+@st.fragment
+def section_author_analysis(backend, selection, cube):
     st.markdown("""<div class="section-bar">
         <div class="dot" style="background:#059669;"></div><div class="title">Author Analysis</div><div class="tag">Research</div>
     </div>""", unsafe_allow_html=True)
 
-    author_stats = {}
-    for _, paper in filtered.iterrows():
-        for author in paper["Authors"]:
-            key = author["name"].strip().lower()
-            if key not in author_stats:
-                author_stats[key] = {"name": author["name"].strip(), "papers": 0, "amount": 0}
-            author_stats[key]["papers"] += 1
-            author_stats[key]["amount"] += author["amount"]
-    df_auth = pd.DataFrame(author_stats.values())
+    df_auth = memoized("author_stats", backend.author_stats, selection)
 
     a1, a2 = st.columns(2)
 
     with a1:
-        top = df_auth.sort_values("papers", ascending=True).tail(12)
-        n = len(top)
-        # Soft blue gradient
-        colors = [f"rgba(37,99,235,{0.35 + 0.65 * i / max(n-1,1)})" for i in range(n)]
-        fig = go.Figure(data=[go.Bar(
-            x=top["papers"], y=top["name"], orientation="h",
-            marker=dict(color=colors, line=dict(width=0), cornerradius=6),
-            text=top["papers"], textposition="outside",
-            textfont=dict(size=12, color=TEXT),
-        )])
-        fig.update_layout(**clean_layout(
-            title="Top Authors by Paper Count", height=420,
-            xaxis=dict(dtick=1, gridcolor="#F1F5F9"),
-            yaxis=dict(tickfont=dict(size=11, color=TEXT)),
-        ))
-        st.plotly_chart(fig, use_container_width=True)
+        plot_chart(memoized("top_authors", fig_top_authors, df_auth))
 
     with a2:
-        top_amt = df_auth[df_auth["amount"] > 0].sort_values("amount", ascending=True).tail(12)
-        if not top_amt.empty:
-            n2 = len(top_amt)
-            colors2 = [f"rgba(5,150,105,{0.35 + 0.65 * i / max(n2-1,1)})" for i in range(n2)]
-            fig = go.Figure(data=[go.Bar(
-                x=top_amt["amount"], y=top_amt["name"], orientation="h",
-                marker=dict(color=colors2, line=dict(width=0), cornerradius=6),
-                text=[f"INR {v:,.0f}" for v in top_amt["amount"]], textposition="outside",
-                textfont=dict(size=11, color=TEXT),
-            )])
-            fig.update_layout(**clean_layout(
-                title="Authors by Financial Contribution", height=420,
-                yaxis=dict(tickfont=dict(size=11, color=TEXT)),
-            ))
-            st.plotly_chart(fig, use_container_width=True)
+        fig = memoized("author_contribution", fig_author_contribution, df_auth)
+        if fig is not None:
+            plot_chart(fig)
         else:
             st.info("No financial data available.")
 
@@ -584,123 +822,58 @@ if not filtered.empty:
     b1, b2 = st.columns(2)
 
     with b1:
-        ad = filtered["Num_Authors"].value_counts().sort_index().reset_index()
-        ad.columns = ["Num", "Papers"]
-        tc = [PRIMARY, EMERALD, AMBER, VIOLET, TEAL, SKY]
-        fig = go.Figure(data=[go.Bar(
-            x=[f"{n} Author{'s' if n > 1 else ''}" for n in ad["Num"]],
-            y=ad["Papers"],
-            marker=dict(color=[tc[i % len(tc)] for i in range(len(ad))],
-                        line=dict(width=0), cornerradius=8),
-            text=ad["Papers"], textposition="outside",
-            textfont=dict(size=13, color=TEXT), width=0.5,
-        )])
-        fig.update_layout(**clean_layout(
-            title="Papers by Team Size", height=370,
-            yaxis=dict(dtick=1, range=[0, ad["Papers"].max() * 1.3]),
-        ))
-        st.plotly_chart(fig, use_container_width=True)
+        plot_chart(memoized("team_size", lambda: fig_team_size(backend.team_sizes(selection))))
 
     with b2:
-        ss = filtered.groupby(["Source", "Status"]).size().reset_index(name="Count")
-        fig = go.Figure()
-        for status in filtered["Status"].unique():
-            d = ss[ss["Status"] == status]
-            fig.add_trace(go.Bar(
-                name=status, x=d["Source"], y=d["Count"],
-                marker_color=STATUS_COLORS.get(status, TEXT_LIGHT),
-                text=d["Count"], textposition="inside",
-                textfont=dict(size=12, color="white"),
-                marker=dict(line=dict(width=0), cornerradius=4),
-            ))
-        fig.update_layout(**clean_layout(
-            title="Status by Work Category", barmode="stack", height=370,
-        ))
-        st.plotly_chart(fig, use_container_width=True)
+        plot_chart(memoized("status_by_category", fig_status_by_category, cube))
 
-# ============================================================
-# SECTION: Financial Dashboard
-# ============================================================
-if not filtered.empty:
+
+@st.fragment
+def section_financial(backend, selection, cube):
     st.markdown("""<div class="section-bar">
         <div class="dot" style="background:#D97706;"></div><div class="title">Financial Dashboard</div><div class="tag">Finance</div>
     </div>""", unsafe_allow_html=True)
 
-    total_rev = filtered["Total_Amount"].sum()
-    total_coll = filtered["Total_Paid"].sum()
-    total_pend = filtered["Balance"].sum()
+    fin = financial_summary(cube)
+    total_rev = fin["revenue"]
 
     if total_rev > 0:
         g1, g2, g3 = st.columns(3)
         gauge_configs = [
-            (g1, total_coll, "Collected", EMERALD, "INR "),
-            (g2, total_pend, "Pending", ROSE, "INR "),
-            (g3, (total_coll / total_rev) * 100, "Collection Rate", PRIMARY, ""),
+            (g1, fin["collected"], "Collected", EMERALD, "INR "),
+            (g2, fin["pending"], "Pending", ROSE, "INR "),
+            (g3, fin["collection_rate"], "Collection Rate", PRIMARY, ""),
         ]
         for col, val, label, color, prefix in gauge_configs:
             with col:
-                max_val = total_rev if prefix else 100
-                suffix = "" if prefix else "%"
-                fig = go.Figure(go.Indicator(
-                    mode="gauge+number",
-                    value=val,
-                    number=dict(prefix=prefix, suffix=suffix, font=dict(size=22, color=SECONDARY)),
-                    title=dict(text=label, font=dict(size=13, color=TEXT_MID)),
-                    gauge=dict(
-                        axis=dict(range=[0, max_val], tickfont=dict(size=9, color=TEXT_LIGHT), showticklabels=False),
-                        bar=dict(color=color, thickness=0.75),
-                        bgcolor="#F1F5F9",
-                        borderwidth=0,
-                        steps=[dict(range=[0, max_val], color="#F8FAFC")],
-                    ),
-                ))
-                fig.update_layout(height=220, margin=dict(l=20, r=20, t=50, b=10),
-                                  paper_bgcolor="rgba(0,0,0,0)", font=CHART_FONT)
-                st.plotly_chart(fig, use_container_width=True)
+                fig = memoized(f"gauge_{label}", fig_gauge, val, label, color, prefix, total_rev)
+                plot_chart(fig)
 
     f1, f2 = st.columns(2)
 
     with f1:
-        fin = filtered[filtered["Total_Amount"] > 0][["Title","Total_Amount","Total_Paid","Balance"]].copy()
-        fin["Short"] = fin["Title"].apply(lambda x: x[:35] + "..." if len(x) > 35 else x)
-        fin = fin.sort_values("Total_Amount", ascending=True)
-        if not fin.empty:
-            fig = go.Figure()
-            fig.add_trace(go.Bar(name="Paid", x=fin["Total_Paid"], y=fin["Short"], orientation="h",
-                marker=dict(color=EMERALD, line=dict(width=0), cornerradius=4),
-                text=[f"{v/1000:.0f}K" for v in fin["Total_Paid"]], textposition="inside",
-                textfont=dict(size=10, color="white")))
-            fig.add_trace(go.Bar(name="Balance", x=fin["Balance"], y=fin["Short"], orientation="h",
-                marker=dict(color=ROSE, line=dict(width=0), cornerradius=4),
-                text=[f"{v/1000:.0f}K" if v > 0 else "" for v in fin["Balance"]], textposition="inside",
-                textfont=dict(size=10, color="white")))
-            fig.update_layout(**clean_layout(
-                title="Paper-wise Payment Status", barmode="stack", height=420,
-                yaxis=dict(tickfont=dict(size=9, color=TEXT_MID)),
-            ))
-            st.plotly_chart(fig, use_container_width=True)
+        # The figure stays the same size however many papers are selected:
+        # the top papers plus an "Others" bar, or the payment distribution
+        c1, c2, c3 = st.columns([1.4, 1, 1])
+        mode = c1.radio("Payments", ["Top papers", "Distribution"], horizontal=True, key="pay_mode")
+        if mode == "Top papers":
+            ranks = {"Balance": "Balance", "Amount": "Total_Amount"}
+            by = ranks[c2.selectbox("Rank by", list(ranks), key="pay_rank")]
+            top_n = c3.selectbox("Papers", PAYMENT_TOP_N, index=1, key="pay_top_n")
+            build, key = (lambda rows: fig_paper_payments(rows, top_n, by)), f"{by}:{top_n}"
+        else:
+            build, key = fig_payment_distribution, "distribution"
+        fig = memoized(f"paper_payments:{key}", lambda: build(
+            backend.rows(selection, ["Title", "Total_Amount", "Total_Paid", "Balance"], min_amount=0)))
+        if fig is not None:
+            plot_chart(fig)
 
     with f2:
-        stages = ["1st", "2nd", "3rd", "4th", "5th"]
-        vals = [filtered[f"Payment_{i}"].sum() for i in range(1,6)]
-        sc = [PRIMARY, EMERALD, VIOLET, AMBER, TEAL]
-        fig = go.Figure(data=[go.Bar(
-            x=stages, y=vals,
-            marker=dict(color=sc, line=dict(width=0), cornerradius=8),
-            text=[f"INR {v:,.0f}" if v > 0 else "" for v in vals], textposition="outside",
-            textfont=dict(size=11, color=TEXT), width=0.5,
-        )])
-        fig.update_layout(**clean_layout(
-            title="Collections by Payment Stage", height=420,
-            yaxis=dict(range=[0, max(vals)*1.3] if max(vals) > 0 else [0, 100]),
-            xaxis=dict(title=dict(text="Payment Stage", font=dict(color=TEXT_MID, size=11))),
-        ))
-        st.plotly_chart(fig, use_container_width=True)
+        plot_chart(memoized("payment_stages", fig_payment_stages, cube))
 
-# ============================================================
-# SECTION: Paper Details
-# ============================================================
-if not filtered.empty:
+
+@st.fragment
+def section_paper_details(backend, selection, n_papers):
     st.markdown("""<div class="section-bar">
         <div class="dot" style="background:#7C3AED;"></div><div class="title">Paper Details</div><div class="tag">All Papers</div>
     </div>""", unsafe_allow_html=True)
@@ -710,34 +883,34 @@ if not filtered.empty:
         "Communicated to Riya": "badge-communicated", "Under Review": "badge-review",
     }
 
-    for _, p in filtered.sort_values("SNo").iterrows():
-        bcls = badge_map.get(p["Status"], "badge-default")
-        paid = f"INR {p['Total_Paid']:,.0f}" if p["Total_Paid"] > 0 else "---"
-        bal = f"INR {p['Balance']:,.0f}" if p["Balance"] > 0 else "---"
-        title_text = p["Title"][:130] + ("..." if len(p["Title"]) > 130 else "")
-        st.markdown(f"""
-        <div class="paper-card">
-            <div style="display:flex; justify-content:space-between; align-items:flex-start; flex-wrap:wrap; gap:8px;">
-                <div style="flex:1; min-width:280px;">
-                    <div class="paper-num">PAPER #{p['SNo']} &bull; {p['Source']}</div>
-                    <div class="paper-title">{title_text}</div>
-                    <div class="paper-authors">&#x1F465; {p['Author_Names']}</div>
-                </div>
-                <div style="text-align:right;">
-                    <span class="badge {bcls}">{p['Status']}</span>
-                    <div class="paper-finance">
-                        Paid: <b style="color:{EMERALD};">{paid}</b> &nbsp;&bull;&nbsp;
-                        Due: <b style="color:{ROSE};">{bal}</b>
-                    </div>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-# ============================================================
-# SECTION: Clients
-# ============================================================
-if not df_clients.empty:
+    # One page of cards is built in a single pass and sent as one element
+    pg1, pg2, pg3 = st.columns([1, 1, 3])
+    page_size = pg1.selectbox("Papers per page", PAGE_SIZES, index=1, key="cards_page_size")
+    n_pages = max(1, -(-n_papers // page_size))
+    if st.session_state.get("cards_page", 1) > n_pages:
+        st.session_state["cards_page"] = n_pages
+    page = pg2.number_input("Page", min_value=1, max_value=n_pages, step=1, key="cards_page")
+    start = (page - 1) * page_size
+    page_df = backend.page(selection, start, page_size)
+    pg3.markdown(f"<div style='padding-top:2.1rem; font-size:0.8rem; color:{TEXT_MID};'>"
+                 f"Showing {start + 1}&ndash;{start + len(page_df)} of {n_papers} papers "
+                 f"&bull; page {page} of {n_pages}</div>", unsafe_allow_html=True)
+    with profiler.section("paper_cards"):
+        st.markdown(paper_cards_html(page_df, badge_map), unsafe_allow_html=True)
+
+
+@st.cache_data(max_entries=2)
+def client_chips_html(fingerprint, _df_clients):
+    df_clients = _df_clients
+    chips = ""
+    for _, c in df_clients.iterrows():
+        name = c["Name"] if pd.notna(c.get("Name")) else "Unknown"
+        chips += f'<span class="chip">&#x1F464; {name}</span>'
+    return f'<div class="chip-grid">{chips}</div>'
+
+
+@st.fragment
+def section_clients(df_clients):
     st.markdown("""<div class="section-bar">
         <div class="dot" style="background:#0D9488;"></div><div class="title">Client Network</div><div class="tag">Clients</div>
     </div>""", unsafe_allow_html=True)
@@ -749,16 +922,11 @@ if not df_clients.empty:
     cc2.metric("With Papers", with_p)
 
     with cc3:
-        chips = ""
-        for _, c in df_clients.iterrows():
-            name = c["Name"] if pd.notna(c.get("Name")) else "Unknown"
-            chips += f'<span class="chip">&#x1F464; {name}</span>'
-        st.markdown(f'<div class="chip-grid">{chips}</div>', unsafe_allow_html=True)
+        st.markdown(client_chips_html(data_fingerprint, df_clients), unsafe_allow_html=True)
 
-# ============================================================
-# SECTION: Pricing
-# ============================================================
-if not df_info.empty:
+
+@st.fragment
+def section_pricing():
     st.markdown("""<div class="section-bar">
         <div class="dot" style="background:#4F46E5;"></div><div class="title">Publication Pricing</div><div class="tag">Reference</div>
     </div>""", unsafe_allow_html=True)
@@ -796,18 +964,174 @@ if not df_info.empty:
         </div>
         """, unsafe_allow_html=True)
 
-# ============================================================
-# SECTION: Data Table
-# ============================================================
-if not filtered.empty:
+
+@st.fragment
+def section_trends(history):
+    st.markdown("""<div class="section-bar">
+        <div class="dot" style="background:#0284C7;"></div><div class="title">Trends</div><div class="tag">History</div>
+    </div>""", unsafe_allow_html=True)
+
+    if history is None:
+        st.info("Revision history is turned off (TRACKER_HISTORY is empty) or no workbook was found.")
+        return
+    # Replayed from the recorded deltas; the sidebar filters don't apply here
+    with profiler.section("history_replay"):
+        trend, movements = history.replay()
+        daily = daily_trend(trend)
+    if len(daily) < 2:
+        st.info(f"Trends appear once the tracker has changed on two different days. "
+                f"{len(trend)} revision(s) recorded so far.")
+        return
+
+    rev = len(trend)
+    t1, t2 = st.columns(2)
+    with t1:
+        plot_chart(memoized(f"trend_money:{rev}", fig_money_trend, daily))
+    with t2:
+        plot_chart(memoized(f"trend_status:{rev}", fig_status_trend, daily))
+
+    # The first revision only introduces every paper; movements start after it
+    moves = daily_movements(movements[movements["Recorded"] > trend["Recorded"].iloc[0]])
+    st.markdown("**Pipeline movement**")
+    if moves.empty:
+        st.caption("No paper has changed status since history started.")
+    else:
+        recent = moves[moves["Date"] >= moves["Date"].max() - pd.Timedelta(days=TREND_MOVE_DAYS)]
+        st.dataframe(recent.sort_values(["Date", "Papers"], ascending=[False, False])
+                     .assign(Date=recent["Date"].dt.strftime("%d %b %Y")),
+                     hide_index=True, use_container_width=True)
+    st.caption(f"{rev} revisions recorded since {trend['Recorded'].iloc[0]:%d %b %Y}; "
+               f"the whole tracker, not the sidebar filters.")
+
+
+TABLE_COLUMNS = {
+    "#": "SNo", "Title": "Title", "Authors": "Author_Names", "Team": "Num_Authors",
+    "Total (INR)": "Total_Amount", "Paid (INR)": "Total_Paid", "Balance (INR)": "Balance",
+    "Status": "Status", "Category": "Source",
+}
+TABLE_LABELS = {v: k for k, v in TABLE_COLUMNS.items()}
+TABLE_PAGE_SIZES = [25, 50, 100, 250]
+EXPORT_LABELS = {"Papers": "papers", "Authors (one row each)": "authors", "Author summary": "author_stats"}
+
+
+def deferred_downloads():
+    """Whether ``st.download_button`` takes a callable, read only when clicked."""
+    try:
+        params = inspect.signature(inspect.unwrap(st.download_button), eval_str=True).parameters
+        types = typing.get_args(params["data"].annotation)
+    except Exception:
+        return False
+    return any(typing.get_origin(t) is collections.abc.Callable for t in types)
+
+
+# Streamlit versions with deferred downloads read the file only when the
+# button is clicked; older ones are handed the open file on every rerun
+DEFERRED_DOWNLOADS = deferred_downloads()
+
+
+def discard_export():
+    prepared = st.session_state.pop("export_file", None)
+    if prepared:
+        # Closing a NamedTemporaryFile deletes it
+        prepared[2].close()
+
+
+def read_export(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@st.fragment
+def section_data_table(backend, selection, n_rows):
     st.markdown("""<div class="section-bar">
         <div class="dot" style="background:#64748B;"></div><div class="title">Complete Data</div><div class="tag">Table</div>
     </div>""", unsafe_allow_html=True)
 
-    disp = filtered[["SNo","Title","Author_Names","Num_Authors",
-                      "Total_Amount","Total_Paid","Balance","Status","Source"]].copy()
-    disp.columns = ["#","Title","Authors","Team","Total (INR)","Paid (INR)","Balance (INR)","Status","Category"]
-    st.dataframe(disp.sort_values("#").reset_index(drop=True), use_container_width=True, height=400)
+    # Only the visible page is fetched and sent. The backend keeps the sort
+    # order of the selection, and rendered pages go through the figure
+    # cache, so paging back and forth is a cache hit.
+    t1, t2, t3, t4, t5 = st.columns([3, 1.4, 0.8, 0.8, 0.8])
+    shown = t1.multiselect("Columns", list(TABLE_COLUMNS), default=list(TABLE_COLUMNS), key="table_columns")
+    sort_label = t2.selectbox("Sort by", list(TABLE_COLUMNS), key="table_sort")
+    descending = t3.toggle("Descending", key="table_desc")
+    page_size = t4.selectbox("Rows", TABLE_PAGE_SIZES, index=1, key="table_page_size")
+    n_pages = max(1, -(-n_rows // page_size))
+    if st.session_state.get("table_page", 1) > n_pages:
+        st.session_state["table_page"] = n_pages
+    page = t5.number_input("Page", min_value=1, max_value=n_pages, step=1, key="table_page")
+    columns = [TABLE_COLUMNS[c] for c in shown] or ["SNo"]
+    start = (page - 1) * page_size
+
+    def fetch_page():
+        disp = backend.page(selection, start, page_size, order_by=TABLE_COLUMNS[sort_label],
+                            descending=descending, columns=columns)
+        disp.columns = [TABLE_LABELS[c] for c in columns]
+        return disp.reset_index(drop=True)
+
+    key = f"table:{sort_label}:{descending}:{page_size}:{page}:{','.join(columns)}"
+    with profiler.section("table_page"):
+        disp = memoized(key, fetch_page)
+        st.dataframe(disp, use_container_width=True, hide_index=True, height=min(400, 38 + 35 * len(disp)))
+    st.caption(f"Rows {start + 1}\u2013{start + len(disp)} of {n_rows} \u2022 page {page} of {n_pages}")
+
+    # The file is written chunk by chunk from the backend to a temporary
+    # file, only on request, so no session holds it in memory. It is deleted
+    # when the filters or the data change, or with the session
+    with st.expander("Export the filtered data"):
+        e1, e2, e3 = st.columns([2, 1, 1])
+        what = EXPORT_LABELS[e1.selectbox("Data", list(EXPORT_LABELS), key="export_what")]
+        fmt = e2.selectbox("Format", EXPORT_FORMATS, key="export_format")
+        request = (filter_key, what, fmt)
+        if e3.button("Prepare file", key="export_prepare", use_container_width=True):
+            discard_export()
+            out = tempfile.NamedTemporaryFile(prefix="tracker-export-", suffix=f".{fmt}")
+            with st.spinner("Writing export..."), profiler.section("export"):
+                rows = export_selection(backend, selection, what, out, fmt)
+            out.flush()
+            st.session_state["export_file"] = (request, rows, out)
+        prepared = st.session_state.get("export_file")
+        if prepared and prepared[0] != request:
+            discard_export()
+        elif prepared:
+            out = prepared[2]
+            if DEFERRED_DOWNLOADS:
+                data = functools.partial(read_export, out.name)
+            else:
+                out.seek(0)
+                data = out
+            st.download_button(f"Download {prepared[1]:,} rows ({fmt.upper()})", data,
+                               file_name=f"tracker-{what}.{fmt}", mime=EXPORT_MIME_TYPES[fmt],
+                               key="export_download")
+
+
+# ============================================================
+# VIEW BAR
+# ============================================================
+VIEWS = ["Overview", "Authors", "Finance", "Trends", "Papers", "Clients & Pricing", "Complete Data"]
+
+view = st.radio("Section", VIEWS, horizontal=True, key="view", label_visibility="collapsed")
+
+with profiler.section(f"view:{view}"):
+    if view == "Clients & Pricing":
+        if not backend.clients().empty:
+            section_clients(backend.clients())
+        if not backend.info().empty:
+            section_pricing()
+    elif view == "Trends":
+        section_trends(get_history_store())
+    elif not n_filtered:
+        if backend.total:
+            st.info("No papers match the current filters.")
+    elif view == "Overview":
+        section_status_overview(view_cube)
+    elif view == "Authors":
+        section_author_analysis(backend, selection, view_cube)
+    elif view == "Finance":
+        section_financial(backend, selection, view_cube)
+    elif view == "Papers":
+        section_paper_details(backend, selection, n_filtered)
+    else:
+        section_data_table(backend, selection, n_filtered)
 
 # ============================================================
 # FOOTER
@@ -816,10 +1140,48 @@ st.markdown(f"""
 <div style='text-align:center; padding: 1.5rem 0 1rem; margin-top: 1.5rem;
      border-top: 1px solid #E2E8F0;'>
     <div style='font-size: 0.82rem; color: #94A3B8; font-weight: 500;'>
-        Research Publication Tracker &bull; {len(df_papers)} Papers &bull; Built with Streamlit + Plotly
+        Research Publication Tracker &bull; {backend.total} Papers &bull; Built with Streamlit + Plotly
     </div>
     <div style='font-size: 0.7rem; color: #CBD5E1; margin-top: 4px;'>
         &copy; {datetime.now().year} Parthasarathy Sundararajan
     </div>
 </div>
 """, unsafe_allow_html=True)
+
+fc = get_figure_cache().stats()
+st.sidebar.markdown(f"<div style='font-size:0.68rem; color:#CBD5E1; text-align:center;'>Figure cache: {fc['hits']} hits &bull; {fc['misses']} misses &bull; {fc['size']}/{fc['maxsize']}</div>", unsafe_allow_html=True)
+
+# ============================================================
+# PROFILING PANEL
+# ============================================================
+if profiler.enabled:
+    session_tag = st.session_state.setdefault("profile_session", uuid.uuid4().hex[:8])
+    rerun_id = st.session_state["profile_rerun"] = st.session_state.get("profile_rerun", 0) + 1
+    prof = profiler.frame()
+    with st.expander(f"Profiling \u2022 rerun {rerun_id} \u2022 {profiler.total_seconds() * 1000:.0f} ms instrumented"):
+        st.dataframe(prof, hide_index=True, use_container_width=True)
+        st.caption("Indented sections run inside the section above them and are included in its time. "
+                   + ("Memory is traced process-wide." if profiler.trace_memory
+                      else "Memory is traced only when the server runs with TRACKER_PROFILE=1."))
+        if isinstance(backend, FrameBackend) and backend.total:
+            # What this revision holds in memory, shared by all sessions, against
+            # the same data as parsed, before compact_papers/compact_authors
+            papers, authors = backend.df_papers, backend.paper_authors
+            for label, frame, parsed in (("Papers", papers, expand_papers(papers, authors)),
+                                         ("Authors", authors, expand_authors(authors))):
+                mem = memory_report(frame, baseline=parsed)
+                before = mem["Bytes before"].iloc[-1] / 2**20
+                after = mem["Bytes after"].iloc[-1] / 2**20
+                saved = (1 - after / before) * 100 if before else 0
+                st.markdown(f"**{label} frame** \u2022 {before:.2f} MB parsed \u2192 {after:.2f} MB "
+                            f"compacted \u2022 {before - after:.2f} MB saved ({saved:.0f}%)")
+                mb = {f"MB {k}": (mem[f"Bytes {k}"] / 2**20).round(2) for k in ("before", "after")}
+                st.dataframe(mem.assign(**mb, **{"MB saved": (mem["Saved"] / 2**20).round(2)})
+                             .drop(columns=["Bytes before", "Bytes after", "Saved"]),
+                             hide_index=True, use_container_width=True)
+    if PROFILE_LOG:
+        profiler.write_jsonl(
+            PROFILE_LOG, session=session_tag, rerun=rerun_id, view=view,
+            filters=dict(sources=selected_sources, statuses=selected_statuses,
+                         author_search=author_search, title_search=title_search),
+        )
@@ -0,0 +1,31 @@
+import os
+
+import pandas as pd
+import pytest
+
+from tracker import FrameBackend, SQLiteStore, load_data
+
+WORKBOOK = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                        "Paper-Publishing-Work-In-Progress.xlsx")
+
+pytestmark = pytest.mark.skipif(not os.path.exists(WORKBOOK), reason="sample workbook not checked out")
+
+
+@pytest.fixture(scope="module")
+def backends(tmp_path_factory):
+    data = load_data(WORKBOOK)
+    store = SQLiteStore(str(tmp_path_factory.mktemp("store")))
+    return FrameBackend(data), store.open("f" * 40, lambda: data)
+
+
+def test_rows_match(backends):
+    frame, sqlite = (b.rows(None, ["Title", "Total_Amount"], min_amount=0).reset_index(drop=True)
+                     for b in backends)
+    pd.testing.assert_frame_equal(frame, sqlite, check_dtype=False)
+
+
+@pytest.mark.parametrize("column", ["Authors", "Title FROM papers; --"])
+def test_rows_rejects_unknown_columns(backends, column):
+    for backend in backends:
+        with pytest.raises(ValueError):
+            backend.rows(None, ["SNo", column])
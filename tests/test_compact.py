@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from tracker.authors import build_paper_authors, compact_authors, expand_authors
+from tracker.papers import compact_papers, expand_papers
+
+
+def papers(sno, num_authors):
+    return pd.DataFrame({
+        "SNo": np.array(sno, dtype="int64"), "Num_Authors": np.array(num_authors, dtype="int64"),
+        "Title": ["a"] * len(sno), "Status": ["Published"] * len(sno),
+        "Status_Raw": ["published"] * len(sno), "Source": ["Team 1 work"] * len(sno),
+    })
+
+
+def test_compact_papers_downcasts_small_ints():
+    df = compact_papers(papers([1, 2], [3, 5]))
+    assert df["SNo"].dtype == "int32"
+    assert df["Num_Authors"].dtype == "int8"
+
+
+def test_compact_papers_keeps_values_that_do_not_fit():
+    df = compact_papers(papers([1, 2**40], [3, 200]))
+    assert df["SNo"].dtype == "int64"
+    assert df["Num_Authors"].dtype == "int64"
+    assert df["SNo"].tolist() == [1, 2**40]
+    assert df["Num_Authors"].tolist() == [3, 200]
+
+
+def test_compact_authors_keeps_values_that_do_not_fit():
+    authors = pd.DataFrame({
+        "Paper": np.array([0, 1], dtype="int64"), "SNo": np.array([1, 2**40], dtype="int64"),
+        "Author_Id": ["A1", "A2"], "Name": ["x", "y"], "Amount": [0.0, 0.0], "Email": ["", ""],
+    })
+    df = compact_authors(authors)
+    assert df["Paper"].dtype == "int32"
+    assert df["SNo"].tolist() == [1, 2**40]
+
+
+def test_expand_undoes_compaction():
+    df_papers = papers([1, 2, 3], [2, 0, 1]).assign(Authors=[
+        [{"name": "Ravi", "amount": 100.0, "email": "r@x.edu"}, {"name": "Anu", "amount": 0.0, "email": ""}],
+        [], [{"name": "Ravi", "amount": 50.0, "email": "r@x.edu"}],
+    ])
+    paper_authors = build_paper_authors(df_papers)
+    compact = compact_papers(df_papers)
+    compact_auth = compact_authors(paper_authors)
+    pd.testing.assert_frame_equal(expand_authors(compact_auth), paper_authors)
+    expanded = expand_papers(compact, compact_auth)
+    pd.testing.assert_frame_equal(expanded[df_papers.columns], df_papers)
@@ -0,0 +1,36 @@
+import os
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+import tracker
+
+DASHBOARD = os.path.join(os.path.dirname(os.path.dirname(__file__)), "dashboard.py")
+
+
+def test_sessions_share_the_cached_backend(monkeypatch):
+    datasets, loads = [], []
+
+    class RecordingDataset(tracker.LiveDataset):
+        def __init__(self, fingerprint, load, *args, **kwargs):
+            def counted(fp):
+                loads.append(fp)
+                return load(fp)
+            super().__init__(fingerprint, counted, *args, **kwargs)
+            datasets.append(self)
+
+    monkeypatch.setattr(tracker, "LiveDataset", RecordingDataset)
+    st.cache_resource.clear()
+    try:
+        first = AppTest.from_file(DASHBOARD, default_timeout=300).run()
+        assert not first.exception
+        backend = datasets[0].state.data
+        second = AppTest.from_file(DASHBOARD, default_timeout=300).run()
+        assert not second.exception
+        # One dataset and one load for both sessions, and the same backend object
+        assert len(datasets) == 1 and len(loads) == 1
+        assert datasets[0].state.data is backend
+    finally:
+        for dataset in datasets:
+            dataset.stop()
+        st.cache_resource.clear()
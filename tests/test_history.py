@@ -0,0 +1,40 @@
+import pandas as pd
+
+from tracker.history import HISTORY_COLUMNS, HistoryStore, daily_trend
+
+DAY = 86400.0
+NOON = pd.Timestamp("2026-01-05 12:00").timestamp()
+
+
+def papers(paid):
+    """One paper per entry of ``paid`` (SNo -> Total_Paid), 10000 due each."""
+    rows = []
+    for sno, amount in paid.items():
+        rows.append({"Source": "Team 1 work", "SNo": sno, "Title": f"Paper {sno}",
+                     "Author_Names": "A", "Num_Authors": 1, "Total_Amount": 10000.0,
+                     "Payment_1": amount, "Payment_2": 0.0, "Payment_3": 0.0, "Payment_4": 0.0,
+                     "Payment_5": 0.0, "Total_Paid": amount, "Balance": 10000.0 - amount,
+                     "Status": "In Progress"})
+    return pd.DataFrame(rows)[["Source", "SNo"] + HISTORY_COLUMNS]
+
+
+def test_collected_counts_payments_not_removals(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    store.record("r1", papers({1: 1000.0, 2: 5000.0, 3: 0.0}), recorded_at=NOON)
+    # Day 2: paper 1 gets 2000 more, paper 3 its first 500, paper 2 is deleted
+    store.record("r2", papers({1: 3000.0, 3: 500.0}), recorded_at=NOON + DAY)
+    # Day 3: a correction lowers paper 1 and a new paper arrives with 700 paid
+    store.record("r3", papers({1: 2500.0, 3: 500.0, 4: 700.0}), recorded_at=NOON + 2 * DAY)
+    trend, _ = store.replay()
+    daily = daily_trend(trend)
+    assert daily["Collected"].tolist() == [0.0, 2500.0, 700.0]
+    assert daily["Total_Paid"].tolist() == [6000.0, 3500.0, 3700.0]
+
+
+def test_collected_sums_revisions_of_one_day(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    store.record("r1", papers({1: 0.0}), recorded_at=NOON)
+    store.record("r2", papers({1: 1000.0}), recorded_at=NOON + DAY)
+    store.record("r3", papers({1: 4000.0}), recorded_at=NOON + DAY + 60)
+    daily = daily_trend(store.replay()[0])
+    assert daily["Collected"].tolist() == [0.0, 4000.0]
@@ -0,0 +1,60 @@
+import pandas as pd
+
+from tracker.identity import compatible, name_tokens, resolve_authors
+
+
+def ids(names, emails=None, papers=None):
+    authors = pd.DataFrame({
+        "Paper": papers if papers is not None else range(len(names)),
+        "Name": names,
+        "Email": emails if emails is not None else [""] * len(names),
+    })
+    return resolve_authors(authors)["Author_Id"].astype(str).tolist()
+
+
+def test_name_tokens_drop_titles_and_split_initials():
+    assert name_tokens("Dr. R. Kumar") == ("kumar", "r")
+    assert name_tokens("Kumar R.") == ("kumar", "r")
+    assert name_tokens("Divya VK") == ("divya", "k", "v")
+    assert name_tokens("DR Kumar") == ("kumar",)
+    assert name_tokens("MRS Anu") == ("anu",)
+    assert name_tokens("DR ANITA SHARMA") == ("anita", "sharma")
+
+
+def test_compatible():
+    assert compatible(name_tokens("R Kumar"), name_tokens("Ravi Kumar"))
+    assert compatible(name_tokens("Rajesh Kumar"), name_tokens("S. Rajesh Kumar"))
+    assert not compatible(name_tokens("Ravi Kumar"), name_tokens("Rajesh Kumar"))
+    assert not compatible(name_tokens("Prasad"), name_tokens("Prasad K"))
+
+
+def test_name_variants_share_an_id():
+    a, b, c, d, e = ids(["Dr. R. Kumar", "R Kumar", "Kumar R.", "Divya VK", "Divya V.K."])
+    assert a == b == c
+    assert d == e != a
+
+
+def test_ambiguous_abbreviation_stays_apart():
+    r, ravi, rajesh = ids(["R Kumar", "Ravi Kumar", "Rajesh Kumar"])
+    assert len({r, ravi, rajesh}) == 3
+
+
+def test_matching_names_with_one_email_merge():
+    deepa, deepa_s = ids(["Deepa", "Deepa S"], ["deepa@x.com", "Deepa@X.com "])
+    assert deepa == deepa_s
+
+
+def test_shared_email_does_not_merge_unrelated_names():
+    anand, bala = ids(["Anand", "Bala"], ["team@x.com", "team@x.com"])
+    assert anand != bala
+
+
+def test_email_on_two_names_of_one_paper_is_a_team_address():
+    anita, sharma = ids(["Anita", "A. Sharma"], ["lab@x.com", "lab@x.com"], papers=[0, 0])
+    assert anita != sharma
+
+
+def test_placeholder_emails_link_nobody():
+    for filler in ["nil", "nill", "0", "null", "na@na.com", "-", ""]:
+        first, second = ids(["Anand", "Anand K"], [filler, filler])
+        assert first != second, filler
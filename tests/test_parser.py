@@ -0,0 +1,53 @@
+import os
+
+import pandas as pd
+import pytest
+
+from tracker.papers import HEADER_ROWS, parse_paper_frame, parse_paper_sheet
+from tracker.workbook import PAPER_SHEET_WIDTH, read_workbook, rows_to_frame
+
+WORKBOOK = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                        "Paper-Publishing-Work-In-Progress.xlsx")
+
+
+def paper_row(sno, title="", authors=(), total="", payments=(), paid="", balance="", status=""):
+    row = [None] * PAPER_SHEET_WIDTH
+    row[1], row[2], row[18], row[24], row[25], row[26] = sno, title, total, paid, balance, status
+    for i, (name, amount, email) in enumerate(authors):
+        row[3 + 3 * i:6 + 3 * i] = [name, amount, email]
+    for i, amount in enumerate(payments):
+        row[19 + i] = amount
+    return row
+
+
+def assert_parity(raw, sheet_name):
+    pd.testing.assert_frame_equal(parse_paper_frame(raw, sheet_name),
+                                  pd.DataFrame(parse_paper_sheet(raw, sheet_name)))
+
+
+def test_parity_on_generated_sheet():
+    rows = [[None] * PAPER_SHEET_WIDTH for _ in range(HEADER_ROWS)] + [
+        paper_row(1, "Plain", [("Ravi Kumar", 15000, "ravi@x.edu")], 15000, [5000], 5000, 10000,
+                  "Published"),
+        [None] * PAPER_SHEET_WIDTH,
+        paper_row(2.0, "Float sno", [("Not available", "Nill", ""), ("Divya VK", "45,000", None)],
+                  payments=["-", " 10000 "], status="Accepted , in\nIJIT"),
+        paper_row(True, "Bool sno", [("-", 0, ""), ("can add", "abc", "")], "Nill", balance="1,000"),
+        paper_row("S.No", "Repeated header"),
+        paper_row(None, "No sno", [("Prasad", 1000, "")]),
+        paper_row(" 7 ", "Padded sno", [("CAN ADD AUTHORS", 0, ""), ("Deepa", 2000, "d@y.org")],
+                  paid=2000, status="Communicated to Riya"),
+        [""] * PAPER_SHEET_WIDTH,
+    ]
+    # As the loader builds it, and as an object frame that keeps True as a bool
+    for raw in (rows_to_frame(rows, width=PAPER_SHEET_WIDTH), pd.DataFrame(rows, dtype=object)):
+        assert_parity(raw, "Team 1 work ")
+        assert len(parse_paper_frame(raw, "Team 1 work ")) == 4
+
+
+@pytest.mark.skipif(not os.path.exists(WORKBOOK), reason="sample workbook not checked out")
+def test_parity_on_sample_workbook():
+    paper_sheets, _, _ = read_workbook(WORKBOOK)
+    assert paper_sheets
+    for sheet_name, raw in paper_sheets:
+        assert_parity(raw, sheet_name)
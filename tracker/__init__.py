@@ -0,0 +1,43 @@
+"""Headless data layer for the Research Publication Tracker dashboard."""
+from tracker.analytics import (
+    PIPELINE, amount_bins, build_cube, financial_summary, kpis, payment_stages, pipeline_counts,
+    selection_summary, slice_cube, status_by_source, status_counts, team_sizes, top_papers,
+)
+from tracker.authors import (
+    author_stats, authors_for, build_paper_authors, compact_authors, count_unique_authors,
+    expand_authors,
+)
+from tracker.backend import FrameBackend, Selection
+from tracker.cache import WorkbookCache, content_hash
+from tracker.collection import WorkbookCollection, collection_fingerprint, resolve_workbooks
+from tracker.dataset import WorkbookSource, load_data
+from tracker.export import EXPORT_FORMATS, EXPORT_MIME_TYPES, export_selection, write_export
+from tracker.history import HistoryStore, daily_movements, daily_trend
+from tracker.identity import name_tokens, resolve_authors
+from tracker.live import LiveDataset
+from tracker.memo import LRUCache, stable_key
+from tracker.papers import (
+    build_papers_frame, compact_papers, expand_papers, parse_paper_frame, parse_paper_sheet,
+    safe_float,
+)
+from tracker.profiling import SectionProfiler, memory_report
+from tracker.search import SearchIndex, TextIndex
+from tracker.snapshot import read_snapshot, write_snapshot
+from tracker.status import StatusRules, classify_status, status_rules
+from tracker.store import SQLiteBackend, SQLiteStore
+from tracker.workbook import WORKBOOK_NAME, iter_workbook, read_workbook
+
+__all__ = [
+    "EXPORT_FORMATS", "EXPORT_MIME_TYPES", "FrameBackend", "HistoryStore", "LRUCache",
+    "LiveDataset", "PIPELINE", "SQLiteBackend", "SQLiteStore", "SearchIndex", "SectionProfiler",
+    "Selection", "StatusRules", "TextIndex", "WORKBOOK_NAME", "WorkbookCache", "WorkbookCollection",
+    "WorkbookSource", "amount_bins", "author_stats", "authors_for", "build_cube",
+    "build_paper_authors", "build_papers_frame", "classify_status", "collection_fingerprint",
+    "compact_authors", "compact_papers", "content_hash", "count_unique_authors", "daily_movements",
+    "daily_trend", "expand_authors", "expand_papers", "export_selection", "financial_summary",
+    "iter_workbook", "kpis", "load_data", "memory_report", "name_tokens", "parse_paper_frame",
+    "parse_paper_sheet", "payment_stages", "pipeline_counts", "read_snapshot", "read_workbook",
+    "resolve_authors", "resolve_workbooks", "safe_float", "selection_summary", "slice_cube",
+    "stable_key", "status_by_source", "status_counts", "status_rules", "team_sizes", "top_papers",
+    "write_export", "write_snapshot",
+]
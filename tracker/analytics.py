@@ -0,0 +1,149 @@
+"""KPI, author and financial aggregations over the parsed papers.
+
+Status and money figures are read from a small (Source, Status) cube
+rather than from the paper rows: the cube of the whole tracker is built
+once per data revision, and a Source/Status selection is a slice of it.
+Only a filter the cube cannot express (a text search) needs a cube built
+from the matching rows. The dashboard and the command line share these
+functions, so both report the same figures.
+"""
+import numpy as np
+import pandas as pd
+
+from tracker.authors import author_stats, authors_for
+
+PAYMENT_STAGES = ["1st", "2nd", "3rd", "4th", "5th"]
+PIPELINE = ["Communicated to Riya", "Under Review", "Accepted", "Published"]
+
+CUBE_KEYS = ["Source", "Status"]
+CUBE_MEASURES = ["Total_Amount", "Total_Paid", "Balance", "Payment_1", "Payment_2", "Payment_3",
+                 "Payment_4", "Payment_5", "Num_Authors"]
+
+
+def build_cube(df_papers):
+    """Paper count and measure sums per (Source, Status).
+
+    Groups keep the order in which they first appear in the rows, so
+    anything derived from the cube lists statuses in the same order as the
+    rows would.
+    """
+    if df_papers.empty:
+        return pd.DataFrame({
+            **{k: pd.Series(dtype=object) for k in CUBE_KEYS},
+            "Count": pd.Series(dtype="int64"),
+            **{m: pd.Series(dtype="float64") for m in CUBE_MEASURES},
+        })
+    grouped = df_papers.groupby(CUBE_KEYS, sort=False, observed=True)
+    cube = grouped[CUBE_MEASURES].sum()
+    cube.insert(0, "Count", grouped.size())
+    # The papers frame keeps its keys as categoricals; the cube is small and
+    # plain strings keep its consumers (and the SQLite cube) alike
+    return cube.reset_index().astype({k: "str" for k in CUBE_KEYS})
+
+
+def slice_cube(cube, sources, statuses):
+    """The cube restricted to the Source/Status sidebar selection."""
+    return cube[cube["Source"].isin(sources) & cube["Status"].isin(statuses)]
+
+
+def kpis(cube, unique_authors):
+    """Headline counts and totals for the whole tracker."""
+    counts = cube.groupby("Status", sort=False)["Count"].sum()
+    return {
+        "total_papers": int(cube["Count"].sum()),
+        "published": int(counts.get("Published", 0)),
+        "accepted": int(counts.get("Accepted", 0)),
+        "communicated": int(counts.get("Communicated to Riya", 0)),
+        "unique_authors": unique_authors,
+        "total_paid": float(cube["Total_Paid"].sum()),
+        "total_balance": float(cube["Balance"].sum()),
+        "total_revenue": float(cube["Total_Amount"].sum()),
+    }
+
+
+def selection_summary(cube, unique_authors):
+    """The metric row shown above the sections for the filtered papers."""
+    papers = int(cube["Count"].sum())
+    revenue = float(cube["Total_Amount"].sum())
+    return {
+        "papers": papers,
+        "unique_authors": unique_authors,
+        "avg_team_size": float(cube["Num_Authors"].sum()) / papers if papers else 0.0,
+        "revenue": revenue,
+        "collection_rate": float(cube["Total_Paid"].sum()) / max(revenue, 1) * 100,
+    }
+
+
+def financial_summary(cube):
+    revenue = float(cube["Total_Amount"].sum())
+    collected = float(cube["Total_Paid"].sum())
+    return {
+        "revenue": revenue,
+        "collected": collected,
+        "pending": float(cube["Balance"].sum()),
+        "collection_rate": collected / revenue * 100 if revenue > 0 else 0.0,
+    }
+
+
+def status_counts(cube):
+    """Papers per status, most frequent first (like ``value_counts``)."""
+    sc = cube.groupby("Status", sort=False)["Count"].sum().sort_values(ascending=False, kind="stable")
+    return sc.reset_index()
+
+
+def pipeline_counts(cube):
+    counts = cube.groupby("Status", sort=False)["Count"].sum()
+    return [int(counts.get(s, 0)) for s in PIPELINE]
+
+
+def status_by_source(cube):
+    return cube[CUBE_KEYS + ["Count"]].sort_values(CUBE_KEYS, kind="stable").reset_index(drop=True)
+
+
+def team_sizes(filtered):
+    ad = filtered["Num_Authors"].value_counts().sort_index().reset_index()
+    ad.columns = ["Num", "Papers"]
+    return ad
+
+
+def payment_stages(cube):
+    """Amount collected at each of the five payment stages."""
+    return pd.DataFrame({
+        "Stage": PAYMENT_STAGES,
+        "Amount": [float(cube[f"Payment_{i}"].sum()) for i in range(1, 6)],
+    })
+
+
+def top_papers(rows, n, by="Balance"):
+    """The ``n`` rows with the largest ``by``, plus one row summing the rest.
+
+    ``rows`` holds Title and numeric columns; the summary row is titled
+    "Others (k papers)". Ties keep row order.
+    """
+    ranked = rows.sort_values(by, ascending=False, kind="stable")
+    if len(ranked) <= n:
+        return ranked.reset_index(drop=True)
+    rest = ranked.iloc[n:]
+    others = rest.drop(columns="Title").sum().to_frame().T
+    others.insert(0, "Title", f"Others ({len(rest)} papers)")
+    return pd.concat([ranked.iloc[:n], others], ignore_index=True)
+
+
+def amount_bins(rows, bins=20):
+    """Papers per ``Total_Amount`` range, with their Paid and Balance sums."""
+    edges = np.histogram_bin_edges(rows["Total_Amount"].to_numpy(dtype="float64"), bins)
+    # Bin i holds edges[i] <= amount < edges[i + 1]; the last bin is closed
+    codes = np.clip(np.searchsorted(edges, rows["Total_Amount"].to_numpy(), side="right") - 1,
+                    0, len(edges) - 2)
+    grouped = rows.groupby(codes)
+    binned = pd.DataFrame({
+        "Papers": grouped.size(),
+        "Total_Paid": grouped["Total_Paid"].sum(),
+        "Balance": grouped["Balance"].sum(),
+    })
+    return binned.assign(Low=edges[binned.index], High=edges[binned.index + 1]).reset_index(drop=True)
+
+
+def author_table(df_papers, paper_authors):
+    """Per-author paper count and amount for the papers in ``df_papers``."""
+    return author_stats(authors_for(paper_authors, df_papers))
@@ -0,0 +1,76 @@
+"""Long-form author table and the author aggregations built on it.
+
+``build_paper_authors`` flattens the per-paper ``Authors`` lists once per
+load into one row per author slot. ``Paper`` is the row label of the paper
+in ``df_papers`` (SNo alone repeats across work sheets), so a filtered
+papers frame selects its authors with ``paper_authors["Paper"].isin(...)``.
+Rows of the same person share an ``Author_Id`` (see ``tracker.identity``).
+"""
+import pandas as pd
+
+from tracker.identity import resolve_authors
+from tracker.papers import int_downcasts
+
+AUTHOR_COLUMNS = ["Paper", "SNo", "Author_Id", "Name", "Amount", "Email"]
+
+
+def build_paper_authors(df_papers):
+    if df_papers.empty:
+        return pd.DataFrame({
+            "Paper": pd.Series(dtype="int64"), "SNo": pd.Series(dtype="int64"),
+            "Author_Id": pd.Categorical([]), "Name": pd.Series(dtype=object),
+            "Amount": pd.Series(dtype="float64"), "Email": pd.Series(dtype=object),
+        })
+    counts = df_papers["Num_Authors"].to_numpy()
+    records = [a for authors in df_papers["Authors"] for a in authors]
+    authors = pd.DataFrame({
+        "Paper": df_papers.index.repeat(counts).to_numpy(dtype="int64"),
+        "SNo": df_papers["SNo"].to_numpy().repeat(counts),
+        "Name": [a["name"].strip() for a in records],
+        "Amount": [a["amount"] for a in records],
+        "Email": [a["email"] for a in records],
+    })
+    return resolve_authors(authors)[AUTHOR_COLUMNS]
+
+
+def compact_authors(paper_authors):
+    """Small ints for the paper columns, categoricals for the repeated strings."""
+    if paper_authors.empty:
+        return paper_authors
+    dtypes = int_downcasts(paper_authors, {"Paper": "int32", "SNo": "int32"})
+    return paper_authors.astype({**dtypes, "Author_Id": "category", "Email": "category"})
+
+
+def expand_authors(paper_authors):
+    """Undo ``compact_authors``, to measure what it saves."""
+    if paper_authors.empty:
+        return paper_authors
+    email = paper_authors["Email"]
+    if isinstance(email.dtype, pd.CategoricalDtype):
+        email = email.astype(email.cat.categories.dtype)
+    return paper_authors.astype({"Paper": "int64", "SNo": "int64"}).assign(Email=email)
+
+
+def authors_for(paper_authors, papers):
+    """Author rows belonging to the papers in ``papers`` (a df_papers slice)."""
+    return paper_authors[paper_authors["Paper"].isin(papers.index)]
+
+
+def count_unique_authors(paper_authors):
+    if paper_authors.empty:
+        return 0
+    return int(paper_authors["Author_Id"].nunique())
+
+
+def author_stats(paper_authors):
+    """Papers and total amount per author, in order of first appearance.
+
+    ``name`` is the display name of each author's first occurrence.
+    """
+    grouped = paper_authors.groupby("Author_Id", observed=True, sort=False)
+    stats = pd.DataFrame({
+        "name": grouped["Name"].first(),
+        "papers": grouped.size(),
+        "amount": grouped["Amount"].sum(),
+    })
+    return stats.rename_axis("author_id").reset_index().astype({"author_id": "str"})
@@ -0,0 +1,213 @@
+"""Query interface the dashboard reads the data through.
+
+The page never touches the parsed frames directly: it describes the
+sidebar filters as a ``Selection`` and asks a backend for the aggregates
+and pages it displays. ``FrameBackend`` answers from the in-memory pandas
+frames; ``tracker.store.SQLiteBackend`` answers the same calls from an
+embedded database.
+
+One backend per data revision is shared by every session of the process.
+Its frames are never modified, and a selection is kept as an array of row
+positions rather than as a filtered copy: a session only ever materializes
+the columns and rows of what it displays.
+"""
+import threading
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from tracker.analytics import CUBE_KEYS, CUBE_MEASURES, build_cube, slice_cube, team_sizes
+from tracker.authors import author_stats, count_unique_authors
+from tracker.memo import LRUCache
+from tracker.search import SearchIndex
+
+# Columns of a paper card / table row; the nested Authors lists stay out
+PAPER_ROW_COLUMNS = ["SNo", "Title", "Author_Names", "Num_Authors", "Total_Amount", "Payment_1",
+                     "Payment_2", "Payment_3", "Payment_4", "Payment_5", "Total_Paid", "Balance",
+                     "Status", "Source"]
+# One row per author slot: the author plus the paper it belongs to
+AUTHOR_ROW_COLUMNS = ["SNo", "Source", "Title", "Status", "Author", "Author_Id", "Email", "Amount"]
+
+
+def check_column(column):
+    # Column names end up in SQL for the SQLite backend; only known ones pass
+    if column not in PAPER_ROW_COLUMNS:
+        raise ValueError(f"unknown paper column {column!r}")
+
+
+class Selection(namedtuple("Selection", "sources statuses author title")):
+    """Sidebar filters: Source/Status allow-lists plus two substring searches."""
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, sources, statuses, author="", title=""):
+        return cls(tuple(sorted(sources)), tuple(sorted(statuses)), author, title)
+
+    @property
+    def text_search(self):
+        return bool(self.author or self.title)
+
+
+def _frozen(positions):
+    # Shared between sessions through the caches; nobody may write to them
+    positions.flags.writeable = False
+    return positions
+
+
+class FrameBackend:
+    """Answers selections from the parsed frames held in memory.
+
+    The frames are read-only: they are shared by all sessions, and pandas'
+    copy-on-write gives anything derived from them its own data once it
+    is modified.
+    """
+
+    def __init__(self, data):
+        self.df_papers, self.df_clients, self.df_info, self.paper_authors = data
+        self._lock = threading.Lock()
+        self._index = None
+        self._cube = None
+        # A rerun asks several questions about the same selection
+        self._selected = LRUCache(maxsize=8)
+        self._selected_authors = LRUCache(maxsize=8)
+        self._sorted = LRUCache(maxsize=8)
+
+    @property
+    def total(self):
+        return len(self.df_papers)
+
+    def sources(self):
+        return sorted(self.df_papers["Source"].unique().tolist()) if self.total else []
+
+    def statuses(self):
+        return sorted(self.df_papers["Status"].unique().tolist()) if self.total else []
+
+    def search_index(self):
+        with self._lock:
+            if self._index is None:
+                self._index = SearchIndex(self.df_papers)
+            return self._index
+
+    def full_cube(self):
+        with self._lock:
+            if self._cube is None:
+                self._cube = build_cube(self.df_papers)
+            return self._cube
+
+    def _select(self, sel):
+        df = self.df_papers
+        mask = (df["Source"].isin(sel.sources) & df["Status"].isin(sel.statuses)).to_numpy()
+        if sel.text_search:
+            index = self.search_index()
+            if sel.author:
+                mask = mask & index.mask("Author_Names", sel.author)
+            if sel.title:
+                mask = mask & index.mask("Title", sel.title)
+        return _frozen(np.flatnonzero(mask))
+
+    def positions(self, sel):
+        """Row positions of the papers matching ``sel`` (None: all papers)."""
+        if sel is None:
+            return self._selected.get_or_build(None, lambda: _frozen(np.arange(self.total)))
+        return self._selected.get_or_build(sel, self._select, sel)
+
+    def _take(self, sel, columns):
+        # Only the requested columns of the selected rows are copied
+        return self.df_papers[list(columns)].take(self.positions(sel))
+
+    def count(self, sel=None):
+        return len(self.positions(sel))
+
+    def cube(self, sel=None):
+        if sel is None:
+            return self.full_cube()
+        if sel.text_search:
+            # The cube has no notion of text matches; aggregate the rows found
+            return build_cube(self._take(sel, CUBE_KEYS + CUBE_MEASURES))
+        return slice_cube(self.full_cube(), sel.sources, sel.statuses)
+
+    def _author_positions(self, sel):
+        labels = self.df_papers.index[self.positions(sel)]
+        return _frozen(np.flatnonzero(self.paper_authors["Paper"].isin(labels).to_numpy()))
+
+    def authors(self, sel=None):
+        if sel is None:
+            return self.paper_authors
+        return self.paper_authors.take(self._selected_authors.get_or_build(
+            sel, self._author_positions, sel))
+
+    def unique_authors(self, sel=None):
+        if sel is None or self.paper_authors.empty:
+            return count_unique_authors(self.paper_authors)
+        keys = self.paper_authors["Author_Id"].cat.codes.to_numpy()
+        rows = self._selected_authors.get_or_build(sel, self._author_positions, sel)
+        return int(np.unique(keys[rows]).size)
+
+    def author_stats(self, sel=None):
+        return author_stats(self.authors(sel))
+
+    def team_sizes(self, sel=None):
+        return team_sizes(self._take(sel, ["Num_Authors"]))
+
+    def _order(self, sel, order_by, descending):
+        # Row positions of the selection in sort order; ties keep row order
+        values = self._take(sel, [order_by])[order_by].reset_index(drop=True)
+        order = values.sort_values(ascending=not descending, kind="stable").index.to_numpy()
+        return _frozen(self.positions(sel)[order])
+
+    def page(self, sel, offset, limit, order_by="SNo", descending=False, columns=None):
+        """Rows ``offset:offset + limit`` of the selection in ``order_by`` order.
+
+        The sort order of a selection is computed once and reused, so
+        paging through it only slices.
+        """
+        check_column(order_by)
+        order = self._sorted.get_or_build((sel, order_by, descending), self._order,
+                                          sel, order_by, descending)
+        return self.df_papers[list(columns or PAPER_ROW_COLUMNS)].take(order[offset:offset + limit])
+
+    def rows(self, sel, columns, min_amount=None):
+        for column in columns:
+            check_column(column)
+        if min_amount is None:
+            return self._take(sel, columns)
+        papers = self._take(sel, dict.fromkeys([*columns, "Total_Amount"]))
+        return papers.loc[papers["Total_Amount"] > min_amount, list(columns)]
+
+    def iter_rows(self, sel, columns, chunk_size):
+        """The selection in row order, ``chunk_size`` rows at a time."""
+        for column in columns:
+            check_column(column)
+        positions = self.positions(sel)
+        frame = self.df_papers[list(columns)]
+        for start in range(0, len(positions), chunk_size):
+            yield frame.take(positions[start:start + chunk_size])
+
+    def iter_authors(self, sel, chunk_size):
+        """``AUTHOR_ROW_COLUMNS`` rows for the selection, ``chunk_size`` at a time."""
+        if self.paper_authors.empty:
+            return
+        if sel is None:
+            rows = np.arange(len(self.paper_authors))
+        else:
+            rows = self._selected_authors.get_or_build(sel, self._author_positions, sel)
+        papers = self.df_papers[["SNo", "Source", "Title", "Status"]]
+        for start in range(0, len(rows), chunk_size):
+            authors = self.paper_authors.take(rows[start:start + chunk_size])
+            chunk = papers.take(self.df_papers.index.get_indexer(authors["Paper"]))
+            yield chunk.reset_index(drop=True).assign(
+                Author=authors["Name"].to_numpy(), Author_Id=authors["Author_Id"].to_numpy(),
+                Email=authors["Email"].to_numpy(),
+                Amount=authors["Amount"].to_numpy())
+
+    def clients(self):
+        return self.df_clients
+
+    def info(self):
+        return self.df_info
+
+    @classmethod
+    def empty(cls):
+        return cls((pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()))
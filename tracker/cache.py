@@ -0,0 +1,116 @@
+"""Change-aware workbook loading with per-sheet reuse.
+
+``content_hash`` identifies a workbook revision (re-hashing only when its
+mtime or size moves), which makes it a cheap cache key for callers.
+``WorkbookCache`` keeps the parsed result of every sheet and, when the
+workbook changes, re-parses only the sheets whose content changed.
+"""
+import hashlib
+import os
+import threading
+from collections import namedtuple
+
+import pandas as pd
+
+from tracker.authors import build_paper_authors, compact_authors
+from tracker.papers import compact_papers, concat_paper_frames, parse_paper_frame
+from tracker.workbook import iter_workbook, sheet_frame
+
+_CHUNK = 1 << 20
+
+_content_hashes = {}
+_content_hashes_lock = threading.Lock()
+
+SheetEntry = namedtuple("SheetEntry", "signature digest value")
+
+
+def file_stat(filepath):
+    st = os.stat(filepath)
+    return st.st_mtime_ns, st.st_size
+
+
+def content_hash(filepath):
+    """SHA-256 of the file, recomputed only when its mtime/size changes."""
+    key = (os.path.abspath(filepath), file_stat(filepath))
+    with _content_hashes_lock:
+        if key in _content_hashes:
+            return _content_hashes[key]
+    h = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    digest = h.hexdigest()
+    with _content_hashes_lock:
+        # Only the current revision of each path is worth remembering
+        for stale in [k for k in _content_hashes if k[0] == key[0]]:
+            del _content_hashes[stale]
+        _content_hashes[key] = digest
+    return digest
+
+
+def rows_digest(rows):
+    h = hashlib.blake2b(digest_size=16)
+    for row in rows:
+        h.update(repr(row).encode())
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def parse_sheet(kind, sheet_name, rows):
+    frame = sheet_frame(kind, rows)
+    if kind == "papers":
+        return parse_paper_frame(frame, sheet_name)
+    return frame
+
+
+class WorkbookCache:
+    """Parsed sheets of one workbook, reused across revisions of the file.
+
+    A sheet whose zip-part signature is unchanged is not even read. A sheet
+    that was rewritten but holds the same cell values is read and hashed,
+    but not parsed again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sheets = {}
+        self.stats = {"reused": 0, "unchanged": 0, "parsed": 0}
+
+    def _sheet(self, kind, sheet_name, signature, rows):
+        key = (kind, sheet_name)
+        entry = self._sheets.get(key)
+        if entry is not None and signature is not None and entry.signature == signature:
+            self.stats["reused"] += 1
+            return entry.value
+        rows = list(rows)
+        digest = rows_digest(rows)
+        if entry is not None and entry.digest == digest:
+            self.stats["unchanged"] += 1
+            value = entry.value
+        else:
+            self.stats["parsed"] += 1
+            value = parse_sheet(kind, sheet_name, rows)
+        self._sheets[key] = SheetEntry(signature, digest, value)
+        return value
+
+    def load(self, filepath):
+        """Return ``(df_papers, df_clients, df_info, paper_authors)`` for the file on disk."""
+        with self._lock:
+            papers = []
+            df_clients = pd.DataFrame()
+            df_info = pd.DataFrame()
+            seen = set()
+            for kind, sheet_name, signature, rows in iter_workbook(filepath):
+                seen.add((kind, sheet_name))
+                value = self._sheet(kind, sheet_name, signature, rows)
+                if kind == "papers":
+                    papers.append(value)
+                elif kind == "clients":
+                    df_clients = value
+                else:
+                    df_info = value
+            for key in set(self._sheets) - seen:
+                del self._sheets[key]
+            df_papers = concat_paper_frames(papers)
+            paper_authors = compact_authors(build_paper_authors(df_papers))
+            return compact_papers(df_papers), df_clients, df_info, paper_authors
@@ -0,0 +1,119 @@
+"""Command-line summaries of the tracker for batch reporting.
+
+Usage:
+    python -m tracker [--workbook PATH | --dir DIR_OR_GLOB] [--report NAME] [--format json|csv]
+    python -m tracker [--workbook PATH | --dir DIR_OR_GLOB] --export papers|authors|author_stats
+                      --format csv|parquet|xlsx [--source S ...] [--status S ...]
+                      [--author TEXT] [--title TEXT] --out FILE
+
+``--report all`` (the default) writes every report as one JSON document;
+CSV output needs a single tabular report. ``--export`` streams the rows of
+the filtered papers, their authors (one row each) or the per-author
+summary, as the dashboard's export does. Only pandas and the workbook
+readers are imported, so a run on a current snapshot takes well under a
+second.
+"""
+import argparse
+import json
+import os
+import sys
+
+from tracker import analytics
+from tracker.authors import count_unique_authors
+from tracker.backend import FrameBackend, Selection
+from tracker.dataset import WorkbookSource
+from tracker.export import EXPORTS, EXPORT_FORMATS, export_selection
+from tracker.workbook import WORKBOOK_NAME
+
+REPORTS = ("kpis", "finance", "status", "sources", "team_sizes", "payment_stages", "authors")
+
+
+def build_reports(data, names):
+    df_papers, _, _, paper_authors = data
+    cube = analytics.build_cube(df_papers)
+    builders = {
+        "kpis": lambda: analytics.kpis(cube, count_unique_authors(paper_authors)),
+        "finance": lambda: analytics.financial_summary(cube),
+        "status": lambda: analytics.status_counts(cube),
+        "sources": lambda: analytics.status_by_source(cube),
+        "team_sizes": lambda: analytics.team_sizes(df_papers),
+        "payment_stages": lambda: analytics.payment_stages(cube),
+        "authors": lambda: analytics.author_table(df_papers, paper_authors),
+    }
+    return {name: builders[name]() for name in names}
+
+
+def _jsonable(value):
+    if hasattr(value, "to_dict"):
+        return value.to_dict(orient="records")
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tracker", description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--workbook", help=f"tracker workbook (default: ./{WORKBOOK_NAME})")
+    source.add_argument("--dir", help="directory or glob of tracker workbooks")
+    parser.add_argument("--report", choices=("all",) + REPORTS, default="all")
+    parser.add_argument("--export", choices=EXPORTS, help="export rows instead of a report")
+    parser.add_argument("--format", choices=("json",) + EXPORT_FORMATS)
+    parser.add_argument("--out", help="output file (default: stdout)")
+    filters = parser.add_argument_group("export filters (default: everything)")
+    filters.add_argument("--source", action="append", help="work category; repeat for several")
+    filters.add_argument("--status", action="append", help="paper status; repeat for several")
+    filters.add_argument("--author", default="", help="author name contains")
+    filters.add_argument("--title", default="", help="paper title contains")
+    args = parser.parse_args(argv)
+
+    if args.export:
+        args.format = args.format or "csv"
+        if args.format == "json":
+            parser.error("--export writes " + ", ".join(EXPORT_FORMATS))
+        if args.format != "csv" and not args.out:
+            parser.error(f"--format {args.format} needs --out")
+    else:
+        args.format = args.format or "json"
+        if args.format in EXPORT_FORMATS[1:]:
+            parser.error(f"--format {args.format} is for --export")
+        if args.format == "csv" and args.report in ("all", "kpis", "finance"):
+            parser.error("--format csv needs a tabular --report: " + ", ".join(REPORTS[2:]))
+
+    if args.dir:
+        src = WorkbookSource(directory=args.dir)
+    else:
+        src = WorkbookSource(path=args.workbook or WORKBOOK_NAME)
+    fingerprint = src.fingerprint()
+    if fingerprint is None:
+        parser.error(f"no workbook found at {args.dir or src.path}")
+    data = src.load(fingerprint)
+    for path, error in src.errors:
+        print(f"skipped {os.path.basename(path)}: {error}", file=sys.stderr)
+
+    if args.export:
+        return export(args, FrameBackend(data))
+
+    names = REPORTS if args.report == "all" else (args.report,)
+    reports = build_reports(data, names)
+    out = open(args.out, "w", newline="") if args.out else sys.stdout
+    try:
+        if args.format == "csv":
+            reports[args.report].to_csv(out, index=False)
+        else:
+            doc = {"fingerprint": fingerprint, **{k: _jsonable(v) for k, v in reports.items()}}
+            json.dump(doc if args.report == "all" else doc[args.report], out, indent=2, default=str)
+            out.write("\n")
+    finally:
+        if args.out:
+            out.close()
+    return 0
+
+
+def export(args, backend):
+    sel = None
+    if args.source or args.status or args.author or args.title:
+        sel = Selection.of(args.source or backend.sources(), args.status or backend.statuses(),
+                           args.author, args.title)
+    out = args.out or sys.stdout.buffer
+    rows = export_selection(backend, sel, args.export, out, args.format)
+    print(f"exported {rows} rows", file=sys.stderr)
+    return 0
@@ -0,0 +1,156 @@
+"""Parallel loading of a directory or glob of tracker workbooks.
+
+Each workbook is parsed in its own worker process, going through that
+file's Parquet snapshot when it is still current. The per-file results are
+merged into one dataset whose ``Source`` is prefixed with the workbook it
+came from. A file that cannot be read is reported in ``errors`` instead of
+failing the whole load, and an unchanged file is not parsed again on the
+next load.
+"""
+import glob
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from tracker.authors import AUTHOR_COLUMNS, build_paper_authors, compact_authors
+from tracker.cache import WorkbookCache, content_hash
+from tracker.identity import resolve_authors
+from tracker.memo import stable_key
+from tracker.papers import compact_papers, concat_paper_frames
+from tracker.snapshot import read_snapshot, write_snapshot
+
+
+def resolve_workbooks(spec):
+    """Expand a directory, glob pattern or single path into sorted .xlsx paths."""
+    if os.path.isdir(spec):
+        paths = glob.glob(os.path.join(spec, "*.xlsx"))
+    elif glob.has_magic(spec):
+        paths = glob.glob(spec)
+    else:
+        paths = [spec] if os.path.exists(spec) else []
+    # Skip Excel's "~$name.xlsx" lock files left next to open workbooks
+    return sorted(os.path.abspath(p) for p in paths if not os.path.basename(p).startswith("~$"))
+
+
+def workbook_label(path):
+    return os.path.splitext(os.path.basename(path))[0].strip()
+
+
+def collection_fingerprint(paths):
+    """Fingerprint of the whole set: changes when any file is added, removed or edited."""
+    return stable_key([(p, content_hash(p)) for p in paths])
+
+
+def load_workbook_file(path):
+    """Worker: ``(fingerprint, (df_papers, df_clients, df_info, paper_authors))`` for one file."""
+    fingerprint = content_hash(path)
+    data = read_snapshot(path, fingerprint)
+    if data is None:
+        data = WorkbookCache().load(path)
+        write_snapshot(path, fingerprint, data)
+    return fingerprint, data
+
+
+def _pool_context():
+    # Forking a server that runs threads is unsafe; forkserver keeps worker
+    # start-up cheap where it exists
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _tag(df, label, prefix_source=False):
+    if df.empty:
+        return df
+    df = df.copy()
+    if prefix_source:
+        df["Source"] = label + " / " + df["Source"].astype(str)
+    df["Workbook"] = label
+    return df
+
+
+class WorkbookCollection:
+    """Parsed workbooks of a collection, re-parsed only when a file changes."""
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._files = {}
+        self.errors = []
+
+    def _parse(self, paths):
+        results = {}
+        workers = min(len(paths), self.max_workers or os.cpu_count() or 1)
+        if workers <= 1:
+            # One file or one core: a pool would only add start-up cost
+            for path in paths:
+                try:
+                    results[path] = load_workbook_file(path)
+                except Exception as e:
+                    results[path] = e
+            return results
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+            futures = {path: pool.submit(load_workbook_file, path) for path in paths}
+            for path, future in futures.items():
+                try:
+                    results[path] = future.result()
+                except Exception as e:
+                    # Also covers a worker killed mid-parse (BrokenProcessPool)
+                    results[path] = e
+        return results
+
+    def load(self, paths):
+        """Return ``(df_papers, df_clients, df_info, paper_authors)`` for ``paths``.
+
+        Files that failed are left out and listed in ``self.errors`` as
+        ``(path, message)`` pairs.
+        """
+        with self._lock:
+            hashes, errors = {}, []
+            for path in paths:
+                try:
+                    hashes[path] = content_hash(path)
+                except OSError as e:
+                    errors.append((path, f"{type(e).__name__}: {e}"))
+            stale = [p for p in hashes if self._files.get(p, (None,))[0] != hashes[p]]
+            for path, result in self._parse(stale).items():
+                if isinstance(result, Exception):
+                    self._files.pop(path, None)
+                    errors.append((path, f"{type(result).__name__}: {result}"))
+                else:
+                    self._files[path] = result
+            for path in set(self._files) - set(hashes):
+                del self._files[path]
+
+            papers, clients, info, authors = [], [], [], []
+            for path in paths:
+                if path not in self._files:
+                    continue
+                label = workbook_label(path)
+                df_papers, df_clients, df_info, paper_authors = self._files[path][1]
+                if not df_papers.empty:
+                    # Paper labels become positions in the merged frame
+                    offset = sum(len(p) for p in papers)
+                    authors.append(paper_authors.assign(Paper=paper_authors["Paper"] + offset))
+                    papers.append(_tag(df_papers, label, prefix_source=True))
+                clients.append(_tag(df_clients, label))
+                info.append(_tag(df_info, label))
+            self.errors = sorted(errors)
+            if not papers:
+                return (pd.DataFrame(), _concat(clients), _concat(info),
+                        build_paper_authors(pd.DataFrame()))
+            # Per-file categories differ; compacting again unifies them. The
+            # same people appear in several files, so identities are resolved
+            # again over the merged authors
+            merged_authors = resolve_authors(_concat(authors).drop(columns="Author_Id"))
+            return (compact_papers(concat_paper_frames(papers)), _concat(clients), _concat(info),
+                    compact_authors(merged_authors[AUTHOR_COLUMNS]))
+
+
+def _concat(frames):
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,77 @@
+"""Where the tracker data comes from, and how it is loaded.
+
+A ``WorkbookSource`` is either one workbook or a directory/glob of them.
+It knows the fingerprint of what is on disk, the folders to watch for
+changes and how to load a revision: from the Parquet snapshot when it is
+current, otherwise by parsing only what changed since the last load.
+"""
+import os
+
+import pandas as pd
+
+from tracker.cache import WorkbookCache, content_hash
+from tracker.collection import WorkbookCollection, collection_fingerprint, resolve_workbooks
+from tracker.snapshot import read_snapshot, write_snapshot
+
+
+def empty_dataset():
+    return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+
+
+class WorkbookSource:
+
+    def __init__(self, path=None, directory=None):
+        if (path is None) == (directory is None):
+            raise ValueError("pass exactly one of path or directory")
+        self.path = path
+        self.directory = directory
+        self._cache = WorkbookCache()
+        self._collection = WorkbookCollection()
+
+    @property
+    def errors(self):
+        """``(path, message)`` for workbooks skipped by the last directory load."""
+        return self._collection.errors if self.directory else []
+
+    def files(self):
+        if self.directory:
+            return resolve_workbooks(self.directory)
+        return [self.path] if os.path.exists(self.path) else []
+
+    def fingerprint(self):
+        """Identifies the revision on disk; None when there is nothing to load."""
+        files = self.files()
+        if not files:
+            return None
+        if self.directory:
+            return collection_fingerprint(files)
+        return content_hash(self.path)
+
+    def folders(self):
+        if self.directory is None:
+            return [os.path.dirname(os.path.abspath(self.path))]
+        if os.path.isdir(self.directory):
+            return [self.directory]
+        return [os.path.dirname(p) for p in self.files()]
+
+    def load(self, fingerprint=None):
+        """``(df_papers, df_clients, df_info, paper_authors)`` for ``fingerprint``.
+
+        Without a fingerprint the current revision on disk is loaded.
+        """
+        if fingerprint is None:
+            fingerprint = self.fingerprint()
+            if fingerprint is None:
+                return empty_dataset()
+        if self.directory:
+            return self._collection.load(self.files())
+        data = read_snapshot(self.path, fingerprint)
+        if data is None:
+            data = self._cache.load(self.path)
+            write_snapshot(self.path, fingerprint, data)
+        return data
+
+
+def load_data(path=None, directory=None):
+    """Load the current tracker data without a dashboard around it."""
+    return WorkbookSource(path, directory).load()
@@ -0,0 +1,132 @@
+"""Streaming export of a selection to CSV, Parquet and XLSX.
+
+The rows come from a backend's ``iter_rows``/``iter_authors`` a chunk at a
+time and each chunk is written before the next is fetched, so an export of
+the whole tracker never holds more than one chunk besides the data itself.
+Three exports exist: ``papers`` (one row per paper), ``authors`` (one row
+per author slot, with the paper it belongs to) and ``author_stats`` (papers
+and amount per author, which is small and written in one piece).
+"""
+import io
+
+import pandas as pd
+
+from tracker.backend import AUTHOR_ROW_COLUMNS, PAPER_ROW_COLUMNS
+
+EXPORTS = ("papers", "authors", "author_stats")
+EXPORT_FORMATS = ("csv", "parquet", "xlsx")
+EXPORT_MIME_TYPES = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+CHUNK_ROWS = 10_000
+XLSX_MAX_ROWS = 1_048_575  # data rows per sheet below the header
+
+
+def export_chunks(backend, sel, what, chunk_size=CHUNK_ROWS):
+    """``(columns, chunks)`` of one export of the selection."""
+    if what == "papers":
+        return PAPER_ROW_COLUMNS, backend.iter_rows(sel, PAPER_ROW_COLUMNS, chunk_size)
+    if what == "authors":
+        return AUTHOR_ROW_COLUMNS, backend.iter_authors(sel, chunk_size)
+    if what == "author_stats":
+        stats = backend.author_stats(sel)
+        return list(stats.columns), iter([stats])
+    raise ValueError(f"unknown export {what!r}")
+
+
+def _plain(chunk):
+    # Categoricals carry per-chunk dictionaries; writers want plain values
+    categories = chunk.select_dtypes("category").columns
+    return chunk.astype({c: "str" for c in categories}) if len(categories) else chunk
+
+
+def _write_csv(chunks, out):
+    text = io.TextIOWrapper(out, encoding="utf-8", newline="")
+    try:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(text, index=False, header=i == 0)
+    finally:
+        text.flush()
+        text.detach()
+
+
+def _write_parquet(chunks, out):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in chunks:
+            if writer is None:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                writer = pq.ParquetWriter(out, table.schema)
+            else:
+                table = pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _write_xlsx(chunks, out, title):
+    import openpyxl
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws, written = None, XLSX_MAX_ROWS
+
+    def new_sheet(header):
+        sheet = wb.create_sheet(title if not wb.worksheets else f"{title} ({len(wb.worksheets) + 1})")
+        sheet.append(header)
+        return sheet
+
+    for chunk in chunks:
+        header = list(chunk.columns)
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        for row in chunk.itertuples(index=False, name=None):
+            if written == XLSX_MAX_ROWS:
+                # Past Excel's row limit the export continues on a new sheet
+                ws, written = new_sheet(header), 0
+            ws.append(row)
+            written += 1
+    if ws is None:
+        new_sheet(header)
+    wb.save(out)
+
+
+def write_export(columns, chunks, out, fmt, title="Export"):
+    """Write ``chunks`` to ``out`` (a path or binary file); returns the row count."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"unknown export format {fmt!r}")
+    rows = 0
+
+    def counted():
+        nonlocal rows
+        empty = True
+        for chunk in chunks:
+            empty = False
+            rows += len(chunk)
+            yield _plain(chunk)
+        if empty:
+            # Headers (and a schema) even when nothing matched
+            yield pd.DataFrame({c: pd.Series(dtype=object) for c in columns})
+
+    handle = open(out, "wb") if isinstance(out, str) else out
+    try:
+        if fmt == "csv":
+            _write_csv(counted(), handle)
+        elif fmt == "parquet":
+            _write_parquet(counted(), handle)
+        else:
+            _write_xlsx(counted(), handle, title)
+    finally:
+        if isinstance(out, str):
+            handle.close()
+    return rows
+
+
+def export_selection(backend, sel, what, out, fmt, chunk_size=CHUNK_ROWS):
+    """Export ``what`` for the selection ``sel`` (None: everything) to ``out``."""
+    columns, chunks = export_chunks(backend, sel, what, chunk_size)
+    return write_export(columns, chunks, out, fmt, title=what)
@@ -0,0 +1,185 @@
+"""Append-only history of the parsed papers, for trend analytics.
+
+Every distinct revision of ``df_papers`` is recorded as a delta against
+the previous one: only the papers whose content changed (or that were
+added) are written, plus tombstones for the ones that disappeared, as a
+small zstd-compressed Parquet file. ``revisions.jsonl`` lists the deltas
+in order with the workbook fingerprint and the time they were recorded.
+Nothing is ever rewritten, so storage grows with the edits made to the
+tracker and not with how often it is loaded.
+
+A paper is identified by its Source and SNo (and its position among
+papers sharing both, should a sheet repeat an SNo). Replaying the deltas
+rebuilds the tracker as it was at each revision, which is all the trend
+section needs: old workbooks are never read again.
+"""
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+
+KEY_COLUMNS = ["Source", "SNo", "Dup"]
+HISTORY_COLUMNS = ["Title", "Author_Names", "Num_Authors", "Total_Amount", "Payment_1", "Payment_2",
+                   "Payment_3", "Payment_4", "Payment_5", "Total_Paid", "Balance", "Status"]
+TREND_MEASURES = ["Total_Amount", "Total_Paid", "Balance"]
+INDEX_FILE = "revisions.jsonl"
+NEW, REMOVED = "(new)", "(removed)"
+
+
+def history_rows(df_papers):
+    """Key, content hash and tracked columns of each paper, indexed by key."""
+    frame = df_papers[["Source", "SNo"] + HISTORY_COLUMNS].copy()
+    frame["Source"] = frame["Source"].astype(str)
+    frame["Status"] = frame["Status"].astype(str)
+    frame["Dup"] = frame.groupby(["Source", "SNo"]).cumcount()
+    frame["Hash"] = pd.util.hash_pandas_object(frame[HISTORY_COLUMNS], index=False).to_numpy()
+    return frame.set_index(KEY_COLUMNS)[["Hash"] + HISTORY_COLUMNS]
+
+
+class HistoryStore:
+    """A folder of revision deltas; ``record`` appends, the rest replays."""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self._lock = threading.Lock()
+        self._state = None
+        self._trend = (None, None)
+
+    def revisions(self):
+        try:
+            with open(os.path.join(self.folder, INDEX_FILE)) as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def _deltas(self, revisions):
+        for rev in revisions:
+            if rev["file"] is None:
+                yield rev, None
+                continue
+            delta = pd.read_parquet(os.path.join(self.folder, rev["file"]))
+            yield rev, delta.astype({"Source": "str", "Status": "str"}).set_index(KEY_COLUMNS)
+
+    @staticmethod
+    def _apply(state, delta):
+        # The paper rows after the delta, and the rows it replaced
+        if delta is None or delta.empty:
+            return state, state.iloc[:0]
+        before = state[state.index.isin(delta.index)]
+        kept = state[~state.index.isin(delta.index)]
+        changed = delta[~delta["Removed"]].drop(columns="Removed")
+        return pd.concat([kept, changed]), before
+
+    def _current(self, revisions):
+        if self._state is None or self._state[0] != len(revisions):
+            state = history_rows(pd.DataFrame(columns=["Source", "SNo"] + HISTORY_COLUMNS))
+            for _, delta in self._deltas(revisions):
+                state, _ = self._apply(state, delta)
+            self._state = (len(revisions), state)
+        return self._state[1]
+
+    def record(self, fingerprint, df_papers, recorded_at=None):
+        """Append the revision ``fingerprint`` unless it is the latest one already."""
+        if df_papers.empty:
+            return False
+        with self._lock:
+            revisions = self.revisions()
+            if revisions and revisions[-1]["fingerprint"] == fingerprint:
+                return False
+            state = self._current(revisions)
+            rows = history_rows(df_papers)
+            old_hash = state["Hash"].astype("UInt64").reindex(rows.index)
+            changed = rows[old_hash.ne(rows["Hash"]).fillna(True).to_numpy(dtype=bool)]
+            gone = state.index[~state.index.isin(rows.index)]
+            delta = pd.concat([
+                changed.assign(Removed=False),
+                state.loc[gone].assign(Removed=True),
+            ])
+            seq = len(revisions) + 1
+            filename = None
+            if len(delta):
+                # Removed rows keep their last values: the trend reads
+                # their status from the delta alone
+                os.makedirs(self.folder, exist_ok=True)
+                filename = f"delta-{seq:06d}-{fingerprint[:12]}.parquet"
+                tmp = os.path.join(self.folder, filename + ".tmp")
+                delta.reset_index().astype({"Status": "category", "Source": "category"}).to_parquet(
+                    tmp, index=False, compression="zstd")
+                os.replace(tmp, os.path.join(self.folder, filename))
+            entry = {"seq": seq, "fingerprint": fingerprint, "recorded_at": recorded_at or time.time(),
+                     "file": filename, "changed": len(changed), "removed": len(gone)}
+            os.makedirs(self.folder, exist_ok=True)
+            with open(os.path.join(self.folder, INDEX_FILE), "a") as f:
+                f.write(json.dumps(entry) + "\n")
+            self._state = (seq, self._apply(state, delta)[0])
+            return True
+
+    def _replay(self, revisions):
+        totals, movements = [], []
+        state = history_rows(pd.DataFrame(columns=["Source", "SNo"] + HISTORY_COLUMNS))
+        for rev, delta in self._deltas(revisions):
+            first = state.empty
+            state, before = self._apply(state, delta)
+            when = pd.Timestamp.fromtimestamp(rev["recorded_at"])
+            totals.append({"Recorded": when, "Papers": len(state),
+                           **{m: float(state[m].sum()) for m in TREND_MEASURES},
+                           "Collected": 0.0 if first else _collected(delta, before),
+                           **state["Status"].value_counts().to_dict()})
+            if delta is None or delta.empty:
+                continue
+            old = before["Status"].reindex(delta.index).fillna(NEW)
+            new = delta["Status"].where(~delta["Removed"], REMOVED)
+            moved = pd.DataFrame({"From": old.to_numpy(), "To": new.astype(str).to_numpy()})
+            moved = moved[moved["From"] != moved["To"]]
+            for (src, dst), n in moved.value_counts().items():
+                movements.append({"Recorded": when, "From": src, "To": dst, "Papers": int(n)})
+        trend = pd.DataFrame(totals)
+        if len(trend):
+            statuses = trend.columns[len(TREND_MEASURES) + 3:]
+            trend[statuses] = trend[statuses].fillna(0).astype("int64")
+        return trend, pd.DataFrame(movements, columns=["Recorded", "From", "To", "Papers"])
+
+    def replay(self):
+        """``(trend, movements)`` over all revisions, recomputed only after ``record``.
+
+        ``trend`` has one row per revision: its time, paper count, money
+        totals, the amount collected in it and a column per status. ``movements`` counts the papers that
+        changed status in each revision, from (new) and to (removed) included.
+        """
+        revisions = self.revisions()
+        with self._lock:
+            if self._trend[0] != len(revisions):
+                self._trend = (len(revisions), self._replay(revisions))
+            return self._trend[1]
+
+
+def _collected(delta, before):
+    # Payments recorded in a revision: how much each added or changed paper's
+    # Total_Paid went up. Removing papers or lowering an amount (a correction)
+    # collects nothing rather than a negative amount.
+    if delta is None or delta.empty:
+        return 0.0
+    paid = delta.loc[~delta["Removed"], "Total_Paid"]
+    previous = before["Total_Paid"].reindex(paid.index).fillna(0.0)
+    return float((paid - previous).clip(lower=0).sum())
+
+
+def daily_trend(trend):
+    """The last revision of each day, with the amount collected that day."""
+    if trend.empty:
+        return trend
+    days = trend.groupby(trend["Recorded"].dt.normalize())
+    daily = days.last().drop(columns="Recorded")
+    daily["Collected"] = days["Collected"].sum()
+    daily.index.name = "Date"
+    return daily.reset_index()
+
+
+def daily_movements(movements):
+    """Status changes summed per day."""
+    if movements.empty:
+        return pd.DataFrame(columns=["Date", "From", "To", "Papers"])
+    moves = movements.assign(Date=movements["Recorded"].dt.normalize())
+    return moves.groupby(["Date", "From", "To"], as_index=False)["Papers"].sum()
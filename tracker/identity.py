@@ -0,0 +1,200 @@
+"""Author identity resolution over the long-form author table.
+
+The same person is written many ways across papers: "Dr. R. Kumar",
+"R Kumar", "Kumar R.", "Ravi Kumar". ``resolve_authors`` clusters the
+author rows into people and gives each an ``Author_Id``:
+
+* names are reduced to their sorted word tokens without titles, so word
+  order, case, punctuation and "Dr."/"Prof." no longer matter;
+* names that abbreviate one another ("R Kumar" and "Ravi Kumar") are
+  merged when the abbreviation is not ambiguous: if "R Kumar" could be
+  Ravi or Rajesh Kumar it is left on its own;
+* names sharing an email are merged when they can be the same person
+  ("Deepa" and "Deepa S"); an email used by unrelated names, or by two
+  names on the same paper, is a team address and links nobody. Filler
+  values ("nil", "0", "na@na.com") are not emails.
+
+Only distinct names are compared, and only within a sorted neighbourhood:
+each name is filed under each of its full words and compared with the few
+names next to it in that order, so the cost grows with the number of
+distinct names rather than with their pairs.
+
+``Author_Id`` is a hash of the most complete name in the cluster, so an id
+stays the same across reloads as long as that name is part of the data.
+It is computed at load time and stored with the parsed data, so snapshots
+and the SQLite store carry it per fingerprint.
+"""
+import hashlib
+import re
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+TITLES = frozenset({"dr", "prof", "professor", "mr", "mrs", "ms", "miss"})
+# Values that look like an address but stand for "none"; anything without
+# a local part, "@" and a dotted domain is ignored anyway
+EMAIL_PLACEHOLDERS = frozenset({"na@na.com", "nil@nil.com", "none@none.com", "test@test.com",
+                                "abc@abc.com", "xyz@xyz.com", "no@email.com"})
+_EMAIL = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+WINDOW = 8
+_WORD = re.compile(r"[^\W\d_]+")
+
+
+def name_tokens(name):
+    """Sorted lowercase words of ``name`` without titles; initials stay as letters.
+
+    Run-together initials ("Divya VK") are split into letters, unless the
+    whole name is written in capitals.
+    """
+    name = str(name)
+    words = []
+    for word in _WORD.findall(name):
+        if word.lower() in TITLES:
+            continue
+        if len(word) <= 3 and word.isupper() and not name.isupper():
+            words.extend(word.lower())
+        else:
+            words.append(word.lower())
+    return tuple(sorted(words))
+
+
+def _covers(longer, shorter):
+    # Every word of ``shorter`` is a word of ``longer`` and every initial
+    # the first letter of one of its other words
+    rest = list(longer)
+    for word in sorted(shorter, key=len, reverse=True):
+        if len(word) > 1:
+            if word not in rest:
+                return False
+            rest.remove(word)
+        else:
+            match = next((w for w in rest if w[0] == word), None)
+            if match is None:
+                return False
+            rest.remove(match)
+    return True
+
+
+def _abbreviates(a, b):
+    # One of the names is the other, shortened
+    if len(a) < len(b):
+        a, b = b, a
+    return _covers(a, b) or (len(a) == len(b) and _covers(b, a))
+
+
+def compatible(a, b):
+    """Whether token tuples ``a`` and ``b`` can name the same person."""
+    if a == b:
+        return True
+    if len(a) < 2 or len(b) < 2 or not {w for w in a if len(w) > 1} & set(b):
+        return False
+    return _abbreviates(a, b)
+
+
+def _same_email_owner(tokens, nodes):
+    # With an email in common a single word ("Deepa") is enough, but every
+    # name using it must still abbreviate every other one
+    return all(_abbreviates(tokens[x], tokens[y])
+               for i, x in enumerate(nodes) for y in nodes[i + 1:])
+
+
+class _UnionFind:
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i, j):
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            self.parent[max(ri, rj)] = min(ri, rj)
+
+
+def _neighbour_pairs(tokens):
+    # Sorted neighbourhood: file each name under each of its full words,
+    # sort by (word, initials of the rest, name) and pair names a few
+    # places apart under the same word
+    entries = []
+    for node, toks in enumerate(tokens):
+        for word in set(toks):
+            if len(word) > 1:
+                others = "".join(sorted(t[0] for t in toks if t != word))
+                entries.append((word, others, toks, node))
+    entries.sort()
+    for i, (word, _, _, node) in enumerate(entries):
+        for j in range(i + 1, min(i + WINDOW, len(entries))):
+            if entries[j][0] != word:
+                break
+            yield node, entries[j][3]
+
+
+def _cluster(tokens, email_groups):
+    uf = _UnionFind(len(tokens))
+    candidates = defaultdict(set)
+    for a, b in _neighbour_pairs(tokens):
+        if a != b and compatible(tokens[a], tokens[b]):
+            candidates[a].add(b)
+            candidates[b].add(a)
+    # A name joins its candidates only if they agree with each other; "R
+    # Kumar" next to both "Ravi" and "Rajesh Kumar" is linked to neither
+    consistent = {
+        node: all(compatible(tokens[x], tokens[y]) for x in others for y in others if x < y)
+        for node, others in candidates.items()
+    }
+    for node, others in candidates.items():
+        for other in others:
+            if consistent[node] and consistent[other]:
+                uf.union(node, other)
+    for nodes in email_groups:
+        if not _same_email_owner(tokens, nodes):
+            continue
+        for other in nodes[1:]:
+            uf.union(nodes[0], other)
+    return [uf.find(i) for i in range(len(tokens))]
+
+
+def _stable_id(names):
+    # The most complete spelling names the cluster
+    rep = max(names, key=lambda t: (sum(len(w) > 1 for w in t), len(t), len(" ".join(t)), t))
+    return "A" + hashlib.sha1(" ".join(rep).encode()).hexdigest()[:10]
+
+
+def resolve_authors(paper_authors):
+    """``paper_authors`` with an ``Author_Id`` column (categorical) added."""
+    if paper_authors.empty:
+        return paper_authors.assign(Author_Id=pd.Categorical([]))
+    names = paper_authors["Name"].astype(str)
+    distinct = pd.unique(names.to_numpy())
+    toks = [name_tokens(n) or (n.strip().lower(),) for n in distinct]
+    # Nodes are distinct token tuples: spellings that differ only in order,
+    # case, punctuation or titles are one node from the start
+    node_of_tokens = {}
+    for t in toks:
+        node_of_tokens.setdefault(t, len(node_of_tokens))
+    tokens = list(node_of_tokens)
+    node = pd.Series([node_of_tokens[t] for t in toks], index=distinct)
+    nodes = node.reindex(names.to_numpy()).to_numpy()
+
+    emails = paper_authors["Email"].astype(str).str.strip().str.lower().to_numpy()
+    links = pd.DataFrame({"Paper": paper_authors["Paper"].to_numpy(), "Email": emails, "Node": nodes})
+    links = links[links["Email"].str.fullmatch(_EMAIL) & ~links["Email"].isin(EMAIL_PLACEHOLDERS)]
+    per_paper = links.groupby(["Email", "Paper"])["Node"].nunique()
+    shared = set(per_paper[per_paper > 1].index.get_level_values("Email"))
+    email_groups = [
+        np.unique(group).tolist()
+        for email, group in links.groupby("Email")["Node"] if email not in shared
+    ]
+
+    roots = _cluster(tokens, email_groups)
+    members = defaultdict(list)
+    for n, root in enumerate(roots):
+        members[root].append(tokens[n])
+    ids = {root: _stable_id(names_) for root, names_ in members.items()}
+    author_id = np.array([ids[root] for root in roots], dtype=object)[nodes]
+    return paper_authors.assign(Author_Id=pd.Categorical(author_id))
@@ -0,0 +1,172 @@
+"""Background reload of the dataset when its workbooks change on disk.
+
+``LiveDataset`` holds the current ``(version, fingerprint, data)`` state of
+the dashboard. A watcher on the workbook folders (inotify through
+``watchdog`` when it is installed, a polling thread otherwise) wakes a
+single reload thread, so however many sessions are open the file is parsed
+once per change. The new dataset is built completely before it replaces
+the old state in one assignment; readers see either the old or the new
+dataset, never a mix. Sessions compare ``version`` with the one they last
+rendered to know when to rerun.
+"""
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+
+log = logging.getLogger(__name__)
+
+LiveState = namedtuple("LiveState", "version fingerprint data loaded_at")
+# Events that can change a workbook's content; reads (opened, closed without
+# writing) don't, and the reload's own read must not trigger another reload
+CHANGE_EVENTS = frozenset({"created", "modified", "moved", "deleted", "closed"})
+
+
+class _PollingWatcher:
+    """Fallback watcher: wakes the reload thread every ``interval`` seconds.
+
+    The reload itself is cheap when nothing changed, because fingerprints
+    are only recomputed for files whose mtime or size moved.
+    """
+
+    def __init__(self, callback, interval):
+        self._callback = callback
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="tracker-poll", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            self._callback()
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+
+def _inotify_watcher(folders, callback):
+    """A watchdog observer on ``folders``, or None when watchdog is missing."""
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.event_type not in CHANGE_EVENTS:
+                return
+            # Editors save by writing a temp file and renaming it over the
+            # workbook, so look at both ends of a move
+            for path in (event.src_path, getattr(event, "dest_path", "")):
+                name = os.path.basename(os.fsdecode(path))
+                if name.endswith(".xlsx") and not name.startswith("~$"):
+                    callback()
+                    return
+
+    observer = Observer()
+    observer.daemon = True
+    handler = Handler()
+    for folder in folders:
+        observer.schedule(handler, folder, recursive=False)
+    return observer
+
+
+class LiveDataset:
+    """The current dataset, reloaded in the background when the files change.
+
+    ``fingerprint()`` identifies the revision on disk (None when there is
+    nothing to load) and ``load(fingerprint)`` builds the dataset for it.
+    """
+
+    def __init__(self, fingerprint, load, folders, debounce=0.5, poll_interval=2.0):
+        self._fingerprint = fingerprint
+        self._load = load
+        self._folders = [f for f in dict.fromkeys(folders) if os.path.isdir(f)]
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.state = LiveState(0, None, None, None)
+        self.error = None
+        self._failed = None
+        self._dirty = threading.Event()
+        self._stopped = threading.Event()
+        self._watcher = None
+        self._thread = None
+
+    @property
+    def version(self):
+        return self.state.version
+
+    def reload(self, raise_errors=False):
+        """Load the revision on disk if it differs from the current one.
+
+        A failed load (typically a workbook caught half-written) keeps the
+        previous dataset and is retried only once the files change again.
+        """
+        current = self.state
+        fingerprint = None
+        try:
+            fingerprint = self._fingerprint()
+            if current.version and fingerprint == current.fingerprint:
+                # Back to the revision already shown, e.g. a bad save undone
+                self.error = self._failed = None
+                return False
+            if fingerprint is not None and fingerprint == self._failed:
+                return False
+            data = self._load(fingerprint)
+        except Exception as e:
+            if raise_errors:
+                raise
+            self._failed = fingerprint
+            self.error = f"{type(e).__name__}: {e}"
+            log.warning("Reload failed, keeping the previous data: %s", self.error)
+            return False
+        self.error = self._failed = None
+        self.state = LiveState(current.version + 1, fingerprint, data, time.time())
+        return True
+
+    def notify(self):
+        self._dirty.set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._dirty.wait()
+            if self._stopped.is_set():
+                return
+            # Let a burst of events (temp file, rename, metadata) settle so
+            # one save is one reload
+            while True:
+                self._dirty.clear()
+                if not self._stopped.wait(self.debounce) and self._dirty.is_set():
+                    continue
+                break
+            self.reload()
+
+    def start(self):
+        """Load synchronously once, then watch for changes in the background."""
+        self.reload(raise_errors=True)
+        self._thread = threading.Thread(target=self._run, name="tracker-reload", daemon=True)
+        self._thread.start()
+        watcher = None
+        if self._folders:
+            try:
+                watcher = _inotify_watcher(self._folders, self.notify)
+                if watcher is not None:
+                    watcher.start()
+            except OSError as e:
+                # e.g. the inotify watch limit is exhausted
+                log.warning("File watching unavailable, polling instead: %s", e)
+                watcher = None
+        self._watcher = watcher or _PollingWatcher(self.notify, self.poll_interval)
+        if watcher is None:
+            self._watcher.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._dirty.set()
+        if self._watcher is not None:
+            self._watcher.stop()
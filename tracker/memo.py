@@ -0,0 +1,58 @@
+"""Bounded memoization keyed by a stable hash of the inputs."""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+def stable_key(*parts):
+    """Hash JSON-able parts into a key that is stable across processes."""
+    blob = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha1(blob.encode()).hexdigest()
+
+
+class LRUCache:
+    """Thread-safe LRU store with hit/miss counters.
+
+    ``None`` is a valid cached value, so builders can memoize "nothing to
+    draw" as well.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key, build, *args, **kwargs):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is not _MISSING:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        # Built outside the lock; two sessions racing on the same key just
+        # build it twice
+        value = build(*args, **kwargs)
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits, "misses": self.misses, "size": len(self._data),
+                "maxsize": self.maxsize, "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
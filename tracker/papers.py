@@ -0,0 +1,285 @@
+"""Parsing of the "work" sheets into one row per paper.
+
+``parse_paper_sheet`` is the original row-by-row parser and is kept as the
+reference implementation. ``parse_paper_frame`` produces exactly the same
+frame working on whole columns at once and is what the loader uses.
+``compact_papers`` turns the parsed frame into the layout that is kept in
+memory once the author table has been built from it.
+"""
+import numpy as np
+import pandas as pd
+
+from tracker.status import classify_status, status_rules
+
+HEADER_ROWS = 3
+SNO_COL, TITLE_COL, STATUS_COL = 1, 2, 26
+AUTHOR_COLS = [(3, 4, 5), (6, 7, 8), (9, 10, 11), (12, 13, 14), (15, 16, 17)]
+TOTAL_AMOUNT_COL = 18
+PAYMENT_COLS = [19, 20, 21, 22, 23]
+TOTAL_PAID_COL = 24
+BALANCE_COL = 25
+
+AUTHOR_PLACEHOLDERS = ("", "nan", "not available", "-", "can add", "can add authors")
+
+PAPER_COLUMNS = [
+    "SNo", "Title", "Authors", "Author_Names", "Num_Authors", "Total_Amount",
+    "Payment_1", "Payment_2", "Payment_3", "Payment_4", "Payment_5",
+    "Total_Paid", "Balance", "Status", "Status_Raw", "Source",
+]
+
+# Repeated strings become categoricals and counts small ints, when their
+# values fit. Money stays float64 so that totals add up exactly as before.
+CATEGORY_COLUMNS = ["Status", "Status_Raw", "Source"]
+COMPACT_INTS = {"SNo": "int32", "Num_Authors": "int8"}
+
+
+def int_downcasts(df, targets):
+    """The ``{column: dtype}`` of ``targets`` whose values fit in that dtype."""
+    dtypes = {}
+    for column, dtype in targets.items():
+        if column not in df.columns or not pd.api.types.is_integer_dtype(df[column]):
+            continue
+        info = np.iinfo(dtype)
+        values = df[column]
+        if values.empty or (info.min <= values.min() and values.max() <= info.max):
+            dtypes[column] = dtype
+    return dtypes
+
+
+def safe_float(val):
+    if pd.isna(val):
+        return 0.0
+    if isinstance(val, (int, float)):
+        return float(val)
+    s = str(val).strip().replace(",", "").replace("Nill", "0").replace("nill", "0").replace("NIL", "0").replace("-", "0")
+    try:
+        return float(s)
+    except ValueError:
+        return 0.0
+
+
+def parse_paper_sheet(df, sheet_name):
+    papers = []
+    for i in range(HEADER_ROWS, len(df)):
+        row = df.iloc[i]
+        sno = row.iloc[SNO_COL]
+        if pd.isna(sno):
+            continue
+        try:
+            sno_int = int(float(sno))
+        except (ValueError, TypeError):
+            continue
+
+        authors = []
+        for name_col, amt_col, email_col in AUTHOR_COLS:
+            name = str(row.iloc[name_col]).strip() if pd.notna(row.iloc[name_col]) else ""
+            amt = safe_float(row.iloc[amt_col])
+            email = str(row.iloc[email_col]).strip() if pd.notna(row.iloc[email_col]) else ""
+            if name and name.lower() not in AUTHOR_PLACEHOLDERS:
+                authors.append({"name": name, "amount": amt, "email": email})
+
+        status_raw = str(row.iloc[STATUS_COL]).strip() if len(row) > STATUS_COL and pd.notna(row.iloc[STATUS_COL]) else ""
+        status = classify_status(status_raw)
+
+        # Parse individual payments
+        p1, p2, p3, p4, p5 = (safe_float(row.iloc[c]) for c in PAYMENT_COLS)
+        sum_payments = p1 + p2 + p3 + p4 + p5
+
+        # Auto-calculate: if Total_Paid is 0 but individual payments exist, sum them
+        total_paid_raw = safe_float(row.iloc[TOTAL_PAID_COL])
+        total_paid = total_paid_raw if total_paid_raw > 0 else sum_payments
+
+        # Auto-calculate: if Total_Amount is 0 but payments/balance exist, compute it
+        total_amount_raw = safe_float(row.iloc[TOTAL_AMOUNT_COL])
+        balance_raw = safe_float(row.iloc[BALANCE_COL])
+        if total_amount_raw > 0:
+            total_amount = total_amount_raw
+        elif total_paid > 0 and balance_raw > 0:
+            total_amount = total_paid + balance_raw
+        elif total_paid > 0:
+            total_amount = total_paid
+        else:
+            total_amount = 0.0
+
+        # Balance: if raw is 0 but we can compute it, do so
+        balance = balance_raw if balance_raw > 0 else max(total_amount - total_paid, 0)
+
+        papers.append({
+            "SNo": sno_int,
+            "Title": str(row.iloc[TITLE_COL]).strip() if pd.notna(row.iloc[TITLE_COL]) else "",
+            "Authors": authors,
+            "Author_Names": ", ".join([a["name"] for a in authors]),
+            "Num_Authors": len(authors),
+            "Total_Amount": total_amount,
+            "Payment_1": p1,
+            "Payment_2": p2,
+            "Payment_3": p3,
+            "Payment_4": p4,
+            "Payment_5": p5,
+            "Total_Paid": total_paid,
+            "Balance": balance,
+            "Status": status,
+            "Status_Raw": status_raw,
+            "Source": sheet_name.strip(),
+        })
+    return papers
+
+
+# ============================================================
+# VECTORIZED PATH
+# ============================================================
+def _map_distinct(col, func, na_value):
+    # Apply a scalar function once per distinct non-null value and map the
+    # results back onto the column.
+    out = pd.Series(na_value, index=col.index, dtype=object)
+    mask = col.notna().to_numpy()
+    if mask.any():
+        present = col[mask]
+        lookup = {v: func(v) for v in present.unique()}
+        out[mask] = present.map(lookup)
+    return out
+
+
+def _floats(col):
+    if pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col):
+        return col.astype("float64").fillna(0.0).to_numpy()
+    return _map_distinct(col, safe_float, 0.0).to_numpy(dtype="float64")
+
+
+def _strings(col):
+    return _map_distinct(col, lambda v: str(v).strip(), "").to_numpy(dtype=object)
+
+
+def _sno(col):
+    def to_int(v):
+        try:
+            return int(float(v))
+        except (ValueError, TypeError):
+            return None
+    return _map_distinct(col, to_int, None)
+
+
+def _author_lists(body, n):
+    # Stack the five (name, amount, email) triplets into (n, 5) blocks;
+    # raveling them row-major gives the long form already in paper/slot
+    # order, so per-paper lists are plain slices of it.
+    names = np.column_stack([_strings(body.iloc[:, c]) for c, _, _ in AUTHOR_COLS]).ravel()
+    amounts = np.column_stack([_floats(body.iloc[:, c]) for _, c, _ in AUTHOR_COLS]).ravel()
+    emails = np.column_stack([_strings(body.iloc[:, c]) for _, _, c in AUTHOR_COLS]).ravel()
+
+    is_author = {v: bool(v) and v.lower() not in AUTHOR_PLACEHOLDERS for v in set(names)}
+    keep = np.fromiter((is_author[v] for v in names), dtype=bool, count=len(names))
+    counts = keep.reshape(n, len(AUTHOR_COLS)).sum(axis=1)
+
+    names = names[keep].tolist()
+    records = [
+        {"name": name, "amount": amount, "email": email}
+        for name, amount, email in zip(names, amounts[keep].tolist(), emails[keep].tolist())
+    ]
+    ends = np.cumsum(counts).tolist()
+    starts = [0] + ends[:-1]
+    authors = [records[s:e] for s, e in zip(starts, ends)]
+    author_names = [", ".join(names[s:e]) for s, e in zip(starts, ends)]
+    return authors, author_names, counts
+
+
+def parse_paper_frame(df, sheet_name):
+    """Vectorized equivalent of ``parse_paper_sheet`` returning a frame."""
+    body = df.iloc[HEADER_ROWS:]
+    sno = _sno(body.iloc[:, SNO_COL]) if len(body) else pd.Series(dtype=object)
+    body = body[sno.notna().to_numpy(dtype=bool)]
+    n = len(body)
+    if n == 0:
+        return pd.DataFrame(columns=PAPER_COLUMNS)
+    sno = sno.dropna().astype("int64").to_numpy()
+
+    authors, author_names, num_authors = _author_lists(body, n)
+
+    if body.shape[1] > STATUS_COL:
+        status_raw = _strings(body.iloc[:, STATUS_COL])
+    else:
+        status_raw = np.full(n, "", dtype=object)
+    status = status_rules().classify_values(status_raw)
+
+    p1, p2, p3, p4, p5 = (_floats(body.iloc[:, c]) for c in PAYMENT_COLS)
+    sum_payments = p1 + p2 + p3 + p4 + p5
+
+    total_paid_raw = _floats(body.iloc[:, TOTAL_PAID_COL])
+    total_paid = np.where(total_paid_raw > 0, total_paid_raw, sum_payments)
+
+    total_amount_raw = _floats(body.iloc[:, TOTAL_AMOUNT_COL])
+    balance_raw = _floats(body.iloc[:, BALANCE_COL])
+    total_amount = np.select(
+        [total_amount_raw > 0, (total_paid > 0) & (balance_raw > 0), total_paid > 0],
+        [total_amount_raw, total_paid + balance_raw, total_paid],
+        default=0.0,
+    )
+    balance = np.where(balance_raw > 0, balance_raw, np.maximum(total_amount - total_paid, 0))
+
+    return pd.DataFrame({
+        "SNo": sno,
+        "Title": _strings(body.iloc[:, TITLE_COL]).tolist(),
+        "Authors": authors,
+        "Author_Names": author_names,
+        "Num_Authors": num_authors.astype("int64"),
+        "Total_Amount": total_amount,
+        "Payment_1": p1,
+        "Payment_2": p2,
+        "Payment_3": p3,
+        "Payment_4": p4,
+        "Payment_5": p5,
+        "Total_Paid": total_paid,
+        "Balance": balance,
+        "Status": status.tolist(),
+        "Status_Raw": status_raw.tolist(),
+        "Source": sheet_name.strip(),
+    })
+
+
+def concat_paper_frames(frames):
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def build_papers_frame(paper_sheets):
+    """Parse and concatenate ``(sheet_name, raw_frame)`` pairs."""
+    return concat_paper_frames([parse_paper_frame(raw, sheet) for sheet, raw in paper_sheets])
+
+
+def compact_papers(df_papers):
+    """Drop the nested ``Authors`` lists and shrink dtypes.
+
+    The author data lives on in ``tracker.authors.build_paper_authors``'s
+    table, which must be built before compacting. Applying this twice is
+    harmless, which is how merged frames get unified categories.
+    """
+    if df_papers.empty:
+        return df_papers
+    df = df_papers.drop(columns=["Authors"], errors="ignore")
+    dtypes = {c: "category" for c in CATEGORY_COLUMNS if c in df.columns}
+    dtypes.update(int_downcasts(df, COMPACT_INTS))
+    if "Workbook" in df.columns:
+        dtypes["Workbook"] = "category"
+    return df.astype(dtypes)
+
+
+def expand_papers(df_papers, paper_authors):
+    """Undo ``compact_papers``, to measure what it saves.
+
+    The ``Authors`` lists are rebuilt from ``paper_authors``; the frame is
+    only meant for ``tracker.profiling.memory_report``.
+    """
+    if df_papers.empty:
+        return df_papers
+    dtypes = {c: df_papers[c].cat.categories.dtype for c in [*CATEGORY_COLUMNS, "Workbook"]
+              if c in df_papers.columns and isinstance(df_papers[c].dtype, pd.CategoricalDtype)}
+    dtypes.update({c: "int64" for c in COMPACT_INTS if c in df_papers.columns})
+    df = df_papers.astype(dtypes)
+    lists = {}
+    records = zip(paper_authors["Name"], paper_authors["Amount"], paper_authors["Email"].astype(str))
+    for paper, (name, amount, email) in zip(paper_authors["Paper"].to_numpy(), records):
+        lists.setdefault(paper, []).append({"name": name, "amount": amount, "email": email})
+    df.insert(PAPER_COLUMNS.index("Authors"), "Authors", [lists.get(p, []) for p in df.index])
+    return df
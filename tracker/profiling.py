@@ -0,0 +1,115 @@
+"""Opt-in wall-time and memory profiling of named sections.
+
+A ``SectionProfiler`` is created per rerun. When disabled, ``section()`` is
+a no-op context manager, so instrumented code pays nothing. When enabled,
+each section records its wall time and, through ``tracemalloc``, the
+memory it allocated and kept (``alloc``) plus its transient peak. Sections
+with the same name accumulate, so repeated work such as chart serialization
+shows up as one line with a call count.
+
+tracemalloc is process-wide: with several sessions rerunning at once the
+memory figures include their allocations too. Tracing stays on once
+started, so callers enable ``trace_memory`` only for a process that is
+being profiled as a whole; without it only wall time is recorded. ``memory_report`` is the
+static counterpart: what each column of a loaded frame occupies.
+"""
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+_log_lock = threading.Lock()
+
+
+class SectionProfiler:
+
+    def __init__(self, enabled=False, trace_memory=False):
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self._records = {}
+        self._depth = 0
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def section(self, name):
+        if not self.enabled:
+            yield
+            return
+        outermost = self._depth == 0
+        self._depth += 1
+        if self.trace_memory:
+            mem_before = tracemalloc.get_traced_memory()[0]
+            if outermost:
+                # Nested sections must not reset the peak of the outer one
+                tracemalloc.reset_peak()
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - t0
+            self._depth -= 1
+            rec = self._records.setdefault(name, {
+                "section": name, "nested": not outermost, "calls": 0, "seconds": 0.0,
+                "alloc_bytes": 0 if self.trace_memory else None, "peak_bytes": None,
+            })
+            rec["calls"] += 1
+            rec["seconds"] += seconds
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                rec["alloc_bytes"] += current - mem_before
+                if outermost:
+                    rec["peak_bytes"] = max(rec["peak_bytes"] or 0, peak - mem_before)
+
+    def records(self):
+        return list(self._records.values())
+
+    def total_seconds(self):
+        """Wall time of the outermost sections, without double-counting nesting."""
+        return sum(r["seconds"] for r in self._records.values() if not r["nested"])
+
+    def frame(self):
+        import pandas as pd
+
+        df = pd.DataFrame(self.records(),
+                          columns=["section", "nested", "calls", "seconds", "alloc_bytes", "peak_bytes"])
+        return pd.DataFrame({
+            "Section": df["section"].where(~df["nested"].astype(bool), "  " + df["section"]),
+            "Calls": df["calls"],
+            "Wall (ms)": (df["seconds"] * 1000).round(1),
+            "Alloc (KB)": (df["alloc_bytes"].astype("float64") / 1024).round(1),
+            "Peak (KB)": (df["peak_bytes"].astype("float64") / 1024).round(1),
+        })
+
+    def write_jsonl(self, path, **context):
+        """Append this rerun's records as one JSON line, with ``context``."""
+        line = json.dumps({"ts": time.time(), **context, "sections": self.records()}, default=str)
+        with _log_lock, open(path, "a") as f:
+            f.write(line + "\n")
+
+
+def memory_report(frame, baseline=None):
+    """Deep ``memory_usage`` per column of ``frame``, with a TOTAL row.
+
+    With ``baseline`` (the same data in another layout) the report lines up
+    both, columns missing from either side counting as zero bytes.
+    """
+    import pandas as pd
+
+    def usage(df):
+        return pd.DataFrame({
+            "Column": [str(c) for c in df.columns],
+            "Dtype": [str(t) for t in df.dtypes],
+            "Bytes": df.memory_usage(index=False, deep=True).to_numpy(),
+        })
+
+    report = usage(frame)
+    if baseline is not None:
+        report = usage(baseline).merge(report, on="Column", how="outer", sort=False,
+                                       suffixes=(" before", " after"))
+        for side in ("before", "after"):
+            report[f"Bytes {side}"] = report[f"Bytes {side}"].fillna(0).astype("int64")
+        report["Saved"] = report["Bytes before"] - report["Bytes after"]
+    total = report.select_dtypes("number").sum()
+    return pd.concat([report, total.to_frame().T.assign(Column="TOTAL")], ignore_index=True)
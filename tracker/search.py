@@ -0,0 +1,90 @@
+"""Substring search over paper titles and author names.
+
+Each text column gets a lowercased trigram index, built on first use and
+kept for the lifetime of the loaded dataset. A query of three or more
+characters resolves to candidate rows by intersecting the postings of its
+trigrams, and only those candidates are checked for the actual substring.
+Results are memoized; a query that extends an earlier one (typing another
+character) only re-checks the rows the earlier query matched.
+"""
+import threading
+from collections import OrderedDict, defaultdict
+
+import numpy as np
+import pandas as pd
+
+GRAM = 3
+MEMO_SIZE = 64
+
+
+class TextIndex:
+    """Case-insensitive literal substring search over one text column."""
+
+    def __init__(self, texts):
+        self._texts = [str(t).lower() for t in texts]
+        self._column = pd.Series(self._texts, dtype="str")
+        self._postings = None
+        self._memo = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _build_postings(self):
+        postings = defaultdict(list)
+        for pos, text in enumerate(self._texts):
+            for gram in {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}:
+                postings[gram].append(pos)
+        return {gram: np.array(rows, dtype=np.int64) for gram, rows in postings.items()}
+
+    def _candidates(self, query):
+        # Rows matched by the longest memoized query contained in this one
+        base = max((q for q in self._memo if q in query), key=len, default=None)
+        if base is not None:
+            return self._memo[base]
+        if len(query) < GRAM:
+            return None
+        if self._postings is None:
+            self._postings = self._build_postings()
+        lists = []
+        for gram in {query[i:i + GRAM] for i in range(len(query) - GRAM + 1)}:
+            rows = self._postings.get(gram)
+            if rows is None:
+                return np.empty(0, dtype=np.int64)
+            lists.append(rows)
+        lists.sort(key=len)
+        rows = lists[0]
+        for other in lists[1:]:
+            rows = np.intersect1d(rows, other, assume_unique=True)
+        return rows
+
+    def search(self, query):
+        """Sorted row positions whose text contains ``query``."""
+        query = query.lower()
+        with self._lock:
+            if query in self._memo:
+                self._memo.move_to_end(query)
+                return self._memo[query]
+            candidates = self._candidates(query)
+            texts = self._texts
+            if candidates is None:
+                # Too short for trigrams: one vectorized literal scan
+                hits = np.flatnonzero(self._column.str.contains(query, regex=False).to_numpy())
+            else:
+                hits = [pos for pos in candidates.tolist() if query in texts[pos]]
+            result = np.array(hits, dtype=np.int64)
+            self._memo[query] = result
+            if len(self._memo) > MEMO_SIZE:
+                self._memo.popitem(last=False)
+            return result
+
+
+class SearchIndex:
+    """Per-column ``TextIndex`` objects over a papers frame."""
+
+    def __init__(self, df_papers, columns=("Author_Names", "Title")):
+        self._size = len(df_papers)
+        self._indexes = {c: TextIndex(df_papers[c].tolist()) for c in columns}
+
+    def mask(self, column, query):
+        """Boolean array over the frame's rows matching ``query``."""
+        out = np.zeros(self._size, dtype=bool)
+        out[self._indexes[column].search(query)] = True
+        return out
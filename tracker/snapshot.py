@@ -0,0 +1,106 @@
+"""Parquet sidecar snapshot of the parsed workbook.
+
+The parsed frames are written next to the workbook together with the
+workbook's content hash and a schema version. A fresh process whose
+workbook still matches the snapshot reads the Parquet files instead of
+parsing the xlsx. Bump ``SCHEMA_VERSION`` whenever the layout of the
+parsed frames changes so that older snapshots are rebuilt; snapshots made
+with other status rules are rebuilt too.
+"""
+import json
+import os
+
+import pandas as pd
+
+from tracker.status import status_rules
+
+SCHEMA_VERSION = 5
+TABLES = ("papers", "clients", "info", "authors")
+META_FILE = "meta.json"
+
+
+def snapshot_dir(workbook_path):
+    head, tail = os.path.split(workbook_path)
+    return os.path.join(head, f".{tail}.snapshot")
+
+
+def _to_table(df):
+    import pyarrow as pa
+
+    # Parquet needs string column names; the originals are kept in meta
+    frame = df.copy(deep=False)
+    frame.columns = [str(c) for c in df.columns]
+    return pa.Table.from_pandas(frame, preserve_index=False)
+
+
+def _from_table(table, columns):
+    df = table.to_pandas()
+    if "Authors" in df.columns:
+        # Arrow hands list<struct> back as ndarrays; restore lists of dicts
+        df["Authors"] = table.column("Authors").to_pylist()
+    df.columns = columns
+    return df
+
+
+def read_snapshot(workbook_path, fingerprint):
+    """Return ``(df_papers, df_clients, df_info, paper_authors)`` or None if stale/missing."""
+    import pyarrow.parquet as pq
+
+    folder = snapshot_dir(workbook_path)
+    try:
+        with open(os.path.join(folder, META_FILE)) as f:
+            meta = json.load(f)
+        if (meta.get("schema_version") != SCHEMA_VERSION or meta.get("fingerprint") != fingerprint
+                or meta.get("status_rules") != status_rules().key):
+            return None
+        frames = []
+        for name in TABLES:
+            entry = meta["tables"][name]
+            if entry["file"] is None:
+                frames.append(pd.DataFrame())
+                continue
+            table = pq.read_table(os.path.join(folder, entry["file"]))
+            frames.append(_from_table(table, entry["columns"]))
+        return tuple(frames)
+    except (OSError, ValueError, KeyError):
+        # Missing, half-replaced or unreadable snapshots are simply rebuilt
+        return None
+
+
+def write_snapshot(workbook_path, fingerprint, frames):
+    """Persist the parsed frames; failures leave the previous snapshot alone."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    folder = snapshot_dir(workbook_path)
+    tag = fingerprint[:16]
+    meta = {"schema_version": SCHEMA_VERSION, "fingerprint": fingerprint,
+            "status_rules": status_rules().key, "tables": {}}
+    try:
+        os.makedirs(folder, exist_ok=True)
+        for name, df in zip(TABLES, frames):
+            if df.empty and len(df.columns) == 0:
+                meta["tables"][name] = {"file": None, "columns": []}
+                continue
+            filename = f"{name}-{tag}.parquet"
+            tmp = os.path.join(folder, filename + ".tmp")
+            pq.write_table(_to_table(df), tmp)
+            os.replace(tmp, os.path.join(folder, filename))
+            meta["tables"][name] = {"file": filename, "columns": list(df.columns)}
+        # meta.json is swapped in last, so readers see either the old
+        # snapshot or the complete new one
+        tmp = os.path.join(folder, META_FILE + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(folder, META_FILE))
+    except (OSError, TypeError, ValueError, pa.ArrowException):
+        return False
+
+    current = {e["file"] for e in meta["tables"].values()}
+    for entry in os.listdir(folder):
+        if entry.endswith(".parquet") and entry not in current:
+            try:
+                os.remove(os.path.join(folder, entry))
+            except OSError:
+                pass
+    return True
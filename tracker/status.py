@@ -0,0 +1,100 @@
+"""Classification of the free-text Status column into pipeline states.
+
+The states are a rule table: each rule names a status and the substrings
+(matched case-insensitively) that put a raw value in it, and the first
+matching rule wins. A raw value no rule matches is kept as written, and an
+empty one means "In Progress".
+
+Teams add their own states in a JSON file named by ``TRACKER_STATUS_RULES``::
+
+    [{"status": "On Hold", "contains": ["hold", "paused"]}]
+
+Those rules are checked before the built-in ones. The table is compiled
+into one regular expression, and since a sheet has only a handful of
+distinct raw values, each is classified once and remembered for the life
+of the process, so reloads only classify values they haven't seen.
+"""
+import json
+import os
+import re
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+from tracker.memo import stable_key
+
+DEFAULT_RULES = (
+    ("Published", ("published",)),
+    ("Accepted", ("accepted",)),
+    ("Communicated to Riya", ("communicated",)),
+    ("Under Review", ("review",)),
+    ("Rejected", ("rejected",)),
+)
+NO_STATUS = "In Progress"
+MEMO_SIZE = 4096
+
+
+class StatusRules:
+    """A compiled, memoizing classifier for one rule table."""
+
+    def __init__(self, rules=DEFAULT_RULES):
+        self.rules = tuple((status, tuple(words)) for status, words in rules)
+        self.key = stable_key(self.rules)
+        # One lookahead branch per rule, tried in table order at the start of
+        # the value, so the first rule with a substring anywhere wins
+        branches = [
+            f"(?=.*?(?:{'|'.join(re.escape(w) for w in words)}))(?P<r{i}>)"
+            for i, (_, words) in enumerate(self.rules) if words
+        ]
+        self._pattern = re.compile("|".join(branches) or "(?!)", re.IGNORECASE | re.DOTALL)
+        self._memo = {}
+        self._lock = threading.Lock()
+
+    def classify(self, raw):
+        with self._lock:
+            status = self._memo.get(raw)
+        if status is None:
+            match = self._pattern.match(raw)
+            if match:
+                status = self.rules[int(match.lastgroup[1:])][0]
+            else:
+                status = raw or NO_STATUS
+            with self._lock:
+                if len(self._memo) >= MEMO_SIZE:
+                    self._memo.clear()
+                self._memo[raw] = status
+        return status
+
+    def classify_values(self, raw_values):
+        """Statuses for an array of raw strings, classifying each distinct value once."""
+        distinct, inverse = np.unique(np.asarray(raw_values, dtype=object), return_inverse=True)
+        statuses = np.array([self.classify(v) for v in distinct.tolist()], dtype=object)
+        return statuses[inverse.reshape(-1)]
+
+
+def load_rules(path):
+    """Rules from a JSON file, followed by the built-in ones."""
+    with open(path) as f:
+        entries = json.load(f)
+    custom = []
+    for entry in entries:
+        words = entry.get("contains", []) if isinstance(entry, dict) else None
+        if words is None or not isinstance(entry.get("status"), str) or isinstance(words, str):
+            raise ValueError(f"{path}: each rule needs a status and a list of substrings: {entry!r}")
+        custom.append((entry["status"], tuple(str(w) for w in words)))
+    return tuple(custom) + DEFAULT_RULES
+
+
+@lru_cache(maxsize=None)
+def _rules_for(path):
+    return StatusRules(load_rules(path) if path else DEFAULT_RULES)
+
+
+def status_rules():
+    """The classifier configured for this process."""
+    return _rules_for(os.environ.get("TRACKER_STATUS_RULES") or None)
+
+
+def classify_status(status_raw):
+    return status_rules().classify(status_raw)
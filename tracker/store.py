@@ -0,0 +1,255 @@
+"""Embedded SQLite storage for the parsed tracker.
+
+``SQLiteStore`` ingests one revision of the parsed frames into a database
+file named after its fingerprint, with indexes on the columns the sidebar
+filters and the author aggregations use. ``SQLiteBackend`` answers the
+same calls as ``tracker.backend.FrameBackend`` with parameterized queries,
+so a session only ever holds the aggregates and the page it displays.
+
+Each revision gets its own file. A session still rendering the previous
+revision keeps reading a complete database while the next one is written;
+files older than that are removed.
+"""
+import glob
+import os
+import sqlite3
+import threading
+from contextlib import closing
+
+import pandas as pd
+
+from tracker.analytics import CUBE_KEYS, CUBE_MEASURES, slice_cube
+from tracker.authors import AUTHOR_COLUMNS
+from tracker.backend import AUTHOR_ROW_COLUMNS, PAPER_ROW_COLUMNS, check_column
+from tracker.status import status_rules
+
+SCHEMA_VERSION = 3
+KEEP_REVISIONS = 2
+
+_INDEXES = [
+    "CREATE INDEX idx_papers_status ON papers (Status)",
+    "CREATE INDEX idx_papers_source ON papers (Source)",
+    "CREATE INDEX idx_papers_sno ON papers (SNo)",
+    "CREATE INDEX idx_authors_id ON authors (Author_Id)",
+    "CREATE INDEX idx_authors_paper ON authors (Paper)",
+]
+
+
+def compile_selection(sel, alias=""):
+    """``(where_sql, params)`` for a ``Selection``; None selects everything."""
+    if sel is None:
+        return "1", []
+    p = f"{alias}." if alias else ""
+    clauses, params = [], []
+    for column, values in (("Source", sel.sources), ("Status", sel.statuses)):
+        if not values:
+            return "0", []
+        clauses.append(f"{p}{column} IN ({', '.join('?' * len(values))})")
+        params.extend(values)
+    # Lowercased copies are stored at ingest, matching SearchIndex's
+    # case-insensitive substring search exactly (SQLite's lower() is ASCII only)
+    if sel.author:
+        clauses.append(f"instr({p}authors_lc, ?) > 0")
+        params.append(sel.author.lower())
+    if sel.title:
+        clauses.append(f"instr({p}title_lc, ?) > 0")
+        params.append(sel.title.lower())
+    return " AND ".join(clauses), params
+
+
+class SQLiteStore:
+    """A folder of per-revision SQLite databases."""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self._lock = threading.Lock()
+
+    def path_for(self, fingerprint):
+        return os.path.join(self.folder, f"tracker-{fingerprint[:16]}.sqlite")
+
+    def ingest(self, fingerprint, data):
+        df_papers, df_clients, df_info, paper_authors = data
+        os.makedirs(self.folder, exist_ok=True)
+        path = self.path_for(fingerprint)
+        tmp = path + ".tmp"
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        with closing(sqlite3.connect(tmp)) as con:
+            con.execute("PRAGMA journal_mode = OFF")
+            con.execute("PRAGMA synchronous = OFF")
+            papers = df_papers.reindex(columns=PAPER_ROW_COLUMNS)
+            papers.insert(0, "id", range(len(papers)))
+            papers["title_lc"] = [str(t).lower() for t in papers["Title"]]
+            papers["authors_lc"] = [str(t).lower() for t in papers["Author_Names"]]
+            papers.to_sql("papers", con, index=False)
+            authors = paper_authors.reindex(columns=AUTHOR_COLUMNS).astype({"Author_Id": object})
+            authors.to_sql("authors", con, index=False)
+            # Clients and info are small and shown whole; their headers come
+            # straight from the workbook, so they are kept as text
+            for name, df in (("clients", df_clients), ("info", df_info)):
+                if len(df.columns) == 0:
+                    # A missing sheet; an empty table keeps the schema uniform
+                    con.execute(f"CREATE TABLE {name} (_empty INTEGER)")
+                    continue
+                df = df.copy()
+                df.columns = [str(c) for c in df.columns]
+                df.to_sql(name, con, index=False)
+            for statement in _INDEXES:
+                con.execute(statement)
+            con.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            con.executemany("INSERT INTO meta VALUES (?, ?)",
+                            [("schema_version", str(SCHEMA_VERSION)), ("fingerprint", fingerprint),
+                             ("status_rules", status_rules().key)])
+            con.commit()
+        os.replace(tmp, path)
+        return path
+
+    def _is_current(self, path, fingerprint):
+        try:
+            with closing(sqlite3.connect(f"file:{path}?mode=ro", uri=True)) as con:
+                meta = dict(con.execute("SELECT key, value FROM meta"))
+        except sqlite3.Error:
+            return False
+        return (meta.get("schema_version") == str(SCHEMA_VERSION) and meta.get("fingerprint") == fingerprint
+                and meta.get("status_rules") == status_rules().key)
+
+    def _prune(self, keep):
+        files = sorted(glob.glob(os.path.join(self.folder, "tracker-*.sqlite")),
+                       key=os.path.getmtime, reverse=True)
+        for path in [f for f in files if f != keep][KEEP_REVISIONS - 1:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def open(self, fingerprint, load):
+        """A backend on the database of ``fingerprint``, ingesting ``load()`` if needed."""
+        with self._lock:
+            path = self.path_for(fingerprint)
+            if not (os.path.exists(path) and self._is_current(path, fingerprint)):
+                self.ingest(fingerprint, load())
+            else:
+                os.utime(path)
+            self._prune(path)
+        return SQLiteBackend(path)
+
+
+class SQLiteBackend:
+    """``FrameBackend``'s interface over one revision's database."""
+
+    def __init__(self, path):
+        self.path = path
+        self._uri = f"file:{path}?mode=ro"
+        self._cube = None
+        self.total = int(self._query("SELECT COUNT(*) AS n FROM papers")["n"].iloc[0])
+        self.df_clients = self._table("clients")
+        self.df_info = self._table("info")
+
+    def _query(self, sql, params=()):
+        # A connection per call: cheap for SQLite, and safe from any thread
+        with closing(sqlite3.connect(self._uri, uri=True)) as con:
+            return pd.read_sql_query(sql, con, params=list(params))
+
+    def _table(self, name):
+        df = self._query(f"SELECT * FROM {name}")
+        return pd.DataFrame() if "_empty" in df.columns else df
+
+    def _distinct(self, column):
+        return self._query(f"SELECT DISTINCT {column} AS v FROM papers ORDER BY v")["v"].tolist()
+
+    def sources(self):
+        return self._distinct("Source")
+
+    def statuses(self):
+        return self._distinct("Status")
+
+    def full_cube(self):
+        if self._cube is None:
+            self._cube = self._cube_query(None)
+        return self._cube
+
+    def _cube_query(self, sel):
+        where, params = compile_selection(sel)
+        sums = ", ".join(f"TOTAL({m}) AS {m}" for m in CUBE_MEASURES)
+        cube = self._query(
+            f"SELECT Source, Status, COUNT(*) AS Count, {sums} FROM papers WHERE {where} "
+            f"GROUP BY Source, Status ORDER BY MIN(id)", params)
+        return cube[CUBE_KEYS + ["Count"] + CUBE_MEASURES]
+
+    def count(self, sel=None):
+        where, params = compile_selection(sel)
+        return int(self._query(f"SELECT COUNT(*) AS n FROM papers WHERE {where}", params)["n"].iloc[0])
+
+    def cube(self, sel=None):
+        if sel is None:
+            return self.full_cube()
+        if not sel.text_search:
+            return slice_cube(self.full_cube(), sel.sources, sel.statuses)
+        return self._cube_query(sel)
+
+    def unique_authors(self, sel=None):
+        where, params = compile_selection(sel, "p")
+        return int(self._query(
+            "SELECT COUNT(DISTINCT a.Author_Id) AS n FROM authors a JOIN papers p ON p.id = a.Paper "
+            f"WHERE {where}", params)["n"].iloc[0])
+
+    def author_stats(self, sel=None):
+        where, params = compile_selection(sel, "p")
+        # With a single MIN() in the query SQLite takes the bare a.Name from
+        # the row holding the minimum: the author's first occurrence
+        df = self._query(
+            "SELECT a.Author_Id AS author_id, a.Name AS name, COUNT(*) AS papers, "
+            "TOTAL(a.Amount) AS amount, MIN(a.rowid) AS first "
+            f"FROM authors a JOIN papers p ON p.id = a.Paper WHERE {where} "
+            "GROUP BY a.Author_Id ORDER BY first", params)
+        return df[["author_id", "name", "papers", "amount"]]
+
+    def team_sizes(self, sel=None):
+        where, params = compile_selection(sel)
+        return self._query(
+            f"SELECT Num_Authors AS Num, COUNT(*) AS Papers FROM papers WHERE {where} "
+            "GROUP BY Num_Authors ORDER BY Num_Authors", params)
+
+    def page(self, sel, offset, limit, order_by="SNo", descending=False, columns=None):
+        check_column(order_by)
+        columns = list(columns or PAPER_ROW_COLUMNS)
+        for column in columns:
+            check_column(column)
+        where, params = compile_selection(sel)
+        return self._query(
+            f"SELECT {', '.join(columns)} FROM papers WHERE {where} "
+            f"ORDER BY {order_by} {'DESC' if descending else 'ASC'}, id LIMIT ? OFFSET ?",
+            [*params, limit, offset])
+
+    def rows(self, sel, columns, min_amount=None):
+        for column in columns:
+            check_column(column)
+        where, params = compile_selection(sel)
+        if min_amount is not None:
+            where += " AND Total_Amount > ?"
+            params.append(min_amount)
+        return self._query(f"SELECT {', '.join(columns)} FROM papers WHERE {where} ORDER BY id", params)
+
+    def _iter_query(self, sql, params, chunk_size):
+        with closing(sqlite3.connect(self._uri, uri=True)) as con:
+            yield from pd.read_sql_query(sql, con, params=list(params), chunksize=chunk_size)
+
+    def iter_rows(self, sel, columns, chunk_size):
+        for column in columns:
+            check_column(column)
+        where, params = compile_selection(sel)
+        return self._iter_query(f"SELECT {', '.join(columns)} FROM papers WHERE {where} ORDER BY id",
+                                params, chunk_size)
+
+    def iter_authors(self, sel, chunk_size):
+        where, params = compile_selection(sel, "p")
+        sql = ("SELECT p.SNo, p.Source, p.Title, p.Status, a.Name AS Author, a.Author_Id, a.Email, "
+               f"a.Amount FROM authors a JOIN papers p ON p.id = a.Paper WHERE {where} ORDER BY a.rowid")
+        for chunk in self._iter_query(sql, params, chunk_size):
+            yield chunk[AUTHOR_ROW_COLUMNS]
+
+    def clients(self):
+        return self.df_clients
+
+    def info(self):
+        return self.df_info
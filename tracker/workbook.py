@@ -0,0 +1,132 @@
+"""Single-pass streaming reader for the publication tracker workbook.
+
+The workbook is opened once in openpyxl read-only mode and every relevant
+sheet is streamed from that one handle. Cell values are converted the same
+way ``pd.read_excel`` converts them, so the frames built here are identical
+to the ones the per-sheet ``read_excel`` calls used to produce.
+"""
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+WORKBOOK_NAME = "Paper-Publishing-Work-In-Progress.xlsx"
+CLIENTS_SHEET = "clients details"
+
+# Paper sheets only use columns A..AA (S.No .. Paper Status)
+PAPER_SHEET_WIDTH = 27
+
+# openpyxl.cell.cell.ERROR_CODES, kept here so that importing the package
+# (e.g. to read a Parquet snapshot) does not pull in openpyxl
+ERROR_CODES = frozenset(("#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A"))
+
+
+def sheet_kind(sheet_name):
+    if "work" in sheet_name.lower().strip():
+        return "papers"
+    if sheet_name == CLIENTS_SHEET:
+        return "clients"
+    if "info" in sheet_name.lower():
+        return "info"
+    return None
+
+
+def _convert_cell(value):
+    # Mirrors pandas' openpyxl reader: blanks become "", integral floats
+    # become ints and error cells become NaN.
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and value in ERROR_CODES:
+        return float("nan")
+    return value
+
+
+def iter_sheet_rows(ws, max_col=None):
+    """Yield converted rows, stopping at the last populated row."""
+    pending_blank = 0
+    for values in ws.iter_rows(max_col=max_col, values_only=True):
+        row = [_convert_cell(v) for v in values]
+        while row and row[-1] == "":
+            row.pop()
+        if not row:
+            # Only emitted once a populated row follows, so the trailing
+            # block of empty rows in the used range is never materialised.
+            pending_blank += 1
+            continue
+        for _ in range(pending_blank):
+            yield []
+        pending_blank = 0
+        yield row
+
+
+def _sheet_signature(wb, ws):
+    # CRCs of the sheet's XML part and the shared string table, read from
+    # the zip directory without decompressing anything. Equal signatures
+    # mean the sheet's cell values are unchanged.
+    archive = wb._archive
+    try:
+        sheet_crc = archive.getinfo(ws._worksheet_path.lstrip("/")).CRC
+    except (AttributeError, KeyError):
+        return None
+    strings_crc = next((i.CRC for i in archive.infolist() if i.filename.endswith("sharedStrings.xml")), 0)
+    return sheet_crc, strings_crc
+
+
+def iter_workbook(filepath):
+    """Yield ``(kind, sheet_name, signature, rows)`` for every relevant sheet.
+
+    The workbook is opened once; each ``rows`` iterator must be consumed
+    before advancing to the next sheet, or left untouched to skip it.
+    """
+    import openpyxl
+
+    wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True, keep_links=False)
+    try:
+        seen_info = False
+        for ws in wb.worksheets:
+            kind = sheet_kind(ws.title)
+            if kind is None or (kind == "info" and seen_info):
+                continue
+            seen_info = seen_info or kind == "info"
+            ws.reset_dimensions()
+            max_col = PAPER_SHEET_WIDTH if kind == "papers" else None
+            yield kind, ws.title, _sheet_signature(wb, ws), iter_sheet_rows(ws, max_col=max_col)
+    finally:
+        wb.close()
+
+
+def rows_to_frame(rows, header=None, width=0):
+    rows = list(rows)
+    if not rows:
+        return pd.DataFrame()
+    width = max(width, max(len(r) for r in rows))
+    rows = [r + [""] * (width - len(r)) for r in rows]
+    return TextParser(rows, header=header, skip_blank_lines=False).read()
+
+
+def sheet_frame(kind, rows):
+    if kind == "papers":
+        return rows_to_frame(rows, width=PAPER_SHEET_WIDTH)
+    if kind == "clients":
+        return rows_to_frame(rows, header=0)
+    return rows_to_frame(rows)
+
+
+def read_workbook(filepath):
+    """Read all relevant sheets in one pass.
+
+    Returns ``(paper_sheets, clients, info)`` where ``paper_sheets`` is a
+    list of ``(sheet_name, raw_frame)`` pairs.
+    """
+    paper_sheets = []
+    df_clients = pd.DataFrame()
+    df_info = pd.DataFrame()
+    for kind, sheet_name, _, rows in iter_workbook(filepath):
+        frame = sheet_frame(kind, rows)
+        if kind == "papers":
+            paper_sheets.append((sheet_name, frame))
+        elif kind == "clients":
+            df_clients = frame
+        else:
+            df_info = frame
+    return paper_sheets, df_clients, df_info